@@ -1,16 +1,27 @@
-"""Generate placeholder sprites and sounds for Purr-fect Leap."""
+"""Generate placeholder sprites and sounds for Purr-fect Leap and bake them.
+
+Files whose content has not changed are left untouched, and the bundle is
+only rebuilt when a source hash differs (see ``purrfect_leap.bundle``).
+Pass ``--force`` to rebuild the bundle anyway.
+"""
 
 from __future__ import annotations
 
-import math
+import hashlib
+import io
 import os
+import sys
 import wave
-import struct
 
+import numpy as np
 import pygame
 
-SPRITE_PATH = "purrfect_leap/assets/sprites"
-SOUND_PATH = "purrfect_leap/assets/sounds"
+from purrfect_leap.bundle import bake
+
+ASSET_PATH = "purrfect_leap/assets"
+SPRITE_PATH = f"{ASSET_PATH}/sprites"
+SOUND_PATH = f"{ASSET_PATH}/sounds"
+written = 0
 
 
 def ensure_dirs() -> None:
@@ -18,6 +29,24 @@ def ensure_dirs() -> None:
     os.makedirs(SOUND_PATH, exist_ok=True)
 
 
+def write_if_changed(filename: str, data: bytes) -> None:
+    """Write ``data`` unless ``filename`` already holds exactly those bytes."""
+    global written
+    if os.path.exists(filename):
+        with open(filename, "rb") as f:
+            if hashlib.sha256(f.read()).digest() == hashlib.sha256(data).digest():
+                return
+    with open(filename, "wb") as f:
+        f.write(data)
+    written += 1
+
+
+def save_png(surf: pygame.Surface, filename: str) -> None:
+    buffer = io.BytesIO()
+    pygame.image.save(surf, buffer, filename)
+    write_if_changed(filename, buffer.getvalue())
+
+
 def make_sprites() -> None:
     pygame.init()
     size = (40, 40)
@@ -25,51 +54,50 @@ def make_sprites() -> None:
         surf = pygame.Surface(size, pygame.SRCALPHA)
         pygame.draw.rect(surf, (255, 200, 200), (5, 5, 30, 30))
         pygame.draw.circle(surf, (0, 0, 0), (20, 35), 5)
-        pygame.image.save(surf, f"{SPRITE_PATH}/cat_walk_{i}.png")
+        save_png(surf, f"{SPRITE_PATH}/cat_walk_{i}.png")
     for i in range(2):
         surf = pygame.Surface(size, pygame.SRCALPHA)
         pygame.draw.rect(surf, (255, 150, 150), (5, 5, 30, 30))
         pygame.draw.rect(surf, (255, 100, 0), (15, 35, 10, 10))
-        pygame.image.save(surf, f"{SPRITE_PATH}/cat_rocket_{i}.png")
+        save_png(surf, f"{SPRITE_PATH}/cat_rocket_{i}.png")
     plat = pygame.Surface((72, 18), pygame.SRCALPHA)
     plat.fill((255, 175, 200))
     pygame.draw.rect(plat, (255, 150, 180), plat.get_rect(), 3)
-    pygame.image.save(plat, f"{SPRITE_PATH}/platform_normal.png")
+    save_png(plat, f"{SPRITE_PATH}/platform_normal.png")
     breakp = pygame.Surface((72, 18), pygame.SRCALPHA)
     breakp.fill((255, 175, 200))
     pygame.draw.line(breakp, (0, 0, 0), (0, 9), (72, 9), 2)
-    pygame.image.save(breakp, f"{SPRITE_PATH}/platform_break.png")
+    save_png(breakp, f"{SPRITE_PATH}/platform_break.png")
     spring = pygame.Surface((72, 18), pygame.SRCALPHA)
     pygame.draw.rect(spring, (0, 255, 0), (0, 10, 72, 8))
-    pygame.image.save(spring, f"{SPRITE_PATH}/spring.png")
+    save_png(spring, f"{SPRITE_PATH}/spring.png")
     rocket = pygame.Surface((20, 40), pygame.SRCALPHA)
     pygame.draw.polygon(rocket, (200, 0, 0), [(10, 0), (20, 30), (0, 30)])
-    pygame.image.save(rocket, f"{SPRITE_PATH}/rocket.png")
+    save_png(rocket, f"{SPRITE_PATH}/rocket.png")
     bubble = pygame.Surface((30, 30), pygame.SRCALPHA)
     pygame.draw.circle(bubble, (150, 150, 255, 128), (15, 15), 15)
-    pygame.image.save(bubble, f"{SPRITE_PATH}/bubble.png")
+    save_png(bubble, f"{SPRITE_PATH}/bubble.png")
     coin = pygame.Surface((20, 20), pygame.SRCALPHA)
     pygame.draw.circle(coin, (255, 255, 0), (10, 10), 10)
-    pygame.image.save(coin, f"{SPRITE_PATH}/coin.png")
+    save_png(coin, f"{SPRITE_PATH}/coin.png")
     enemy = pygame.Surface((40, 30), pygame.SRCALPHA)
     pygame.draw.circle(enemy, (100, 50, 0), (20, 15), 15)
-    pygame.image.save(enemy, f"{SPRITE_PATH}/enemy_hairball.png")
+    save_png(enemy, f"{SPRITE_PATH}/enemy_hairball.png")
     pygame.quit()
 
 
 def write_wav(filename: str, freq: float) -> None:
     sample_rate = 44100
     duration = 0.2
-    n_samples = int(sample_rate * duration)
-    data = bytearray()
-    for n in range(n_samples):
-        value = int(32767.0 * math.sin(2 * math.pi * freq * n / sample_rate))
-        data.extend(struct.pack('<h', value))
-    with wave.open(filename, 'wb') as f:
+    n = np.arange(int(sample_rate * duration))
+    samples = (32767.0 * np.sin(2 * np.pi * freq * n / sample_rate)).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as f:
         f.setnchannels(1)
         f.setsampwidth(2)
         f.setframerate(sample_rate)
-        f.writeframes(data)
+        f.writeframes(samples.tobytes())
+    write_if_changed(filename, buffer.getvalue())
 
 
 def make_sounds() -> None:
@@ -82,4 +110,5 @@ if __name__ == "__main__":
     ensure_dirs()
     make_sprites()
     make_sounds()
-    print("Assets generated.")
+    rebuilt = bake(ASSET_PATH, force="--force" in sys.argv[1:])
+    print(f"Assets generated: {written} files changed, bundle {'rebuilt' if rebuilt else 'up to date'}.")
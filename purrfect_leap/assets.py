@@ -0,0 +1,140 @@
+"""Process-wide cache of sprites, sounds and derived surfaces."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pygame
+
+from .bundle import BUNDLE_FILE, AssetBundle
+
+ASSET_DIR = Path(__file__).resolve().parent / "assets"
+SPRITES = (
+    "cat_walk_0",
+    "cat_walk_1",
+    "cat_walk_2",
+    "cat_walk_3",
+    "cat_rocket_0",
+    "cat_rocket_1",
+    "platform_normal",
+    "platform_break",
+    "spring",
+    "rocket",
+    "bubble",
+    "coin",
+    "enemy_hairball",
+)
+SOUNDS = ("jump", "powerup", "gameover")
+
+
+class AssetRegistry:
+    """Loads every asset from disk at most once per process.
+
+    Assets come from the baked ``bundle.plb`` when there is one (see
+    :mod:`purrfect_leap.bundle`) and from the loose files otherwise.
+    Sprites are converted for the current display when first requested, so
+    the display mode must be set before images are used. Derived surfaces
+    such as scaled variants are cached alongside the originals.
+    """
+
+    def __init__(self, root: Path = ASSET_DIR) -> None:
+        self.root = root
+        self.timings: dict[str, float] = {}
+        self._images: dict[str, pygame.Surface] = {}
+        self._scaled: dict[tuple[str, tuple[int, int]], pygame.Surface] = {}
+        self._sounds: dict[str, pygame.mixer.Sound] = {}
+        self._bundle: AssetBundle | None = None
+        self._bundle_checked = False
+        # Sounds may be loaded from a background thread; see audio.py.
+        self._bundle_lock = threading.Lock()
+
+    def bundle(self) -> AssetBundle | None:
+        """The memory-mapped bundle, opened on first use, or ``None`` if there is none."""
+        with self._bundle_lock:
+            if not self._bundle_checked:
+                self._bundle_checked = True
+                path = self.root / BUNDLE_FILE
+                if path.exists():
+                    start = time.perf_counter()
+                    self._bundle = AssetBundle(path)
+                    self.timings[BUNDLE_FILE] = time.perf_counter() - start
+            return self._bundle
+
+    def image(self, name: str) -> pygame.Surface:
+        surface = self._images.get(name)
+        if surface is None:
+            start = time.perf_counter()
+            bundle = self.bundle()
+            if bundle is not None and name in bundle.sprites:
+                surface = bundle.image(name)
+                self.timings[f"{BUNDLE_FILE}:sprites/{name}"] = time.perf_counter() - start
+            else:
+                surface = pygame.image.load(self.root / "sprites" / f"{name}.png").convert_alpha()
+                self.timings[f"sprites/{name}.png"] = time.perf_counter() - start
+            self._images[name] = surface
+        return surface
+
+    def scaled(self, name: str, size: tuple[int, int]) -> pygame.Surface:
+        key = (name, size)
+        surface = self._scaled.get(key)
+        if surface is None:
+            start = time.perf_counter()
+            surface = pygame.transform.scale(self.image(name), size)
+            self.timings[f"sprites/{name}.png@{size[0]}x{size[1]}"] = time.perf_counter() - start
+            self._scaled[key] = surface
+        return surface
+
+    def sound(self, name: str) -> pygame.mixer.Sound:
+        sound = self._sounds.get(name)
+        if sound is None:
+            start = time.perf_counter()
+            bundle = self.bundle()
+            if bundle is not None and name in bundle.sounds:
+                sound = bundle.sound(name)
+                self.timings[f"{BUNDLE_FILE}:sounds/{name}"] = time.perf_counter() - start
+            else:
+                sound = pygame.mixer.Sound(self.root / "sounds" / f"{name}.wav")
+                self.timings[f"sounds/{name}.wav"] = time.perf_counter() - start
+            self._sounds[name] = sound
+        return sound
+
+    def preload(self) -> float:
+        """Load every known sprite and sound; return the seconds spent."""
+        start = time.perf_counter()
+        for name in SPRITES:
+            self.image(name)
+        if pygame.mixer.get_init():
+            for name in SOUNDS:
+                self.sound(name)
+        return time.perf_counter() - start
+
+    def clear(self) -> None:
+        """Drop every cached asset, e.g. after ``pygame.quit``."""
+        self._images.clear()
+        self._scaled.clear()
+        self._sounds.clear()
+        self.timings.clear()
+        with self._bundle_lock:
+            if self._bundle is not None:
+                self._bundle.close()
+            self._bundle = None
+            self._bundle_checked = False
+
+    def report(self) -> str:
+        slowest = sorted(self.timings.items(), key=lambda kv: -kv[1])
+        lines = [f"{secs * 1000:8.2f} ms  {name}" for name, secs in slowest]
+        lines.append(f"{sum(self.timings.values()) * 1000:8.2f} ms  total ({len(self.timings)} assets)")
+        return "\n".join(lines)
+
+
+_REGISTRY: AssetRegistry | None = None
+
+
+def get_registry() -> AssetRegistry:
+    """Return the shared registry, creating it on first use."""
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = AssetRegistry()
+    return _REGISTRY
@@ -0,0 +1,136 @@
+"""Sound playback with a tuned mixer and per-category voice limits.
+
+Each sound belongs to a category, and each category owns a fixed set of
+reserved mixer channels, so a burst of jump sounds can never cut off the
+game-over jingle. When a category's channels are all busy, ``overflow``
+decides whether the new sound steals the oldest voice or is dropped.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+
+import pygame
+
+from .assets import get_registry
+
+SOUND_CATEGORIES = {"jump": "jump", "powerup": "pickup", "gameover": "ui"}
+
+
+@dataclass(frozen=True)
+class MixerSettings:
+    """Mixer format; a small ``buffer`` keeps latency low at some CPU cost."""
+
+    frequency: int = 44100
+    size: int = -16
+    channels: int = 2
+    buffer: int = 256
+    # Reserved voices per category.
+    voices: dict[str, int] = field(default_factory=lambda: {"jump": 2, "pickup": 2, "ui": 1})
+    overflow: str = "steal"
+
+
+class NullAudio:
+    """Audio that is switched off: for headless runs or when there is no device."""
+
+    buffer_ms = 0.0
+    played = dropped = stolen = 0
+
+    def play(self, name: str) -> None:
+        pass
+
+    def wait_loaded(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+class AudioManager:
+    """Plays sounds on reserved, per-category mixer channels.
+
+    Requires an initialized mixer; see :func:`open_audio`. Sounds are
+    decoded on a background thread so they never delay the first frame; a
+    sound requested before its turn is loaded on the spot.
+    """
+
+    def __init__(self, settings: MixerSettings = MixerSettings()) -> None:
+        if settings.overflow not in ("steal", "drop"):
+            raise ValueError(f"unknown overflow policy {settings.overflow!r}")
+        self.settings = settings
+        total = sum(settings.voices.values())
+        pygame.mixer.set_num_channels(max(total, pygame.mixer.get_num_channels()))
+        # Reserved channels are never handed out to an unqualified Sound.play().
+        pygame.mixer.set_reserved(total)
+        self._channels: dict[str, list[pygame.mixer.Channel]] = {}
+        self._started: dict[str, list[float]] = {}
+        first = 0
+        for category, count in settings.voices.items():
+            self._channels[category] = [pygame.mixer.Channel(i) for i in range(first, first + count)]
+            self._started[category] = [0.0] * count
+            first += count
+        self.sounds: dict[str, pygame.mixer.Sound] = {}
+        self._loader = threading.Thread(target=self._load_sounds, name="audio-load", daemon=True)
+        self._loader.start()
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+
+    def _load_sounds(self) -> None:
+        registry = get_registry()
+        for name in SOUND_CATEGORIES:
+            self.sounds[name] = registry.sound(name)
+
+    def wait_loaded(self) -> None:
+        """Block until every sound has been decoded."""
+        self._loader.join()
+
+    @property
+    def buffer_ms(self) -> float:
+        """Duration of one mixer buffer at the negotiated sample rate.
+
+        This is the nominal latency the buffer adds, not a measurement; the
+        driver and device add their own on top.
+        """
+        frequency = pygame.mixer.get_init()[0]
+        return 1000 * self.settings.buffer / frequency
+
+    def play(self, name: str) -> None:
+        category = SOUND_CATEGORIES[name]
+        channels = self._channels[category]
+        started = self._started[category]
+        for i, channel in enumerate(channels):
+            if not channel.get_busy():
+                break
+        else:
+            if self.settings.overflow == "drop":
+                self.dropped += 1
+                return
+            i = started.index(min(started))
+            self.stolen += 1
+        sound = self.sounds.get(name) or get_registry().sound(name)
+        channels[i].play(sound)
+        started[i] = time.perf_counter()
+        self.played += 1
+
+    def stop(self) -> None:
+        for channels in self._channels.values():
+            for channel in channels:
+                channel.stop()
+
+
+def open_audio(settings: MixerSettings = MixerSettings()) -> AudioManager | NullAudio:
+    """Initialize the mixer with ``settings`` and return a manager for it.
+
+    Call this before ``pygame.init()`` so the mixer is opened with these
+    settings rather than pygame's defaults. Without a usable audio device a
+    :class:`NullAudio` is returned instead.
+    """
+    if not pygame.mixer.get_init():
+        try:
+            pygame.mixer.init(settings.frequency, settings.size, settings.channels, settings.buffer)
+        except pygame.error:
+            return NullAudio()
+    return AudioManager(settings)
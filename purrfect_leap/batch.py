@@ -0,0 +1,360 @@
+"""Struct-of-arrays engine that steps many games at once with NumPy.
+
+Every array has the environment index as its first axis, platform and
+power-up arrays have a fixed slot capacity as the second. The update rules
+mirror :class:`~purrfect_leap.player.Cat`, :class:`~purrfect_leap.platform.Platform`,
+:class:`~purrfect_leap.powerups.PowerUpManager` and ``Game.update_world`` tick
+for tick under the same :class:`~purrfect_leap.tuning.Tuning`; only the
+random streams differ, since they are drawn from one NumPy generator
+instead of the ``random`` module.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .level import LOOKAHEAD, POWERUP_CHANCE
+from .platform import AMPLITUDE, PLATFORM_HEIGHT, PLATFORM_KINDS, PLATFORM_WIDTH
+from .player import BOOST_VELOCITY, CAT_SIZE, COLLISION_SIZE, MOVE_SPEED, ROCKET_TICKS
+from .powerups import MAX_POWERUPS, POWERUP_KINDS, POWERUP_SIZES
+from .tuning import DEFAULT_TUNING, Tuning
+
+WORLD_WIDTH = 480
+MIN_PLATFORMS = 10
+
+MOVING = PLATFORM_KINDS.index("moving")
+BREAKABLE = PLATFORM_KINDS.index("breakable")
+BOOST = PLATFORM_KINDS.index("boost")
+ROCKET = POWERUP_KINDS.index("rocket")
+COIN = POWERUP_KINDS.index("coin")
+_POWERUP_W = np.array([POWERUP_SIZES[k][0] for k in POWERUP_KINDS], dtype=np.int64)
+_POWERUP_H = np.array([POWERUP_SIZES[k][1] for k in POWERUP_KINDS], dtype=np.int64)
+_UNSET = np.iinfo(np.int64).max
+
+
+class BatchEngine:
+    """Steps ``n_envs`` independent games per call to :meth:`step`.
+
+    Environments start already launched, as if ``Game.start`` had been
+    called. Finished environments stay frozen until passed to :meth:`reset`.
+    """
+
+    def __init__(
+        self,
+        n_envs: int,
+        height: int = 800,
+        platform_capacity: int = 32,
+        powerup_capacity: int = MAX_POWERUPS,
+        seed: int | None = None,
+        tuning: Tuning = DEFAULT_TUNING,
+    ) -> None:
+        # The opening chunk spans two screens at gaps of at least 60; climbing
+        # keeps a screen plus the lookahead filled at the tuned gap.
+        needed = max(
+            2 + (2 * height - PLATFORM_HEIGHT) // 60,
+            2 + (height + LOOKAHEAD) // tuning.vertical_gap,
+            MIN_PLATFORMS,
+        )
+        if platform_capacity < needed:
+            raise ValueError(f"platform_capacity must be at least {needed}")
+        self.n_envs = n_envs
+        self.height = height
+        self.tuning = tuning
+        self.rng = np.random.default_rng(seed)
+        self._kind_p = np.asarray(tuning.kind_weights, dtype=np.float64) / sum(tuning.kind_weights)
+
+        n, cap, pcap = n_envs, platform_capacity, powerup_capacity
+        self.cat_x = np.zeros(n, dtype=np.int64)
+        self.cat_y = np.zeros(n, dtype=np.int64)
+        self.vel_y = np.zeros(n, dtype=np.float64)
+        # Positions before the latest step, the start of the swept collision paths.
+        self.prev_x = np.zeros(n, dtype=np.int64)
+        self.prev_y = np.zeros(n, dtype=np.int64)
+        self.rocket_time = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.scroll_y = np.zeros(n, dtype=np.int64)
+        self.done = np.zeros(n, dtype=bool)
+        self.ticks = np.zeros(n, dtype=np.int64)
+
+        self.plat_x = np.zeros((n, cap), dtype=np.int64)
+        self.plat_y = np.zeros((n, cap), dtype=np.int64)
+        self.plat_w = np.full((n, cap), PLATFORM_WIDTH, dtype=np.int64)
+        self.plat_start_x = np.zeros((n, cap), dtype=np.int64)
+        self.plat_prev_x = np.zeros((n, cap), dtype=np.int64)
+        self.plat_prev_y = np.zeros((n, cap), dtype=np.int64)
+        self.plat_kind = np.zeros((n, cap), dtype=np.int8)
+        self.plat_phase = np.zeros((n, cap), dtype=np.float64)
+        self.plat_broken = np.zeros((n, cap), dtype=bool)
+        self.plat_active = np.zeros((n, cap), dtype=bool)
+        # Spawn order, used to break ties between platforms at the same height.
+        self.plat_seq = np.zeros((n, cap), dtype=np.int64)
+        self._next_seq = np.zeros(n, dtype=np.int64)
+        # Screen y of the latest streamed platform; the next goes one gap above it.
+        self.frontier = np.zeros(n, dtype=np.int64)
+
+        self.pu_x = np.zeros((n, pcap), dtype=np.int64)
+        self.pu_y = np.zeros((n, pcap), dtype=np.int64)
+        self.pu_kind = np.zeros((n, pcap), dtype=np.int8)
+        self.pu_active = np.zeros((n, pcap), dtype=bool)
+        self.pu_seq = np.zeros((n, pcap), dtype=np.int64)
+        self._next_pu_seq = np.zeros(n, dtype=np.int64)
+
+        self.reset()
+
+    # Setup
+    def reset(self, envs: np.ndarray | None = None) -> None:
+        """Lay out fresh levels for ``envs`` (all environments by default)."""
+        idx = np.arange(self.n_envs) if envs is None else np.asarray(envs, dtype=np.int64)
+        if idx.dtype == bool:
+            idx = np.flatnonzero(idx)
+        m = idx.size
+        if m == 0:
+            return
+        cap = self.plat_x.shape[1]
+        base_top = self.height - PLATFORM_HEIGHT
+
+        # level.opening_chunk: a full-width base, then random gaps up to -height.
+        gaps = self.rng.integers(60, 121, size=(m, cap - 1))
+        ys = base_top - np.cumsum(gaps, axis=1)
+        used = ys > -self.height
+        x = self.rng.integers(0, WORLD_WIDTH - PLATFORM_WIDTH + 1, size=(m, cap - 1))
+        kind = self.rng.choice(len(PLATFORM_KINDS), size=(m, cap - 1), p=self._kind_p)
+
+        self.plat_x[idx, 0] = 0
+        self.plat_y[idx, 0] = base_top
+        self.plat_w[idx, 0] = WORLD_WIDTH
+        self.plat_kind[idx, 0] = 0
+        self.plat_x[idx, 1:] = x
+        self.plat_y[idx, 1:] = ys
+        self.plat_w[idx, 1:] = PLATFORM_WIDTH
+        self.plat_kind[idx, 1:] = kind
+        self.plat_start_x[idx] = self.plat_x[idx]
+        self.plat_phase[idx] = 0.0
+        self.plat_broken[idx] = False
+        self.plat_active[idx, 0] = True
+        self.plat_active[idx, 1:] = used
+        self.frontier[idx] = np.where(used, ys, _UNSET).min(axis=1)
+        self.plat_seq[idx] = np.arange(cap)
+        self._next_seq[idx] = cap
+        self.pu_active[idx] = False
+
+        # Cat sits on the base platform's midbottom, then Game.start jumps.
+        self.cat_x[idx] = WORLD_WIDTH // 2 - COLLISION_SIZE // 2
+        self.cat_y[idx] = base_top - COLLISION_SIZE
+        self.vel_y[idx] = self.tuning.jump_velocity
+        self.rocket_time[idx] = 0
+        self.score[idx] = 0
+        self.scroll_y[idx] = 0
+        self.ticks[idx] = 0
+        self.done[idx] = False
+
+    def load_game(self, env: int, game: "Game") -> None:
+        """Copy the state of a scalar ``Game`` into environment ``env``.
+
+        The batch engine works in screen space, so world positions are
+        shifted by the game's camera.
+        """
+        top = game.camera.top
+        cap = self.plat_x.shape[1]
+        if len(game.platforms) > cap or len(game.powerups.powerups) > self.pu_x.shape[1]:
+            raise ValueError("game has more entities than the batch capacity")
+        self.plat_active[env] = False
+        for slot, p in enumerate(game.platforms):
+            self.plat_x[env, slot] = p.rect.x
+            self.plat_y[env, slot] = p.rect.y - top
+            self.plat_w[env, slot] = p.rect.width
+            self.plat_start_x[env, slot] = p.start_x
+            self.plat_kind[env, slot] = PLATFORM_KINDS.index(p.kind)
+            self.plat_phase[env, slot] = p.phase
+            self.plat_broken[env, slot] = p.broken
+            self.plat_active[env, slot] = True
+            self.plat_seq[env, slot] = slot
+        self._next_seq[env] = len(game.platforms)
+        self.frontier[env] = game.platforms.first().rect.top - top
+        self.pu_active[env] = False
+        for slot, p in enumerate(game.powerups.powerups):
+            self.pu_x[env, slot] = p.rect.x
+            self.pu_y[env, slot] = p.rect.y - top
+            self.pu_kind[env, slot] = POWERUP_KINDS.index(p.kind)
+            self.pu_active[env, slot] = True
+            self.pu_seq[env, slot] = slot
+        self._next_pu_seq[env] = len(game.powerups.powerups)
+        self.cat_x[env] = game.player.rect.x
+        self.cat_y[env] = game.player.rect.y - top
+        self.vel_y[env] = game.player.vel_y
+        self.rocket_time[env] = game.player.rocket_time
+        self.score[env] = game.score
+        self.scroll_y[env] = game.scroll_y
+        self.ticks[env] = 0
+        self.done[env] = game.game_over
+
+    # Simulation
+    def step(self, left: np.ndarray | None = None, right: np.ndarray | None = None) -> np.ndarray:
+        """Advance every live environment one tick and return the ``done`` mask."""
+        alive = ~self.done
+        self._update_cats(alive, left, right)
+        self._update_platforms(alive)
+        self._handle_platform_collisions(alive)
+        self._update_powerups(alive)
+        self._scroll(alive)
+        self.ticks += alive
+        return self.done.copy()
+
+    def _update_cats(self, alive: np.ndarray, left: np.ndarray | None, right: np.ndarray | None) -> None:
+        self.prev_x = self.cat_x.copy()
+        self.prev_y = self.cat_y.copy()
+        dx = np.zeros(self.n_envs, dtype=np.int64)
+        if left is not None:
+            dx -= MOVE_SPEED * np.asarray(left, dtype=bool)
+        if right is not None:
+            dx += MOVE_SPEED * np.asarray(right, dtype=bool)
+        self.cat_x += dx * alive
+
+        rocket = alive & (self.rocket_time > 0)
+        self.rocket_time -= rocket
+        gravity = np.where(rocket, self.tuning.gravity * 0.1, self.tuning.gravity)
+        self.vel_y = np.where(alive, self.vel_y + gravity, self.vel_y)
+        self.cat_y += np.trunc(self.vel_y).astype(np.int64) * alive
+
+        right_edge = self.cat_x + COLLISION_SIZE
+        self.cat_x = np.where(
+            self.cat_x < -CAT_SIZE,
+            WORLD_WIDTH + CAT_SIZE - COLLISION_SIZE,
+            np.where(right_edge > WORLD_WIDTH + CAT_SIZE, -CAT_SIZE, self.cat_x),
+        )
+
+    def _update_platforms(self, alive: np.ndarray) -> None:
+        # Game.update_world only updates platforms that overlap the camera.
+        live = self.plat_active & alive[:, None] & (self.plat_y + PLATFORM_HEIGHT > 0)
+        self.plat_prev_x = self.plat_x.copy()
+        self.plat_prev_y = self.plat_y.copy()
+        moving = live & (self.plat_kind == MOVING)
+        self.plat_phase += 0.05 * moving
+        swing = np.trunc(AMPLITUDE * np.sin(self.plat_phase)).astype(np.int64)
+        self.plat_x = np.where(moving, self.plat_start_x + swing, self.plat_x)
+        falling = live & (self.plat_kind == BREAKABLE) & self.plat_broken
+        self.plat_y += 5 * falling
+
+    def _swept_from_x(self) -> np.ndarray:
+        # Cat.swept_from: a wrap across the screen edge is not motion.
+        return np.where(np.abs(self.prev_x - self.cat_x) < CAT_SIZE, self.prev_x, self.cat_x)
+
+    def _handle_platform_collisions(self, alive: np.ndarray) -> None:
+        # collision.landing_time for every cat and platform at once.
+        half = COLLISION_SIZE // 2
+        prev_bottom = (self.prev_y + COLLISION_SIZE)[:, None]
+        bottom = (self.cat_y + COLLISION_SIZE)[:, None]
+        prev_centerx = (self._swept_from_x() + half)[:, None]
+        centerx = (self.cat_x + half)[:, None]
+        before = self.plat_prev_y - prev_bottom
+        after = self.plat_y - bottom
+        crossed = self.plat_active & (alive & (self.vel_y >= 0))[:, None] & (before >= 0) & (after <= 0)
+        span = before - after
+        t = np.where(crossed & (span != 0), before / np.where(span != 0, span, 1), 0.0)
+        x = prev_centerx + (centerx - prev_centerx) * t
+        left = self.plat_prev_x + (self.plat_x - self.plat_prev_x) * t
+        hit = crossed & (left <= x) & (x <= left + self.plat_w)
+        rows = np.flatnonzero(hit.any(axis=1))
+        if rows.size == 0:
+            return
+        # The earliest contact wins, then the topmost, then the earlier spawn like the index.
+        hit = hit[rows]
+        t = np.where(hit, t[rows], np.inf)
+        hit &= t == t.min(axis=1, keepdims=True)
+        ys = np.where(hit, self.plat_y[rows], _UNSET)
+        hit &= ys == ys.min(axis=1, keepdims=True)
+        cols = np.argmin(np.where(hit, self.plat_seq[rows], _UNSET), axis=1)
+        kinds = self.plat_kind[rows, cols]
+        self.cat_y[rows] = self.plat_y[rows, cols] - COLLISION_SIZE
+        breaks = kinds == BREAKABLE
+        self.plat_broken[rows[breaks], cols[breaks]] = True
+        self.vel_y[rows] = np.where(kinds == BOOST, self.tuning.spring_velocity, self.tuning.jump_velocity)
+
+    @staticmethod
+    def _axis(start, delta, size, lo, hi) -> tuple[np.ndarray, np.ndarray]:
+        # collision._axis: the open interval of t in which the spans overlap.
+        moving = delta != 0
+        step = np.where(moving, delta, 1)
+        a = (lo - size - start) / step
+        b = (hi - start) / step
+        still = (start < hi) & (lo < start + size)
+        enter = np.where(moving, np.minimum(a, b), np.where(still, -np.inf, np.inf))
+        leave = np.where(moving, np.maximum(a, b), np.where(still, np.inf, -np.inf))
+        return enter, leave
+
+    def _update_powerups(self, alive: np.ndarray) -> None:
+        # collision.sweep_overlaps along each cat's path this step.
+        w = _POWERUP_W[self.pu_kind]
+        h = _POWERUP_H[self.pu_kind]
+        x0 = self._swept_from_x()[:, None]
+        y0 = self.prev_y[:, None]
+        dx = self.cat_x[:, None] - x0
+        dy = self.cat_y[:, None] - y0
+        x_enter, x_leave = self._axis(x0, dx, COLLISION_SIZE, self.pu_x, self.pu_x + w)
+        y_enter, y_leave = self._axis(y0, dy, COLLISION_SIZE, self.pu_y, self.pu_y + h)
+        enter = np.maximum(x_enter, y_enter)
+        leave = np.minimum(x_leave, y_leave)
+        hit = self.pu_active & alive[:, None] & (enter < leave) & (enter < 1) & (leave > 0)
+        rocket = (hit & (self.pu_kind == ROCKET)).any(axis=1)
+        self.rocket_time[rocket] = ROCKET_TICKS
+        self.vel_y[rocket] = BOOST_VELOCITY
+        self.score += 100 * (hit & (self.pu_kind == COIN)).sum(axis=1)
+        self.pu_active &= ~hit
+
+    def _scroll(self, alive: np.ndarray) -> None:
+        half = self.height // 2
+        climb = alive & (self.cat_y <= half)
+        dy = np.where(climb, half - self.cat_y, 0)
+        self.cat_y -= np.where(climb, self.cat_y - half, 0)
+        self.scroll_y += dy
+        self.score += dy
+        self.plat_y += dy[:, None]
+        self.pu_y += dy[:, None]
+        self.frontier += dy
+
+        # Game._stream_level: place every platform that came within LOOKAHEAD of the screen.
+        gap = self.tuning.vertical_gap
+        need = climb & (self.frontier - gap >= -LOOKAHEAD)
+        while need.any():
+            rows = np.flatnonzero(need)
+            self._spawn_platforms(rows, self.frontier[rows] - gap)
+            need = climb & (self.frontier - gap >= -LOOKAHEAD)
+
+        self.plat_active &= self.plat_y < self.height
+        # Items this far down can no longer overlap a cat that is still alive.
+        self.pu_active &= self.pu_y < self.height + COLLISION_SIZE
+        self.done |= alive & (self.cat_y > self.height)
+
+    def _spawn_platforms(self, rows: np.ndarray, y: np.ndarray) -> None:
+        slots = np.argmin(self.plat_active[rows], axis=1)
+        x = self.rng.integers(0, WORLD_WIDTH - PLATFORM_WIDTH + 1, size=rows.size)
+        self.plat_x[rows, slots] = x
+        self.plat_start_x[rows, slots] = x
+        self.plat_y[rows, slots] = y
+        self.plat_w[rows, slots] = PLATFORM_WIDTH
+        self.plat_kind[rows, slots] = self.rng.choice(len(PLATFORM_KINDS), size=rows.size, p=self._kind_p)
+        self.plat_phase[rows, slots] = 0.0
+        self.plat_broken[rows, slots] = False
+        self.plat_active[rows, slots] = True
+        self.plat_seq[rows, slots] = self._next_seq[rows]
+        self._next_seq[rows] += 1
+        self.frontier[rows] = y
+
+        # A power-up floats above some platforms.
+        rows = rows[self.rng.random(rows.size) < POWERUP_CHANCE]
+        if rows.size == 0:
+            return
+        full = rows[self.pu_active[rows].all(axis=1)]
+        if full.size:
+            # Lifecycle.spawn at the cap: evict the bottommost, the latest spawned among equals.
+            ys = self.pu_y[full]
+            lowest = ys == ys.max(axis=1, keepdims=True)
+            victims = np.argmax(np.where(lowest, self.pu_seq[full], -1), axis=1)
+            self.pu_active[full, victims] = False
+        slots = np.argmin(self.pu_active[rows], axis=1)
+        self.pu_y[rows, slots] = self.frontier[rows] - self.rng.integers(60, 121, size=rows.size)
+        self.pu_x[rows, slots] = self.rng.integers(0, WORLD_WIDTH - 32 + 1, size=rows.size)
+        self.pu_kind[rows, slots] = self.rng.integers(0, len(POWERUP_KINDS), size=rows.size)
+        self.pu_active[rows, slots] = True
+        self.pu_seq[rows, slots] = self._next_pu_seq[rows]
+        self._next_pu_seq[rows] += 1
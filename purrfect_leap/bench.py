@@ -0,0 +1,230 @@
+"""Scripted benchmark scenarios timing the per-frame update and draw phases.
+
+Every scenario drives a real (windowed, but dummy-driver) game for a fixed
+number of frames and times ``update_world``, ``_handle_platform_collisions``,
+``_scroll_world`` and ``draw_world`` separately, plus the whole ``frame``
+minus the scenario's own scripting. ``update_world`` includes the two nested
+phases; static screens such as the pause menu reuse a cached layer and so
+rarely call ``draw_world`` at all. Results are JSON; with ``--baseline`` the
+run fails when any phase's median is more than ``--max-slowdown`` times the
+stored one.
+
+Example::
+
+    python -m purrfect_leap.bench --save-baseline bench_baseline.json
+    python -m purrfect_leap.bench --baseline bench_baseline.json --max-slowdown 1.3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from functools import wraps
+from typing import Callable
+
+from .effects import FLAME
+from .gamestate import Game, PausedState, PlayingState
+from .inputs import NO_INPUT, InputState
+from .tuning import Tuning
+
+PHASES = ("frame", "update_world", "_handle_platform_collisions", "_scroll_world", "draw_world")
+WRAPPED = PHASES[1:]
+# Phases faster than this are dominated by timer noise and never fail a comparison.
+NOISE_FLOOR_MS = 0.01
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """How to prepare a game and which controls to feed it each frame.
+
+    ``drive`` returns ``None`` for frames that only redraw without
+    advancing the world.
+    """
+
+    description: str
+    drive: Callable[[Game, int], InputState | None]
+    tuning: Tuning = Tuning()
+    setup: Callable[[Game], None] | None = None
+
+
+def _keep_alive(game: Game) -> None:
+    """Bounce the cat off the bottom of the screen so a scenario never ends."""
+    player = game.player
+    if player.vel_y > 0 and player.rect.bottom > game.camera.bottom - 40:
+        player.vel_y = game.tuning.jump_velocity
+
+
+def _climb(game: Game, frame: int) -> InputState:
+    _keep_alive(game)
+    player = game.player
+    above = game.platforms.between(player.rect.bottom - 250, player.rect.bottom)
+    if not above:
+        return NO_INPUT
+    target = above[-1].rect.centerx
+    if target < player.rect.centerx - 4:
+        return InputState(left=True)
+    if target > player.rect.centerx + 4:
+        return InputState(right=True)
+    return NO_INPUT
+
+
+def _rocket(game: Game, frame: int) -> InputState:
+    if game.player.rocket_time == 0:
+        game.player.apply_rocket()
+    return InputState(left=frame % 120 < 60, right=frame % 120 >= 60)
+
+
+def _particle_storm(game: Game, frame: int) -> InputState:
+    _keep_alive(game)
+    for i in range(40):
+        x = (frame * 37 + i * 53) % game.width
+        y = game.camera.top + (frame * 11 + i * 97) % game.height
+        game.effects.emit(x, y, FLAME)
+    return NO_INPUT
+
+
+def _pause(game: Game) -> None:
+    game.previous_state = PlayingState(game)
+    game.reset(game.seed)
+    game.change_state(PausedState(game))
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "climb": Scenario("steer towards the nearest platform above", _climb),
+    "moving_field": Scenario("every platform moves", _climb, Tuning(kind_weights=(0, 100, 0, 0))),
+    "rocket": Scenario("permanent rocket boost with flames", _rocket),
+    "particle_storm": Scenario("200 new particles per frame", _particle_storm),
+    "pause_idle": Scenario("pause menu redrawn every frame", lambda game, frame: None, setup=_pause),
+}
+
+
+class PhaseTimer:
+    """Collects per-call durations of wrapped methods, in milliseconds."""
+
+    def __init__(self) -> None:
+        self.samples: dict[str, list[float]] = {phase: [] for phase in PHASES}
+        self.enabled = True
+
+    def wrap(self, game: Game, name: str) -> None:
+        """Shadow ``game.<name>`` with a timed version of the bound method."""
+        method = getattr(game, name)
+        samples = self.samples[name]
+
+        @wraps(method)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            result = method(*args, **kwargs)
+            if self.enabled:
+                samples.append((time.perf_counter() - start) * 1000)
+            return result
+
+        setattr(game, name, timed)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        out = {}
+        for phase, samples in self.samples.items():
+            if not samples:
+                continue
+            percentiles = statistics.quantiles(samples, n=100) if len(samples) > 1 else samples * 99
+            out[phase] = {
+                "calls": len(samples),
+                "mean_ms": statistics.fmean(samples),
+                "p50_ms": statistics.median(samples),
+                "p95_ms": percentiles[94],
+                "max_ms": max(samples),
+            }
+        return out
+
+
+def run_scenario(name: str, frames: int = 600, warmup: int = 60, seed: int = 1) -> dict[str, dict[str, float]]:
+    """Play ``frames`` timed frames of scenario ``name`` and summarise each phase."""
+    scenario = SCENARIOS[name]
+    game = Game(tuning=scenario.tuning, seed=seed)
+    game.change_state(PlayingState(game))
+    game.reset(seed)
+    if scenario.setup is not None:
+        scenario.setup(game)
+    game.start()
+    timer = PhaseTimer()
+    for phase in WRAPPED:
+        timer.wrap(game, phase)
+    frame_samples = timer.samples["frame"]
+    for frame in range(warmup + frames):
+        timer.enabled = frame >= warmup
+        controls = scenario.drive(game, frame)
+        start = time.perf_counter()
+        if controls is not None:
+            game.update_world(controls)
+        game.state.draw(game.screen)
+        if timer.enabled:
+            frame_samples.append((time.perf_counter() - start) * 1000)
+    return timer.summary()
+
+
+def compare(
+    results: dict[str, dict[str, dict[str, float]]],
+    baseline: dict[str, dict[str, dict[str, float]]],
+    max_slowdown: float,
+) -> list[str]:
+    """Return one message per phase whose median exceeds the baseline budget."""
+    regressions = []
+    for scenario, phases in results.items():
+        for phase, stats in phases.items():
+            base = baseline.get(scenario, {}).get(phase)
+            if base is None or base["p50_ms"] < NOISE_FLOOR_MS:
+                continue
+            ratio = stats["p50_ms"] / base["p50_ms"]
+            if ratio > max_slowdown:
+                regressions.append(
+                    f"{scenario}.{phase}: {stats['p50_ms']:.3f} ms vs {base['p50_ms']:.3f} ms ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Frame-phase benchmarks for Purr-fect Leap")
+    parser.add_argument("--scenario", choices=SCENARIOS, nargs="+", default=list(SCENARIOS))
+    parser.add_argument("--frames", type=int, default=600, help="timed frames per scenario")
+    parser.add_argument("--warmup", type=int, default=60, help="untimed frames before measuring")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against results stored in this file")
+    parser.add_argument("--save-baseline", metavar="PATH", help="store these results as the new baseline")
+    parser.add_argument("--max-slowdown", type=float, default=1.25, help="allowed median ratio vs baseline")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    results = {}
+    for name in args.scenario:
+        results[name] = run_scenario(name, args.frames, args.warmup, args.seed)
+        phases = ", ".join(f"{phase} {stats['p50_ms']:.3f}" for phase, stats in results[name].items())
+        print(f"{name}: p50 ms {phases}", file=sys.stderr)
+
+    report = {"frames": args.frames, "seed": args.seed, "results": results}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.max_slowdown)
+        for line in regressions:
+            print(f"SLOWER {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Baked asset bundle: one file holding a sprite atlas and every sound.
+
+Layout: the magic ``PLB1``, a little-endian ``u32`` header length, a JSON
+header, then the data blobs. The header maps sprite names to atlas rects
+and sound names to ``(offset, size)`` ranges, and records the SHA-256 of
+every source file so :func:`bake` can tell when nothing has changed.
+
+The atlas is stored as raw RGBA rather than PNG, so loading it is a copy
+out of the memory map instead of a decode. Sounds are kept as WAV bytes so
+SDL can still convert them to whatever format the mixer was opened with.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+
+import pygame
+
+MAGIC = b"PLB1"
+FORMAT_VERSION = 1
+BUNDLE_FILE = "bundle.plb"
+ATLAS_WIDTH = 256
+# Transparent gap between sprites so scaled neighbours never bleed in.
+ATLAS_PADDING = 1
+
+
+def _hash(path: Path) -> str:
+    import hashlib  # only baking hashes sources, so kept off the startup path
+
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _sources(root: Path) -> dict[str, Path]:
+    files = sorted((root / "sprites").glob("*.png")) + sorted((root / "sounds").glob("*.wav"))
+    return {path.relative_to(root).as_posix(): path for path in files}
+
+
+def read_header(path: Path) -> dict | None:
+    """The header of the bundle at ``path``, or ``None`` if it is missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            if f.read(4) != MAGIC:
+                return None
+            (length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(length))
+    except (OSError, ValueError, struct.error):
+        return None
+    return header if header.get("version") == FORMAT_VERSION else None
+
+
+def pack_atlas(sizes: dict[str, tuple[int, int]], width: int = ATLAS_WIDTH) -> tuple[dict[str, list[int]], int]:
+    """Shelf-pack ``sizes`` into rows ``width`` pixels wide, tallest first.
+
+    Returns each name's ``[x, y, w, h]`` and the atlas height.
+    """
+    rects = {}
+    x = y = shelf = 0
+    for name, (w, h) in sorted(sizes.items(), key=lambda kv: (-kv[1][1], kv[0])):
+        if w > width:
+            raise ValueError(f"sprite {name!r} is wider than the {width} px atlas")
+        if x + w > width:
+            x, y, shelf = 0, y + shelf + ATLAS_PADDING, 0
+        rects[name] = [x, y, w, h]
+        x += w + ATLAS_PADDING
+        shelf = max(shelf, h)
+    return rects, y + shelf
+
+
+def _build_atlas(sprites: dict[str, Path]) -> tuple[dict[str, list[int]], list[int], bytes]:
+    images = {name: pygame.image.load(path) for name, path in sprites.items()}
+    rects, height = pack_atlas({name: image.get_size() for name, image in images.items()})
+    atlas = pygame.Surface((ATLAS_WIDTH, max(height, 1)), pygame.SRCALPHA)
+    for name, image in images.items():
+        atlas.blit(image, rects[name][:2])
+    return rects, list(atlas.get_size()), pygame.image.tobytes(atlas, "RGBA")
+
+
+def bake(root: str | Path, force: bool = False) -> bool:
+    """Bake the sprites and sounds under ``root`` into ``root/bundle.plb``.
+
+    Unchanged inputs are skipped: nothing is written if every source hash
+    matches the existing bundle, and the atlas is reused as-is when only
+    sounds changed. Returns whether the bundle was rewritten.
+    """
+    root = Path(root)
+    target = root / BUNDLE_FILE
+    sources = _sources(root)
+    hashes = {name: _hash(path) for name, path in sources.items()}
+    old = None if force else read_header(target)
+    if old is not None and old["sources"] == hashes:
+        return False
+
+    sprite_hashes = {name: digest for name, digest in hashes.items() if name.startswith("sprites/")}
+    old_sprites = {name: digest for name, digest in (old or {}).get("sources", {}).items() if name.startswith("sprites/")}
+    if old is not None and old_sprites == sprite_hashes:
+        with open(target, "rb") as f:
+            f.seek(old["data_start"] + old["atlas"]["offset"])
+            pixels = f.read(old["atlas"]["size"])
+        rects, atlas_size = old["sprites"], old["atlas"]["dimensions"]
+    else:
+        sprites = {Path(name).stem: sources[name] for name in sprite_hashes}
+        rects, atlas_size, pixels = _build_atlas(sprites)
+
+    blobs = [pixels]
+    sounds = {}
+    offset = len(pixels)
+    for name, path in sources.items():
+        if name.startswith("sounds/"):
+            data = path.read_bytes()
+            sounds[Path(name).stem] = [offset, len(data)]
+            blobs.append(data)
+            offset += len(data)
+
+    header = {
+        "version": FORMAT_VERSION,
+        "sources": hashes,
+        "atlas": {"offset": 0, "size": len(pixels), "dimensions": atlas_size},
+        "sprites": rects,
+        "sounds": sounds,
+        "data_start": 0,
+    }
+    # The data offset depends on the header length, which depends on the offset.
+    while True:
+        encoded = json.dumps(header, sort_keys=True).encode()
+        data_start = 8 + len(encoded)
+        if header["data_start"] == data_start:
+            break
+        header["data_start"] = data_start
+
+    tmp = target.with_name(target.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(encoded)))
+        f.write(encoded)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, target)
+    return True
+
+
+class AssetBundle:
+    """Read-only view of a baked bundle through a memory map."""
+
+    def __init__(self, path: str | Path) -> None:
+        header = read_header(Path(path))
+        if header is None:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} asset bundle")
+        self.header = header
+        self.sprites: dict[str, list[int]] = header["sprites"]
+        self.sounds: dict[str, list[int]] = header["sounds"]
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # Slices of the view point into the mapping instead of copying out of it.
+        self._view = memoryview(self._map)
+        self._atlas: pygame.Surface | None = None
+
+    def _blob(self, offset: int, size: int) -> memoryview:
+        start = self.header["data_start"] + offset
+        return self._view[start : start + size]
+
+    def atlas(self) -> pygame.Surface:
+        """The whole atlas, converted for the display on first use."""
+        if self._atlas is None:
+            atlas = self.header["atlas"]
+            pixels = self._blob(atlas["offset"], atlas["size"])
+            self._atlas = pygame.image.frombuffer(pixels, tuple(atlas["dimensions"]), "RGBA").convert_alpha()
+        return self._atlas
+
+    def image(self, name: str) -> pygame.Surface:
+        """A subsurface of the atlas; it shares the atlas's pixels."""
+        return self.atlas().subsurface(self.sprites[name])
+
+    def sound(self, name: str) -> pygame.mixer.Sound:
+        offset, size = self.sounds[name]
+        # SDL decodes from a file object; this is the one copy of the WAV bytes.
+        return pygame.mixer.Sound(file=io.BytesIO(self._blob(offset, size)))
+
+    def close(self) -> None:
+        self._atlas = None
+        self._view.release()
+        self._map.close()
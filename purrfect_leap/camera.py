@@ -0,0 +1,36 @@
+"""Vertical camera mapping world coordinates to the screen."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pygame
+
+
+@dataclass
+class Camera:
+    """A viewport whose top edge sits at world y ``top``.
+
+    Entities keep fixed world coordinates; climbing only lowers ``top``
+    (world y grows downwards), and screen positions are derived at draw time.
+    """
+
+    width: int
+    height: int
+    top: int = 0
+
+    @property
+    def bottom(self) -> int:
+        return self.top + self.height
+
+    def lerp(self, previous_top: int, alpha: float) -> "Camera":
+        """The view ``alpha`` of the way from ``previous_top`` to the current top."""
+        if alpha >= 1 or previous_top == self.top:
+            return self
+        return Camera(self.width, self.height, round(previous_top + (self.top - previous_top) * alpha))
+
+    def to_screen(self, rect: pygame.Rect) -> pygame.Rect:
+        return rect.move(0, -self.top)
+
+    def screen_y(self, world_y: float) -> float:
+        return world_y - self.top
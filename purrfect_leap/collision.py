@@ -0,0 +1,71 @@
+"""Swept (continuous) collision tests for the cat.
+
+During a tick the cat and every platform move in a straight line from
+their previous position (``prev_x``/``prev_y``) to their current one.
+These tests check the whole path, not just where things ended up, so
+contacts are found however far anything moved in one tick: a fast cat can
+no longer pass through a platform or a power-up, and the outcome does not
+depend on how the motion is split into ticks.
+"""
+
+from __future__ import annotations
+
+import math
+
+import pygame
+
+# ``(enter, exit)`` for an axis that overlaps for the whole tick.
+_ALWAYS = (-math.inf, math.inf)
+
+
+def landing_time(
+    prev_bottom: int,
+    bottom: int,
+    prev_centerx: int,
+    centerx: int,
+    prev_left: int,
+    left: int,
+    prev_top: int,
+    top: int,
+    width: int,
+) -> float | None:
+    """When the cat's feet reach a platform's top, as a fraction of the tick.
+
+    Platforms are one-way: the cat lands only if its feet start the tick
+    on or above the top and end it on or below, with its centre over the
+    platform at the moment they meet. Returns ``None`` if it does not land.
+    """
+    before = prev_top - prev_bottom
+    after = top - bottom
+    if before < 0 or after > 0:
+        return None
+    t = before / (before - after) if before != after else 0.0
+    x = prev_centerx + (centerx - prev_centerx) * t
+    platform_left = prev_left + (left - prev_left) * t
+    if platform_left <= x <= platform_left + width:
+        return t
+    return None
+
+
+def _axis(start: int, delta: int, size: int, lo: int, hi: int) -> tuple[float, float] | None:
+    # Open interval of t in which [start, start + size) + delta * t overlaps [lo, hi).
+    if delta == 0:
+        return _ALWAYS if start < hi and lo < start + size else None
+    a = (lo - size - start) / delta
+    b = (hi - start) / delta
+    return (a, b) if a < b else (b, a)
+
+
+def sweep_overlaps(rect: pygame.Rect, dx: int, dy: int, other: pygame.Rect) -> bool:
+    """Whether ``rect``, having moved by ``(dx, dy)`` this tick, touched ``other`` on the way.
+
+    ``other`` is static. Touching edges do not count, as with
+    :meth:`pygame.Rect.colliderect`.
+    """
+    x = _axis(rect.x - dx, dx, rect.width, other.left, other.right)
+    y = _axis(rect.y - dy, dy, rect.height, other.top, other.bottom)
+    if x is None or y is None:
+        return False
+    enter = max(x[0], y[0])
+    leave = min(x[1], y[1])
+    return enter < leave and enter < 1 and leave > 0
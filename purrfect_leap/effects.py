@@ -1,54 +1,169 @@
-"""Simple particle effects."""
+"""Particle effects backed by fixed-capacity NumPy arrays."""
 
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass
 
+import numpy as np
 import pygame
 
+from .lifecycle import EntityCounts
 
-@dataclass
-class Particle:
-    """A simple particle represented by a colored circle."""
 
-    pos: pygame.Vector2
-    vel: pygame.Vector2
+@dataclass(frozen=True)
+class Burst:
+    """How many particles one emission spawns and how they move."""
+
+    count: int
+    vx: tuple[float, float]
+    vy: tuple[float, float]
     radius: int
     color: tuple[int, int, int]
     lifetime: int
 
-    def update(self) -> None:
-        self.pos += self.vel
-        self.lifetime -= 1
 
-    def draw(self, surface: pygame.Surface) -> None:
-        if self.lifetime > 0:
-            pygame.draw.circle(surface, self.color, (int(self.pos.x), int(self.pos.y)), self.radius)
+DUST = Burst(count=5, vx=(-1, 1), vy=(-2, 0), radius=3, color=(200, 200, 200), lifetime=30)
+FLAME = Burst(count=5, vx=(-1, 1), vy=(1, 3), radius=4, color=(255, 100, 0), lifetime=30)
 
 
 class ParticleSystem:
-    """Maintains a list of particles."""
+    """A pool of at most ``capacity`` particles in world coordinates.
+
+    Live particles are packed into the first :attr:`count` rows of each
+    array, so integration and expiry are single vectorized passes. When a
+    burst does not fit, ``overflow="recycle"`` evicts the particles closest
+    to expiring and ``overflow="drop"`` discards the newcomers; either way
+    :attr:`dropped` counts the casualties. Particles that leave the camera
+    are culled (see :meth:`cull`) rather than simulated to the end.
+    """
+
+    def __init__(self, capacity: int = 4096, overflow: str = "recycle", seed: int | None = None) -> None:
+        if overflow not in ("recycle", "drop"):
+            raise ValueError(f"unknown overflow policy {overflow!r}")
+        self.capacity = capacity
+        self.overflow = overflow
+        self.rng = np.random.default_rng(seed)
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.radius = np.zeros(capacity, dtype=np.int16)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        # Index into the per-(radius, colour) sprite table used for batched blits.
+        self.style = np.zeros(capacity, dtype=np.int16)
+        self.count = 0
+        self.dropped = 0
+        # Per-tick counters; see begin_tick and counts.
+        self.spawned = 0
+        self.despawned = 0
+        self._dropped_before = 0
+        self._style_ids: dict[tuple[int, tuple[int, int, int]], int] = {}
+        self._sprites = np.empty(0, dtype=object)
 
-    def __init__(self) -> None:
-        self.particles: list[Particle] = []
+    def __len__(self) -> int:
+        return self.count
 
     def spawn_dust(self, x: int, y: int) -> None:
-        for _ in range(5):
-            vel = pygame.Vector2(random.uniform(-1, 1), random.uniform(-2, 0))
-            self.particles.append(Particle(pygame.Vector2(x, y), vel, 3, (200, 200, 200), 30))
+        self.emit(x, y, DUST)
 
     def spawn_flame(self, x: int, y: int) -> None:
-        for _ in range(5):
-            vel = pygame.Vector2(random.uniform(-1, 1), random.uniform(1, 3))
-            self.particles.append(Particle(pygame.Vector2(x, y), vel, 4, (255, 100, 0), 30))
+        self.emit(x, y, FLAME)
+
+    def emit(self, x: float, y: float, burst: Burst) -> None:
+        n = burst.count
+        free = self.capacity - self.count
+        if n > free:
+            if self.overflow == "drop":
+                self.dropped += n - free
+                n = free
+            else:
+                self._evict(min(n, self.capacity) - free)
+        n = min(n, self.capacity)
+        if n <= 0:
+            return
+        s = slice(self.count, self.count + n)
+        self.pos[s] = (x, y)
+        self.vel[s, 0] = self.rng.uniform(*burst.vx, size=n)
+        self.vel[s, 1] = self.rng.uniform(*burst.vy, size=n)
+        self.lifetime[s] = burst.lifetime
+        self.radius[s] = burst.radius
+        self.color[s] = burst.color
+        self.style[s] = self._style(burst.radius, burst.color)
+        self.count += n
+        self.spawned += n
+
+    def _evict(self, n: int) -> None:
+        """Drop the ``n`` live particles with the least lifetime left."""
+        self.dropped += n
+        live = self.lifetime[: self.count]
+        keep = np.ones(self.count, dtype=bool)
+        keep[np.argpartition(live, n - 1)[:n]] = False
+        self._compact(keep)
+
+    def _compact(self, keep: np.ndarray) -> None:
+        k = int(keep.sum())
+        if k == self.count:
+            return
+        for array in (self.pos, self.vel, self.lifetime, self.radius, self.color, self.style):
+            array[:k] = array[: self.count][keep]
+        self.count = k
 
     def update(self) -> None:
-        for p in list(self.particles):
-            p.update()
-            if p.lifetime <= 0:
-                self.particles.remove(p)
-
-    def draw(self, surface: pygame.Surface) -> None:
-        for p in self.particles:
-            p.draw(surface)
+        n = self.count
+        if n == 0:
+            return
+        self.pos[:n] += self.vel[:n]
+        self.lifetime[:n] -= 1
+        self._compact(self.lifetime[:n] > 0)
+        self.despawned += n - self.count
+
+    def _on_camera(self, camera: "Camera") -> np.ndarray:
+        n = self.count
+        ys = self.pos[:n, 1]
+        radius = self.radius[:n]
+        return (ys + radius > camera.top) & (ys - radius < camera.bottom)
+
+    def cull(self, camera: "Camera") -> None:
+        """Despawn particles that no longer overlap ``camera``; they are never drawn again."""
+        n = self.count
+        if n:
+            self._compact(self._on_camera(camera))
+            self.despawned += n - self.count
+
+    def begin_tick(self) -> None:
+        self.spawned = self.despawned = 0
+        self._dropped_before = self.dropped
+
+    def counts(self, camera: "Camera") -> EntityCounts:
+        active = int(self._on_camera(camera).sum())
+        return EntityCounts(self.count, active, self.spawned, self.despawned, self.dropped - self._dropped_before)
+
+    def clear(self, seed: int | None = None) -> None:
+        """Remove every particle, optionally reseeding the generator."""
+        self.count = 0
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+
+    def _style(self, radius: int, color: tuple[int, int, int]) -> int:
+        key = (radius, tuple(color))
+        style = self._style_ids.get(key)
+        if style is None:
+            style = self._style_ids[key] = len(self._style_ids)
+            sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            self._sprites = np.append(self._sprites, np.empty(1, dtype=object))
+            self._sprites[style] = sprite
+        return style
+
+    def draw(self, surface: pygame.Surface, camera: "Camera", alpha: float = 1.0) -> None:
+        n = self.count
+        if n == 0:
+            return
+        pos = self.pos[:n]
+        if alpha < 1:
+            pos = pos - self.vel[:n] * (1 - alpha)
+        xs = pos[:, 0].astype(np.int32) - self.radius[:n]
+        ys = pos[:, 1].astype(np.int32) - self.radius[:n] - camera.top
+        visible = (ys > -2 * self.radius[:n] - 1) & (ys < camera.height)
+        sprites = self._sprites[self.style[:n][visible]].tolist()
+        positions = zip(xs[visible].tolist(), ys[visible].tolist())
+        surface.blits(list(zip(sprites, positions)), doreturn=False)
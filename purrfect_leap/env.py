@@ -0,0 +1,155 @@
+"""Gym-style reinforcement-learning environment around :class:`Game`.
+
+``reset(seed)`` returns the first observation and ``step(action)`` returns
+``(observation, reward, done, info)``. Steps call ``Game.update_world``
+directly, so training runs as fast as the simulation allows rather than
+at the 60 fps of :meth:`Game.run`.
+
+Two observation kinds are available:
+
+* ``"features"`` -- a float32 vector: the cat's state followed by the
+  ``k_platforms`` platforms nearest to its feet, positioned relative to it.
+  Only this kind runs headless.
+* ``"pixels"`` -- the rendered frame, subsampled by ``downscale``, as a
+  ``(height, width, 3)`` uint8 array. It is read straight out of the
+  screen surface through a ``pygame.surfarray`` view, so the full frame is
+  never copied. It needs a display, e.g. ``SDL_VIDEODRIVER=dummy``.
+
+Observations are written into a buffer that the next ``reset`` or ``step``
+overwrites; pass ``copy=True`` to get a fresh array each time.
+"""
+
+from __future__ import annotations
+
+import tempfile
+
+import numpy as np
+import pygame
+
+from .gamestate import Game
+from .inputs import NO_INPUT, InputState
+from .platform import PLATFORM_KINDS
+from .player import ROCKET_TICKS
+from .tuning import Tuning
+
+ACTIONS = (NO_INPUT, InputState(left=True), InputState(right=True))
+OBSERVATIONS = ("features", "pixels")
+# x, vertical velocity, rocket time left, height on screen.
+PLAYER_FEATURES = 4
+# present, dx, dy, width, broken, then one-hot kind.
+PLATFORM_FEATURES = 5 + len(PLATFORM_KINDS)
+VELOCITY_SCALE = 20.0
+
+
+class LeapEnv:
+    """One game exposed as an RL environment with ``len(ACTIONS)`` discrete actions.
+
+    The reward is the score gained during the step (height climbed plus
+    coins). An episode ends when the cat falls or after ``max_ticks``
+    ticks; ``info["truncated"]`` tells the two apart. Each action is
+    repeated for ``frame_skip`` ticks.
+    """
+
+    def __init__(
+        self,
+        observation: str = "features",
+        k_platforms: int = 8,
+        downscale: int = 4,
+        frame_skip: int = 1,
+        max_ticks: int = 10_000,
+        tuning: Tuning | None = None,
+        copy: bool = False,
+    ) -> None:
+        if observation not in OBSERVATIONS:
+            raise ValueError(f"unknown observation kind {observation!r}")
+        self.observation = observation
+        self.k_platforms = k_platforms
+        self.downscale = downscale
+        self.frame_skip = frame_skip
+        self.max_ticks = max_ticks
+        self.copy = copy
+        self._save_dir = None
+        self.ticks = 0
+        tuning = tuning or Tuning()
+        if observation == "pixels":
+            # Episodes must not land in the player's own best scores and run history.
+            self._save_dir = tempfile.TemporaryDirectory(prefix="purrfect_leap_env")
+            self.game = Game(tuning=tuning, save_dir=self._save_dir.name, silent=True)
+            width, height = self.game.screen.get_size()
+            self._obs = np.zeros((-(-height // downscale), -(-width // downscale), 3), dtype=np.uint8)
+        else:
+            self.game = Game(headless=True, tuning=tuning)
+            self._obs = np.zeros(PLAYER_FEATURES + k_platforms * PLATFORM_FEATURES, dtype=np.float32)
+            # A view of the platform part of the vector, one row per platform.
+            self._platforms = self._obs[PLAYER_FEATURES:].reshape(k_platforms, PLATFORM_FEATURES)
+
+    @property
+    def observation_shape(self) -> tuple[int, ...]:
+        return self._obs.shape
+
+    @property
+    def n_actions(self) -> int:
+        return len(ACTIONS)
+
+    def reset(self, seed: int | None = None) -> np.ndarray:
+        """Start a new episode, already launched off the base platform."""
+        self.game.reset(seed)
+        self.game.start()
+        self.ticks = 0
+        return self._observe()
+
+    def step(self, action: int) -> tuple[np.ndarray, float, bool, dict]:
+        game = self.game
+        controls = ACTIONS[action]
+        score = game.score
+        for _ in range(self.frame_skip):
+            game.update_world(controls)
+            self.ticks += 1
+            if game.game_over or self.ticks >= self.max_ticks:
+                break
+        truncated = not game.game_over and self.ticks >= self.max_ticks
+        info = {"score": game.score, "height": game.scroll_y, "ticks": self.ticks, "truncated": truncated}
+        return self._observe(), float(game.score - score), game.game_over or truncated, info
+
+    def close(self) -> None:
+        self.game.level.close()
+        if self._save_dir is not None:
+            self.game.storage.close()
+            self._save_dir.cleanup()
+            self._save_dir = None
+
+    def _observe(self) -> np.ndarray:
+        if self.observation == "pixels":
+            self._observe_pixels()
+        else:
+            self._observe_features()
+        return self._obs.copy() if self.copy else self._obs
+
+    def _observe_features(self) -> None:
+        game = self.game
+        cat = game.player
+        obs = self._obs
+        obs[0] = cat.rect.centerx / game.width
+        obs[1] = cat.vel_y / VELOCITY_SCALE
+        obs[2] = cat.rocket_time / ROCKET_TICKS
+        obs[3] = (cat.rect.bottom - game.camera.top) / game.height
+        rows = self._platforms
+        rows[:] = 0
+        feet = cat.rect.bottom
+        for row, platform in zip(rows, game.platforms.nearest(feet, self.k_platforms)):
+            rect = platform.rect
+            row[0] = 1
+            row[1] = (rect.centerx - cat.rect.centerx) / game.width
+            row[2] = (rect.top - feet) / game.height
+            row[3] = rect.width / game.width
+            row[4] = platform.broken
+            row[5 + PLATFORM_KINDS.index(platform.kind)] = 1
+
+    def _observe_pixels(self) -> None:
+        screen = self.game.screen
+        self.game.draw_world(screen)
+        # The view locks the screen, so it must be gone before the next draw.
+        view = pygame.surfarray.pixels3d(screen)
+        step = self.downscale
+        np.copyto(self._obs, view[::step, ::step].transpose(1, 0, 2))
+        del view
@@ -2,12 +2,47 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import math
+import os
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Optional
 
 import pygame
 
-from .player import JUMP_VELOCITY
+from .audio import MixerSettings, NullAudio, open_audio
+from .camera import Camera
+from .collision import landing_time
+from .effects import ParticleSystem
+from .inputs import NO_INPUT, START, InputState
+from .level import LOOKAHEAD, Chunk, LevelStream, PlatformSpec, generate_chunks
+from .lifecycle import EntityCounts, Lifecycle
+from .platform import PLATFORM_HEIGHT, Platform, place_platform, restore_platform
+from .player import Cat
+from .pool import Pool
+from .powerups import PowerUpManager
+from .profiler import FrameProfiler, ProfilerOverlay
+from .render import NullRenderer, open_renderer
+from .replay import Replay
+from .snapshot import Snapshot
+from .storage import RunRecord, Storage
+from .spatial import SpatialIndex
+from .tuning import Tuning
+from .ui import UI
+
+if TYPE_CHECKING:
+    from .net import RaceClient
+
+SKY_COLOR = (135, 206, 235)
+# A screen plus the streaming lookahead holds about 15; the cap only guards against runaway growth.
+MAX_PLATFORMS = 64
+# The world always advances in 1/60 s ticks; velocities are pixels per tick.
+SIM_RATE = 60
+SIM_STEP = 1 / SIM_RATE
+# More ticks than this in one rendered frame means we cannot keep up; drop the backlog.
+MAX_CATCH_UP_STEPS = 5
 
 
 class GameState:
@@ -26,7 +61,21 @@ class GameState:
         pass
 
 
-class StartMenuState(GameState):
+class StaticScreenState(GameState):
+    """A state whose screen does not change while it is active.
+
+    :meth:`render` runs once into the game's cached layer; later frames
+    reuse that layer, and dirty-rect mode skips them entirely.
+    """
+
+    def draw(self, surface: pygame.Surface) -> None:
+        self.game.draw_frozen(self, surface)
+
+    def render(self, surface: pygame.Surface) -> None:
+        pass
+
+
+class StartMenuState(StaticScreenState):
     """Start menu state."""
 
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -35,43 +84,41 @@ class StartMenuState(GameState):
         elif event.type == pygame.MOUSEBUTTONDOWN:
             self.game.change_state(PlayingState(self.game))
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def render(self, surface: pygame.Surface) -> None:
         self.game.draw_world(surface)
-        title = self.game.ui.font.render("Purr-fect Leap", True, (255, 255, 255))
-        prompt = self.game.ui.font.render("Press SPACE or Click", True, (255, 255, 0))
+        title = self.game.ui.text("Purr-fect Leap", (255, 255, 255))
+        prompt = self.game.ui.text("Press SPACE or Click", (255, 255, 0))
         rect = title.get_rect(center=(self.game.width // 2, self.game.height // 2 - 40))
         surface.blit(title, rect)
         rect = prompt.get_rect(center=(self.game.width // 2, self.game.height // 2 + 10))
         surface.blit(prompt, rect)
 
 
-class PausedState(GameState):
+class PausedState(StaticScreenState):
     """Paused state."""
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             self.game.change_state(self.game.previous_state)
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def render(self, surface: pygame.Surface) -> None:
         self.game.previous_state.draw(surface)
-        overlay = pygame.Surface((self.game.width, self.game.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        surface.blit(overlay, (0, 0))
-        text = self.game.ui.font.render("Paused", True, (255, 255, 255))
+        surface.blit(self.game.overlay(), (0, 0))
+        text = self.game.ui.text("Paused", (255, 255, 255))
         rect = text.get_rect(center=(self.game.width // 2, self.game.height // 2))
         surface.blit(text, rect)
 
 
-class GameOverState(GameState):
+class GameOverState(StaticScreenState):
     """Game over state."""
 
     def __init__(self, game: "Game", score: int) -> None:
         super().__init__(game)
         self.score = score
-        if score > self.game.best_score:
-            self.game.best_score = score
-            self.game.ui.save_best_score(score)
-        self.game.ui.play_sound("gameover")
+        game.storage.record_run(RunRecord(score, game.scroll_y, game.replay.ticks / SIM_RATE, game.seed))
+        game.storage.save_best_score(score)
+        game.best_score = game.storage.best_score
+        self.game.play_sound("gameover")
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN and event.key in (pygame.K_SPACE, pygame.K_RETURN):
@@ -79,11 +126,11 @@ class GameOverState(GameState):
         elif event.type == pygame.MOUSEBUTTONDOWN:
             self.game.change_state(PlayingState(self.game))
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def render(self, surface: pygame.Surface) -> None:
         surface.fill((30, 0, 0))
-        over = self.game.ui.font.render("Game Over", True, (255, 0, 0))
-        score_text = self.game.ui.font.render(f"Score: {self.score}", True, (255, 255, 255))
-        best_text = self.game.ui.font.render(f"Best: {self.game.best_score}", True, (0, 255, 0))
+        over = self.game.ui.text("Game Over", (255, 0, 0))
+        score_text = self.game.ui.text(f"Score: {self.score}", (255, 255, 255))
+        best_text = self.game.ui.text(f"Best: {self.game.best_score}", (0, 255, 0))
         rect = over.get_rect(center=(self.game.width // 2, self.game.height // 2 - 40))
         surface.blit(over, rect)
         rect = score_text.get_rect(center=(self.game.width // 2, self.game.height // 2))
@@ -98,6 +145,7 @@ class PlayingState(GameState):
     def __init__(self, game: "Game") -> None:
         super().__init__(game)
         self.game.reset()
+        self.start_pressed = False
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -105,12 +153,12 @@ class PlayingState(GameState):
                 self.game.previous_state = self
                 self.game.change_state(PausedState(self.game))
             elif event.key == pygame.K_SPACE:
-                if not self.game.started:
-                    self.game.started = True
-                    self.game.player.jump()
+                self.start_pressed = True
 
     def update(self) -> None:
-        self.game.update_world()
+        controls = InputState.from_keys(pygame.key.get_pressed(), start=self.start_pressed)
+        self.start_pressed = False
+        self.game.update_world(controls)
 
     def draw(self, surface: pygame.Surface) -> None:
         self.game.draw_world(surface)
@@ -118,122 +166,495 @@ class PlayingState(GameState):
 
 @dataclass
 class Game:
-    """Main game container."""
+    """Main game container.
+
+    With ``headless`` set no window, mixer or font is created, :attr:`audio`
+    is a silent :class:`~purrfect_leap.audio.NullAudio` and nothing is
+    drawn; the world is advanced with :meth:`step` or :meth:`run_headless`
+    as fast as the CPU allows. With ``silent`` set the game draws as usual
+    but never opens the mixer. With ``dirty_rects`` set only the regions
+    that changed are pushed to the display each frame.
+
+    Drawing goes through :attr:`renderer`, picked by ``backend`` (see
+    :mod:`purrfect_leap.render`). The world is always drawn at ``width`` x
+    ``height`` and scaled to ``window_size`` when one is given.
+
+    The level streams in chunk by chunk from :func:`generate_chunks`,
+    seeded on every :meth:`reset` (on a worker thread with ``level_worker``),
+    and every tick's input is appended to :attr:`replay`, so any run can be
+    reproduced exactly from its replay. :meth:`snapshot` and :meth:`restore`
+    save and rewind a run in memory. With a connected ``race`` client the
+    run uses the race's seed, publishes the cat every tick and draws the
+    other players' cats as ghosts (see :mod:`purrfect_leap.net`).
+
+    :meth:`run` advances the world in fixed ``SIM_STEP`` ticks however fast
+    it renders (``fps``, 0 for uncapped) and draws entities interpolated
+    between the last two ticks, so gameplay is identical at any refresh rate.
+
+    With ``profile`` set, :attr:`profiler` times every phase of the frame.
+    In :meth:`run`, F3 toggles the frame-time overlay, F4 exports the
+    buffered frames to JSON and F5 captures ``CAPTURE_FRAMES`` frames with
+    cProfile.
+    """
+
+    CAPTURE_FRAMES = 300
 
     width: int = 480
     height: int = 800
     state: GameState | None = None
     previous_state: Optional[GameState] = None
+    headless: bool = False
+    silent: bool = False
+    tuning: Tuning = field(default_factory=Tuning)
+    dirty_rects: bool = False
+    seed: int | None = None
+    replay_path: str | None = None
+    profile: bool = False
+    fps: int = 60
+    level_worker: bool = False
+    save_dir: str | None = None
+    backend: str = "software"
+    window_size: tuple[int, int] | None = None
+    race: "RaceClient | None" = None
+    mixer: MixerSettings = field(default_factory=MixerSettings)
 
     def __post_init__(self) -> None:
-        pygame.init()
-        self.screen = pygame.display.set_mode((self.width, self.height))
-        pygame.display.set_caption("Purr-fect Leap")
-        self.clock = pygame.time.Clock()
-        self.ui = __import__("purrfect_leap.ui", fromlist=["UI"]).UI()
-        self.best_score = self.ui.load_best_score()
+        self.screen = None
+        self.renderer = NullRenderer((self.width, self.height))
+        self.clock = None
+        self.ui = None
+        self.best_score = 0
+        self.storage = None
+        self._frozen_layer = None
+        self._frozen_owner = None
+        self._overlay = None
+        self.audio = NullAudio()
+        if not self.headless:
+            if not self.silent:
+                self.audio = open_audio(self.mixer)
+            # Only what the game uses; pygame.init() would also start joystick, camera, etc.
+            pygame.display.init()
+            pygame.font.init()
+            pygame.display.set_caption("Purr-fect Leap")
+            self.renderer = open_renderer(
+                self.backend,
+                (self.width, self.height),
+                self.window_size,
+                self.dirty_rects,
+                SKY_COLOR,
+                "Purr-fect Leap",
+            )
+            self.screen = self.renderer.target
+            self.clock = pygame.time.Clock()
+            self.ui = UI()
+            self.storage = Storage(self.save_dir)
+            self.best_score = self.storage.best_score
         self.player = None
-        self.platforms = []
-        self.powerups = []
-        self.scroll_y = 0
+        self.platforms = SpatialIndex()
+        self.platform_pool = Pool(Platform.blank)
+        self.platform_life = Lifecycle(self.platforms, self.platform_pool, MAX_PLATFORMS, PLATFORM_HEIGHT)
+        self.powerups = PowerUpManager(self.headless)
+        self._moved: list[Platform] = []
+        self.level: LevelStream | None = None
+        # The chunk most recently taken from the level stream.
+        self._chunk: Chunk | None = None
+        # Streamed platforms not placed yet, bottom first.
+        self._upcoming: deque[PlatformSpec] = deque()
+        self.replay = None
+        self._start_pending = False
+        self._accumulator = 0.0
+        self._prev_camera_top = 0
+        self.render_alpha = 1.0
+        self.profiler = FrameProfiler() if self.profile else None
+        self.profiler_overlay = None
+        if self.profiler is not None and not self.headless:
+            self.profiler_overlay = ProfilerOverlay(self.profiler)
+        self.camera = Camera(self.width, self.height)
+        # Particles are purely cosmetic, so headless runs skip them entirely.
+        self.effects = None if self.headless else ParticleSystem()
         self.score = 0
         self.started = False
-        self.reset()
+        self.game_over = False
+        self.reset(self.seed)
 
     def change_state(self, state: GameState) -> None:
         self.state = state
 
+    def draw_frozen(self, owner: StaticScreenState, surface: pygame.Surface) -> None:
+        """Draw ``owner``'s static screen, rendering it only on first use."""
+        if self._frozen_owner is not owner:
+            # A fresh layer rather than a redraw, since texture renderers cache uploads per surface.
+            self._frozen_layer = pygame.Surface((self.width, self.height)).convert()
+            owner.render(self._frozen_layer)
+            self._frozen_owner = owner
+        elif self.dirty_rects:
+            return
+        surface.blit(self._frozen_layer, (0, 0))
+
+    def overlay(self) -> pygame.Surface:
+        """The translucent full-screen shade used behind menus."""
+        if self._overlay is None:
+            self._overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            self._overlay.fill((0, 0, 0, 150))
+        return self._overlay
+
+    def play_sound(self, name: str) -> None:
+        self.audio.play(name)
+
     # Game world logic
-    def reset(self) -> None:
-        module = __import__("purrfect_leap.player", fromlist=["Cat"])
-        self.player = module.Cat(self.width // 2, self.height - 100)
-        platform_module = __import__("purrfect_leap.platform", fromlist=["Platform", "generate_platforms"])
-        self.platforms = platform_module.generate_platforms(self.height)
-        powerups_module = __import__("purrfect_leap.powerups", fromlist=["PowerUpManager"])
-        self.powerups = powerups_module.PowerUpManager()
-        self.scroll_y = 0
+    def reset(self, seed: int | None = None) -> None:
+        """Start a new run, seeded with ``seed``, the race's seed or a fresh random one."""
+        if seed is None and self.race is not None:
+            seed = self.race.seed
+        self.seed = int.from_bytes(os.urandom(8), "little") >> 1 if seed is None else seed
+        self.replay = Replay(self.seed, self.tuning, self.width, self.height)
+        self._start_pending = False
+        self.player = Cat(
+            self.width // 2,
+            self.height - 100,
+            self.headless,
+            self.tuning.gravity,
+            self.tuning.jump_velocity,
+        )
+        self.platform_life.clear()
+        self.powerups.clear()
+        if self.level is not None:
+            self.level.close()
+        self.level = LevelStream(generate_chunks(self.seed, self.tuning, self.height), self.level_worker)
+        self._chunk = None
+        self._upcoming.clear()
+        self.camera = Camera(self.width, self.height)
+        self._prev_camera_top = self.camera.top
+        self._stream_level()
+        if self.effects is not None:
+            self.effects.clear(self.seed)
         self.score = 0
         self.started = False
-        base = self.platforms[0]
+        self.game_over = False
+        base = self.platforms.last()
         self.player.rect.midbottom = (base.rect.centerx, base.rect.top)
 
-    def update_world(self) -> None:
-        keys = pygame.key.get_pressed()
-        self.player.update(keys, self.started)
-        for platform in list(self.platforms):
+    def snapshot(self) -> Snapshot:
+        """Capture the run so that :meth:`restore` can return to this tick."""
+        return Snapshot(
+            self.seed,
+            self.player.get_state(),
+            tuple(platform.get_state() for platform in self.platforms),
+            tuple((p.rect.x, p.rect.y, p.kind) for p in self.powerups.powerups),
+            self.camera.top,
+            self._prev_camera_top,
+            self.score,
+            self.started,
+            self.game_over,
+            self._start_pending,
+            self._chunk,
+            tuple(self._upcoming),
+            self.replay.history(),
+        )
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """Put the run back exactly as it was when ``snapshot`` was taken.
+
+        Works on any game with the same size and tuning, not just the one
+        that took the snapshot. Sprites come from the asset cache, the
+        level stream is only rebuilt if it has moved past the snapshot's chunk,
+        and the replay only drops the inputs recorded since.
+        """
+        if snapshot.seed != self.seed or snapshot.chunk is not self._chunk:
+            self.level.close()
+            chunks = generate_chunks(snapshot.seed, self.tuning, self.height, after=snapshot.chunk)
+            self.level = LevelStream(chunks, self.level_worker)
+            self._chunk = snapshot.chunk
+        self.seed = snapshot.seed
+        self._upcoming.clear()
+        self._upcoming.extend(snapshot.upcoming)
+        self.player.set_state(snapshot.cat)
+        self.platform_life.clear()
+        for state in snapshot.platforms:
+            self.platforms.add(restore_platform(state, self.headless, self.platform_pool), state[1])
+        self.powerups.clear()
+        for x, y, kind in snapshot.powerups:
+            self.powerups.spawn(x, y, kind)
+        self.camera.top = snapshot.camera_top
+        self._prev_camera_top = snapshot.prev_camera_top
+        self.score = snapshot.score
+        self.started = snapshot.started
+        self.game_over = snapshot.game_over
+        self._start_pending = snapshot.start_pending
+        if self.replay.seed != self.seed:
+            self.replay = Replay(self.seed, self.tuning, self.width, self.height)
+        self.replay.rewind(snapshot.inputs)
+        if self.ui is not None:
+            self.ui.update_score(self.score)
+
+    def start(self) -> None:
+        """Launch the cat off the base platform."""
+        self.started = True
+        self._start_pending = True
+        if self.player.jump():
+            self.play_sound("jump")
+
+    def update_world(self, controls: InputState | None = None) -> None:
+        if controls is None:
+            controls = NO_INPUT if self.headless else InputState.from_keys(pygame.key.get_pressed())
+        if controls.start and not self.started:
+            self.start()
+        # Only the tick on which the run actually started carries the START bit.
+        self.replay.record(controls.mask & ~START | (START if self._start_pending else 0))
+        self._start_pending = False
+        self.platform_life.begin_tick()
+        self.powerups.life.begin_tick()
+        if self.effects is not None:
+            self.effects.begin_tick()
+        profiler = self.profiler
+        self._prev_camera_top = self.camera.top
+        self.player.update(controls, self.started)
+        if self.effects is not None:
+            if self.player.rocket_time > 0:
+                self.effects.spawn_flame(*self.player.rect.midbottom)
+            self.effects.update()
+        moved = self._moved
+        # Platforms above the camera stay frozen until it reaches them.
+        for platform in self.platform_life.active(self.camera):
+            top = platform.rect.top
             platform.update()
+            if platform.rect.top != top:
+                moved.append(platform)
+        for platform in moved:
+            self.platforms.move(platform, platform.rect.top)
+        moved.clear()
+        if profiler is not None:
+            profiler.mark("update")
         self._handle_platform_collisions()
-        self.powerups.update(self.player, self.platforms, self)
+        if profiler is not None:
+            profiler.mark("collisions")
+        self.powerups.update(self.player, self)
+        if profiler is not None:
+            profiler.mark("powerups")
         self._scroll_world()
-        self.ui.update_score(self.score)
+        if profiler is not None:
+            profiler.mark("scroll")
+        if self.race is not None:
+            self.race.publish(self.replay.ticks, self.player)
+        if self.ui is not None:
+            self.ui.update_score(self.score)
+
+    def step(self, controls: InputState = NO_INPUT) -> bool:
+        """Advance the simulation one tick; return False once the cat has fallen."""
+        if not self.game_over:
+            self.update_world(controls)
+        return not self.game_over
+
+    def run_headless(
+        self,
+        max_ticks: int,
+        policy: Callable[["Game"], InputState] | None = None,
+    ) -> int:
+        """Simulate a full run without rendering and return the ticks played.
+
+        ``policy`` is called once per tick with the game and returns the
+        controls to apply; without one the cat only bounces in place.
+        """
+        if not self.started:
+            self.start()
+        ticks = 0
+        while ticks < max_ticks and not self.game_over:
+            self.update_world(policy(self) if policy else NO_INPUT)
+            ticks += 1
+        return ticks
+
+    @property
+    def scroll_y(self) -> int:
+        """How far the camera has climbed since the last reset."""
+        return -self.camera.top
 
     def draw_world(self, surface: pygame.Surface) -> None:
-        surface.fill((135, 206, 235))
-        for platform in self.platforms:
-            platform.draw(surface)
-        self.powerups.draw(surface)
-        self.player.draw(surface)
+        surface.fill(SKY_COLOR)
+        alpha = self.render_alpha
+        camera = self.camera.lerp(self._prev_camera_top, alpha)
+        for platform in self.platform_life.active(camera):
+            platform.draw(surface, camera, alpha)
+        self.powerups.draw(surface, camera)
+        if self.effects is not None:
+            self.effects.draw(surface, camera, alpha)
+        if self.race is not None:
+            self.race.draw(surface, camera)
+        self.player.draw(surface, camera, alpha)
         self.ui.draw(surface, self.score, self.best_score)
 
     def _scroll_world(self) -> None:
-        if self.player.rect.top <= self.height // 2:
-            dy = self.height // 2 - self.player.rect.top
-            self.player.rect.top = self.height // 2
-            self.scroll_y += dy
+        # Keep the cat at or below the middle of the screen by raising the camera.
+        dy = self.camera.top + self.height // 2 - self.player.rect.top
+        if dy >= 0:
+            self.camera.top -= dy
             self.score += dy
-            for platform in self.platforms:
-                platform.rect.y += dy
-            self.powerups.scroll(dy)
-            self._spawn_platforms()
-
-        # Remove off-screen platforms
-        self.platforms = [p for p in self.platforms if p.rect.top < self.height]
-
-        if self.player.rect.top > self.height:
-            self.change_state(GameOverState(self, self.score))
-
-    def _spawn_platforms(self) -> None:
-        platform_module = __import__("purrfect_leap.platform", fromlist=["spawn_platform"])
-        while len(self.platforms) < 10:
-            y = min(p.rect.y for p in self.platforms) - platform_module.VERTICAL_GAP
-            self.platforms.append(platform_module.spawn_platform(y))
+            self._stream_level()
+
+        # Despawn what fell below the screen; power-ups once no live cat can touch them.
+        self.platform_life.despawn_from(self.camera.bottom)
+        self.powerups.recycle_below(self.camera.bottom + self.player.rect.height)
+        if self.effects is not None:
+            self.effects.cull(self.camera)
+
+        if self.player.rect.top > self.camera.bottom:
+            self.game_over = True
+            if self.replay_path is not None:
+                self.replay.save(self.replay_path)
+            if not self.headless:
+                self.change_state(GameOverState(self, self.score))
+
+    def _stream_level(self) -> None:
+        """Place streamed platforms and power-ups that came within ``LOOKAHEAD`` of the camera."""
+        horizon = self.camera.top - LOOKAHEAD
+        upcoming = self._upcoming
+        while True:
+            if not upcoming:
+                self._chunk = self.level.next_chunk()
+                upcoming.extend(self._chunk.platforms)
+            spec = upcoming[0]
+            if spec.y < horizon:
+                return
+            upcoming.popleft()
+            platform = place_platform(spec.x, spec.y, spec.width, spec.kind, self.headless, self.platform_pool)
+            self.platform_life.spawn(platform, spec.y)
+            if spec.powerup is not None:
+                self.powerups.spawn(spec.powerup.x, spec.powerup.y, spec.powerup.kind)
 
     def _handle_platform_collisions(self) -> None:
-        if self.player.vel_y >= 0:
-            for platform in self.platforms:
-                if (
-                    self.player.rect.bottom <= platform.rect.top + int(self.player.vel_y)
-                    and self.player.rect.bottom + int(self.player.vel_y) >= platform.rect.top
-                    and self.player.rect.centerx >= platform.rect.left
-                    and self.player.rect.centerx <= platform.rect.right
-                ):
-                    self.player.rect.bottom = platform.rect.top
-                    if not self.started:
-                        self.player.vel_y = 0
-                        return
-                    if platform.kind == "breakable":
-                        platform.broken = True
-                    if platform.kind == "boost":
-                        self.player.vel_y = JUMP_VELOCITY - 6
-                    else:
-                        self.player.vel_y = JUMP_VELOCITY
-                    return
+        cat = self.player
+        if cat.vel_y < 0:
+            return
+        rect = cat.rect
+        prev_x, prev_y = cat.swept_from()
+        half = rect.width // 2
+        prev_bottom = prev_y + rect.height
+        landed = None
+        first = math.inf
+        # Platforms only ever move down, so a top the feet crossed is now in this range.
+        # The earliest contact wins, then the topmost, as the index iterates top down.
+        for platform in self.platforms.between(prev_bottom, rect.bottom):
+            r = platform.rect
+            t = landing_time(
+                prev_bottom,
+                rect.bottom,
+                prev_x + half,
+                rect.centerx,
+                platform.prev_x,
+                r.x,
+                platform.prev_y,
+                r.y,
+                r.width,
+            )
+            if t is not None and t < first:
+                landed, first = platform, t
+        if landed is None:
+            return
+        rect.bottom = landed.rect.top
+        if not self.started:
+            cat.vel_y = 0
+            return
+        if self.effects is not None:
+            self.effects.spawn_dust(*rect.midbottom)
+        if landed.kind == "breakable":
+            landed.broken = True
+        if landed.kind == "boost":
+            cat.vel_y = self.tuning.spring_velocity
+        else:
+            cat.vel_y = self.tuning.jump_velocity
+
+    def entity_counts(self) -> dict[str, EntityCounts]:
+        """Live, on-camera, spawned, despawned and evicted counts after the latest tick."""
+        counts = {
+            "platforms": self.platform_life.counts(self.camera),
+            "powerups": self.powerups.life.counts(self.camera),
+        }
+        if self.effects is not None:
+            counts["particles"] = self.effects.counts(self.camera)
+        return counts
+
+    def allocation_stats(self) -> dict[str, dict[str, int]]:
+        """Pool counters; ``created`` should plateau once a session warms up."""
+        return {"platforms": self.platform_pool.stats(), "powerups": self.powerups.pool.stats()}
+
+    def advance(self, elapsed: float) -> int:
+        """Run the fixed ticks that ``elapsed`` seconds cover and return how many ran.
+
+        The remainder carries over to the next call and sets
+        :attr:`render_alpha`, how far the screen is between the last two ticks.
+        """
+        self._accumulator += elapsed
+        steps = 0
+        while self._accumulator >= SIM_STEP:
+            if steps == MAX_CATCH_UP_STEPS:
+                self._accumulator %= SIM_STEP
+                break
+            if self.state:
+                self.state.update()
+            self._accumulator -= SIM_STEP
+            steps += 1
+        self.render_alpha = self._accumulator / SIM_STEP
+        return steps
+
+    def _profiler_hotkey(self, key: int) -> None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        if key == pygame.K_F3:
+            self.profiler_overlay.toggle()
+            # Static screens are not redrawn in dirty-rect mode; force one so the panel disappears.
+            self._frozen_owner = None
+        elif key == pygame.K_F4:
+            path = f"frames-{stamp}.json"
+            self.profiler.export(path)
+            print(f"frame times written to {path}", file=sys.stderr)
+        elif key == pygame.K_F5:
+            path = f"frames-{stamp}.prof"
+            self.profiler.capture(self.CAPTURE_FRAMES, path)
+            print(f"profiling {self.CAPTURE_FRAMES} frames into {path}", file=sys.stderr)
 
     def run(self) -> None:
+        if self.headless:
+            raise RuntimeError("headless games are driven with step() or run_headless()")
         self.change_state(StartMenuState(self))
+        profiler = self.profiler
+        last = time.perf_counter()
         running = True
         while running:
+            if profiler is not None:
+                profiler.begin_frame()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif profiler is not None and event.type == pygame.KEYDOWN and event.key in (
+                    pygame.K_F3,
+                    pygame.K_F4,
+                    pygame.K_F5,
+                ):
+                    self._profiler_hotkey(event.key)
                 else:
                     if self.state:
                         self.state.handle_event(event)
+            if profiler is not None:
+                profiler.mark("events")
+            now = time.perf_counter()
+            self.advance(now - last)
+            last = now
+            if profiler is not None:
+                profiler.mark("update")
             if self.state:
-                self.state.update()
                 self.state.draw(self.screen)
-            pygame.display.flip()
-            self.clock.tick(60)
+            if self.profiler_overlay is not None:
+                self.profiler_overlay.draw(self.screen)
+            if profiler is not None:
+                profiler.mark("draw")
+            self.renderer.present()
+            if profiler is not None:
+                profiler.mark("flip")
+                profiler.end_frame()
+            self.clock.tick(self.fps)
+        if profiler is not None:
+            profiler.stop_capture()
+        self.level.close()
+        self.storage.close()
+        self.renderer.close()
         pygame.quit()
 
 
@@ -0,0 +1,45 @@
+"""Per-tick input snapshots decoupled from the pygame event loop."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pygame
+
+LEFT = 1
+RIGHT = 2
+START = 4
+
+
+@dataclass(frozen=True)
+class InputState:
+    """The controls held down during one simulation tick.
+
+    ``start`` launches the cat off the base platform if the run has not
+    started yet. Each state packs into a small bitmask for replays.
+    """
+
+    left: bool = False
+    right: bool = False
+    start: bool = False
+
+    @classmethod
+    def from_keys(cls, keys: pygame.key.ScancodeWrapper, start: bool = False) -> "InputState":
+        """Build an input state from ``pygame.key.get_pressed()``."""
+        return cls(
+            left=bool(keys[pygame.K_LEFT] or keys[pygame.K_a]),
+            right=bool(keys[pygame.K_RIGHT] or keys[pygame.K_d]),
+            start=start,
+        )
+
+    @property
+    def mask(self) -> int:
+        return (LEFT if self.left else 0) | (RIGHT if self.right else 0) | (START if self.start else 0)
+
+    @classmethod
+    def from_mask(cls, mask: int) -> "InputState":
+        return _BY_MASK[mask & (LEFT | RIGHT | START)]
+
+
+_BY_MASK = [InputState(bool(m & LEFT), bool(m & RIGHT), bool(m & START)) for m in range(8)]
+NO_INPUT = _BY_MASK[0]
@@ -0,0 +1,151 @@
+"""Chunked level generation, streamed ahead of the camera.
+
+A level is an endless sequence of :class:`Chunk` objects, each a
+precomputed stretch of platforms (and the power-ups above them) in world
+coordinates. :func:`generate_chunks` is a plain generator; a
+:class:`LevelStream` can instead run it on a background thread that keeps a
+bounded queue topped up, so generation never happens inside a frame. Both
+produce the same chunks for the same seed, and generation can resume after
+any chunk it produced (see :meth:`Game.snapshot`).
+"""
+
+from __future__ import annotations
+
+import queue
+import random
+import threading
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Iterator
+
+from .platform import PLATFORM_HEIGHT, PLATFORM_KINDS, PLATFORM_WIDTH
+from .powerups import POWERUP_KINDS
+from .tuning import Tuning
+
+WORLD_WIDTH = 480
+CHUNK_PLATFORMS = 8
+POWERUP_CHANCE = 0.25
+# Streamed content is placed once it is this far above the top of the screen.
+LOOKAHEAD = 200
+
+
+@dataclass(frozen=True, slots=True)
+class PowerUpSpec:
+    x: int
+    y: int
+    kind: str
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformSpec:
+    """One platform to place, with the power-up floating above it, if any."""
+
+    x: int
+    y: int
+    width: int
+    kind: str
+    powerup: PowerUpSpec | None = None
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """Consecutive platforms ordered bottom to top.
+
+    ``rng_state`` is the generator's random state right after this chunk, so
+    the chunks that follow it can be regenerated on demand.
+    """
+
+    index: int
+    platforms: tuple[PlatformSpec, ...]
+    rng_state: tuple | None = field(default=None, compare=False, repr=False)
+
+    @property
+    def top(self) -> int:
+        return self.platforms[-1].y
+
+
+def _platform(rng: random.Random, y: int, tuning: Tuning, powerups: bool) -> PlatformSpec:
+    kind = rng.choices(PLATFORM_KINDS, weights=tuning.kind_weights, k=1)[0]
+    x = rng.randint(0, WORLD_WIDTH - PLATFORM_WIDTH)
+    powerup = None
+    if powerups and rng.random() < POWERUP_CHANCE:
+        x_powerup = rng.randint(0, WORLD_WIDTH - 32)
+        powerup = PowerUpSpec(x_powerup, y - rng.randint(60, 120), rng.choice(POWERUP_KINDS))
+    return PlatformSpec(x, y, PLATFORM_WIDTH, kind, powerup)
+
+
+def opening_chunk(rng: random.Random, tuning: Tuning, screen_height: int) -> Chunk:
+    """The first two screens: a full-width base, then irregular gaps."""
+    base_top = screen_height - PLATFORM_HEIGHT
+    platforms = [PlatformSpec(0, base_top, WORLD_WIDTH, "normal")]
+    y = base_top - rng.randint(60, 120)
+    while y > -screen_height:
+        platforms.append(_platform(rng, y, tuning, powerups=False))
+        y -= rng.randint(60, 120)
+    return Chunk(0, tuple(platforms), rng.getstate())
+
+
+def climb_chunk(index: int, rng: random.Random, tuning: Tuning, below: int) -> Chunk:
+    """``CHUNK_PLATFORMS`` evenly spaced platforms above world y ``below``."""
+    gap = tuning.vertical_gap
+    ys = [below - gap * (i + 1) for i in range(CHUNK_PLATFORMS)]
+    platforms = tuple(_platform(rng, y, tuning, powerups=True) for y in ys)
+    return Chunk(index, platforms, rng.getstate())
+
+
+def generate_chunks(seed: int, tuning: Tuning, screen_height: int, after: Chunk | None = None) -> Iterator[Chunk]:
+    """Yield the level for ``seed`` forever, one chunk at a time.
+
+    With ``after`` (a chunk this generator produced for the same seed and
+    tuning) generation resumes with the chunk that followed it.
+    """
+    rng = random.Random(seed)
+    if after is None:
+        chunk = opening_chunk(rng, tuning, screen_height)
+    else:
+        rng.setstate(after.rng_state)
+        chunk = climb_chunk(after.index + 1, rng, tuning, after.top)
+    for index in count(chunk.index + 1):
+        yield chunk
+        chunk = climb_chunk(index, rng, tuning, chunk.top)
+
+
+class LevelStream:
+    """Hands out chunks in order, prefetched by a worker thread if asked.
+
+    With ``worker`` set a daemon thread keeps up to ``queue_size`` chunks
+    ready; :meth:`next_chunk` only blocks if the worker has fallen behind.
+    Call :meth:`close` to stop the worker.
+    """
+
+    def __init__(self, chunks: Iterator[Chunk], worker: bool = False, queue_size: int = 4) -> None:
+        self._chunks = chunks
+        self._queue: queue.Queue[Chunk] | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        if worker:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._thread = threading.Thread(target=self._fill, name="level-stream", daemon=True)
+            self._thread.start()
+
+    def _fill(self) -> None:
+        for chunk in self._chunks:
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(chunk, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if self._stop.is_set():
+                return
+
+    def next_chunk(self) -> Chunk:
+        if self._queue is None:
+            return next(self._chunks)
+        return self._queue.get()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,83 @@
+"""Spawn, cull and despawn bookkeeping shared by every entity type."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from .pool import Pool
+from .spatial import SpatialIndex
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class EntityCounts:
+    """One entity type's population after a tick.
+
+    ``live`` entities exist in the world, ``active`` ones overlap the
+    camera; ``spawned``, ``despawned`` and ``evicted`` (removed to respect
+    the cap) count what happened during the latest tick only.
+    """
+
+    live: int = 0
+    active: int = 0
+    spawned: int = 0
+    despawned: int = 0
+    evicted: int = 0
+
+
+class Lifecycle(Generic[T]):
+    """Lifecycle of entities kept in a :class:`SpatialIndex` keyed by their top.
+
+    An entity is *active* while it overlaps the camera, and only active
+    entities are updated and drawn. Entities above the camera are
+    *offscreen*: placed, but frozen until the camera reaches them. The
+    camera only rises, so whatever drops below the despawn line is returned
+    to the pool for good. At most ``cap`` entities are live; spawning past
+    that evicts the bottommost one, which is the closest to despawning.
+    """
+
+    def __init__(self, index: SpatialIndex[T], pool: Pool[T], cap: int, height: int) -> None:
+        self.index = index
+        self.pool = pool
+        self.cap = cap
+        # Tallest entity, so ones poking in from above still count as active.
+        self.height = height
+        self.spawned = 0
+        self.despawned = 0
+        self.evicted = 0
+
+    def begin_tick(self) -> None:
+        self.spawned = self.despawned = self.evicted = 0
+
+    def spawn(self, item: T, key: float) -> None:
+        if len(self.index) >= self.cap:
+            victim = self.index.last()
+            self.index.remove(victim)
+            self.pool.release(victim)
+            self.evicted += 1
+        self.index.add(item, key)
+        self.spawned += 1
+
+    def active(self, camera: "Camera") -> list[T]:
+        """Entities overlapping ``camera``, top to bottom."""
+        return self.index.between(camera.top - self.height + 1, camera.bottom - 1)
+
+    def despawn(self, item: T) -> None:
+        self.index.remove(item)
+        self.pool.release(item)
+        self.despawned += 1
+
+    def despawn_from(self, y: float) -> None:
+        """Despawn every entity whose top is at or below world y ``y``."""
+        removed = self.index.pop_from(y)
+        self.pool.release_all(removed)
+        self.despawned += len(removed)
+
+    def clear(self) -> None:
+        self.pool.release_all(self.index)
+        self.index.clear()
+
+    def counts(self, camera: "Camera") -> EntityCounts:
+        return EntityCounts(len(self.index), len(self.active(camera)), self.spawned, self.despawned, self.evicted)
@@ -2,13 +2,95 @@
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import sys
+import time
+
+from .assets import get_registry
+from .audio import MixerSettings
 from .gamestate import Game
+from .net import RaceClient, RaceServer
+from .render import BACKENDS
+from .replay import Replay, ReplayPlayer
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Start the game, or run a headless soak when ``--headless`` is given."""
+    parser = argparse.ArgumentParser(description="Purr-fect Leap")
+    parser.add_argument("--headless", action="store_true", help="simulate without a window or audio")
+    parser.add_argument("--ticks", type=int, default=100_000, help="tick budget for headless runs")
+    parser.add_argument("--dirty-rects", action="store_true", help="only update changed screen regions")
+    parser.add_argument("--renderer", choices=BACKENDS, default="software", help="drawing backend")
+    parser.add_argument("--scale", type=float, default=1.0, help="window size relative to the 480x800 game")
+    parser.add_argument("--asset-timings", action="store_true", help="load every asset up front and print the load times")
+    parser.add_argument(
+        "--profile", action="store_true", help="time each frame phase (F3 overlay, F4 export, F5 cProfile)"
+    )
+    parser.add_argument("--fps", type=int, default=60, help="render rate cap, 0 for uncapped")
+    parser.add_argument(
+        "--level-worker", action="store_true", help="generate level chunks on a background thread"
+    )
+    parser.add_argument("--audio-buffer", type=int, default=256, help="mixer buffer in samples, lower is snappier")
+    parser.add_argument("--seed", type=int, help="seed for the first run")
+    parser.add_argument("--record", metavar="PATH", help="save a replay of the latest run when it ends")
+    parser.add_argument("--replay", metavar="PATH", help="re-simulate a recorded replay and print its score")
+    parser.add_argument("--serve", type=int, metavar="PORT", help="host a ghost race on PORT instead of playing")
+    parser.add_argument("--race", metavar="HOST:PORT", help="join the ghost race hosted at HOST:PORT")
+    parser.add_argument("--net-rate", type=int, default=20, help="race state updates per second when hosting")
+    args = parser.parse_args(argv)
+
+    if args.serve is not None:
+        seed = args.seed if args.seed is not None else int(time.time())
+        server = RaceServer(seed, args.net_rate, host="0.0.0.0", port=args.serve)
+        print(f"hosting seed {seed} on port {args.serve}")
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if args.replay:
+        replay = Replay.load(args.replay)
+        game = ReplayPlayer(replay).play()
+        print(f"seed {replay.seed}: {replay.ticks} ticks, score {game.score}")
+        return
 
+    if not args.headless:
+        race = None
+        if args.race:
+            host, _, port = args.race.rpartition(":")
+            race = RaceClient(host or "localhost", int(port)).connect()
+        game = Game(
+            dirty_rects=args.dirty_rects,
+            backend=args.renderer,
+            window_size=(round(480 * args.scale), round(800 * args.scale)) if args.scale != 1 else None,
+            seed=args.seed,
+            replay_path=args.record,
+            profile=args.profile,
+            fps=args.fps,
+            level_worker=args.level_worker,
+            mixer=MixerSettings(buffer=args.audio_buffer),
+            race=race,
+        )
+        if args.asset_timings:
+            get_registry().preload()
+            print(get_registry().report(), file=sys.stderr)
+        game.run()
+        if race is not None:
+            race.close()
+        return
 
-def main() -> None:
-    """Start the game."""
-    game = Game()
-    game.run()
+    game = Game(headless=True, seed=args.seed)
+    remaining = args.ticks
+    runs = 0
+    start = time.perf_counter()
+    while remaining > 0:
+        remaining -= game.run_headless(remaining)
+        runs += 1
+        game.reset()
+    elapsed = time.perf_counter() - start
+    print(f"{args.ticks} ticks over {runs} runs in {elapsed:.2f}s ({args.ticks / elapsed:.0f} ticks/s)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,215 @@
+"""Monte Carlo runner that plays many seeded headless games across all cores.
+
+Example::
+
+    python -m purrfect_leap.montecarlo --runs 200 --gravity 0.4 0.45 0.5 \\
+        --vertical-gap 90 110 --policy random --output runs.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Iterable, Iterator
+
+from .gamestate import Game
+from .inputs import NO_INPUT, InputState
+from .platform import KIND_WEIGHTS
+from .tuning import Tuning
+
+POLICIES = ("idle", "zigzag", "random")
+
+
+@dataclass(frozen=True)
+class RunSpec:
+    """One seeded run of one tuning configuration."""
+
+    config: int
+    seed: int
+    tuning: Tuning
+    policy: str
+    max_ticks: int
+
+
+@dataclass
+class RunResult:
+    """The outcome of a single run."""
+
+    config: int
+    seed: int
+    score: int
+    height: int
+    ticks: int
+    cause: str
+
+
+@dataclass
+class ConfigSummary:
+    """Running totals for one tuning configuration."""
+
+    tuning: Tuning
+    scores: list[int] = field(default_factory=list)
+    heights: list[int] = field(default_factory=list)
+    causes: Counter = field(default_factory=Counter)
+
+    def add(self, result: RunResult) -> None:
+        self.scores.append(result.score)
+        self.heights.append(result.height)
+        self.causes[result.cause] += 1
+
+    def describe(self) -> str:
+        t = self.tuning
+        if not self.scores:
+            return f"g={t.gravity} jump={t.jump_velocity} gap={t.vertical_gap}: no runs"
+        causes = ", ".join(f"{k}={v}" for k, v in sorted(self.causes.items()))
+        return (
+            f"g={t.gravity} jump={t.jump_velocity} gap={t.vertical_gap} "
+            f"weights={list(t.kind_weights)}: runs={len(self.scores)} "
+            f"score mean={statistics.fmean(self.scores):.0f} "
+            f"median={statistics.median(self.scores):.0f} max={max(self.scores)} "
+            f"height mean={statistics.fmean(self.heights):.0f} [{causes}]"
+        )
+
+
+def make_policy(name: str, seed: int) -> Callable[[Game], InputState]:
+    """Return an input policy; ``random`` holds each choice for a few ticks."""
+    if name == "idle":
+        return lambda game: NO_INPUT
+    if name == "zigzag":
+        left, right = InputState(left=True), InputState(right=True)
+        ticks = itertools.count()
+        return lambda game: left if next(ticks) % 80 < 40 else right
+    if name == "random":
+        rng = random.Random(seed ^ 0x5EED)
+        choices = (NO_INPUT, InputState(left=True), InputState(right=True))
+        state = {"controls": NO_INPUT, "hold": 0}
+
+        def policy(game: Game) -> InputState:
+            if state["hold"] <= 0:
+                state["controls"] = rng.choice(choices)
+                state["hold"] = rng.randint(5, 30)
+            state["hold"] -= 1
+            return state["controls"]
+
+        return policy
+    raise ValueError(f"unknown policy {name!r}")
+
+
+def play(spec: RunSpec) -> RunResult:
+    """Play one run headlessly; executed inside the worker processes."""
+    game = Game(headless=True, tuning=spec.tuning, seed=spec.seed)
+    policy = make_policy(spec.policy, spec.seed)
+    start_top = game.player.rect.top
+    height = 0
+    game.start()
+    ticks = 0
+    while ticks < spec.max_ticks and game.step(policy(game)):
+        ticks += 1
+        height = max(height, start_top - game.player.rect.top)
+    cause = "fell" if game.game_over else "timeout"
+    return RunResult(spec.config, spec.seed, game.score, height, ticks, cause)
+
+
+def _play_chunk(specs: list[RunSpec]) -> list[RunResult]:
+    return [play(spec) for spec in specs]
+
+
+def chunked(items: Iterable[RunSpec], size: int) -> Iterator[list[RunSpec]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def build_configs(args: argparse.Namespace) -> list[Tuning]:
+    weights = args.weights or [KIND_WEIGHTS]
+    return [
+        Tuning(gravity=g, jump_velocity=j, vertical_gap=gap, kind_weights=tuple(w))
+        for g, j, gap, w in itertools.product(args.gravity, args.jump_velocity, args.vertical_gap, weights)
+    ]
+
+
+def iter_specs(configs: list[Tuning], runs: int, base_seed: int, policy: str, max_ticks: int) -> Iterator[RunSpec]:
+    for index, tuning in enumerate(configs):
+        for n in range(runs):
+            yield RunSpec(index, base_seed + n, tuning, policy, max_ticks)
+
+
+def run_all(
+    specs: Iterable[RunSpec],
+    workers: int,
+    chunksize: int,
+    on_result: Callable[[RunResult], None],
+) -> None:
+    """Distribute ``specs`` in chunks over a process pool, streaming results back."""
+    if workers <= 1:
+        for spec in specs:
+            on_result(play(spec))
+        return
+    with multiprocessing.Pool(workers) as pool:
+        for results in pool.imap_unordered(_play_chunk, chunked(specs, chunksize)):
+            for result in results:
+                on_result(result)
+
+
+def _parse_weights(text: str) -> tuple[float, ...]:
+    weights = tuple(float(w) for w in text.split(","))
+    if len(weights) != len(KIND_WEIGHTS):
+        raise argparse.ArgumentTypeError(f"expected {len(KIND_WEIGHTS)} comma-separated weights")
+    return weights
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Monte Carlo tuning runs for Purr-fect Leap")
+    parser.add_argument("--runs", type=int, default=100, help="seeded runs per configuration")
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--gravity", type=float, nargs="+", default=[Tuning.gravity])
+    parser.add_argument("--jump-velocity", type=float, nargs="+", default=[Tuning.jump_velocity])
+    parser.add_argument("--vertical-gap", type=int, nargs="+", default=[Tuning.vertical_gap])
+    parser.add_argument(
+        "--weights",
+        type=_parse_weights,
+        nargs="+",
+        help="platform kind weights as normal,moving,breakable,boost",
+    )
+    parser.add_argument("--policy", choices=POLICIES, default="random")
+    parser.add_argument("--max-ticks", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int, default=8, help="runs per work item")
+    parser.add_argument("--output", help="write one JSON line per run to this file")
+    args = parser.parse_args(argv)
+
+    configs = build_configs(args)
+    summaries = [ConfigSummary(t) for t in configs]
+    total = len(configs) * args.runs
+    out = open(args.output, "w", encoding="utf-8") if args.output else None
+    done = 0
+
+    def on_result(result: RunResult) -> None:
+        nonlocal done
+        done += 1
+        summaries[result.config].add(result)
+        if out is not None:
+            out.write(json.dumps(asdict(result)) + "\n")
+        if done % max(1, total // 20) == 0 or done == total:
+            print(f"{done}/{total} runs", file=sys.stderr)
+
+    try:
+        specs = iter_specs(configs, args.runs, args.seed, args.policy, args.max_ticks)
+        run_all(specs, args.workers, args.chunksize, on_result)
+    finally:
+        if out is not None:
+            out.close()
+    for summary in summaries:
+        print(summary.describe())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,452 @@
+"""Ghost races: players share one seeded level and see each other's cats.
+
+A :class:`RaceServer` hands every client the race seed and relays cat
+states between them; a :class:`RaceClient` runs its connection on a
+background thread with its own asyncio loop, so the game thread only ever
+swaps in its latest state (:meth:`RaceClient.publish`) and reads
+interpolated ghosts (:meth:`RaceClient.draw`).
+
+Messages are ``u16`` length-prefixed. A cat state is five quantized
+fields -- tick, x, y, vertical velocity in 1/``VELOCITY_SCALE`` px/tick and
+rocket ticks left -- sent as a bitmask of the fields that changed followed
+by their zigzag varint deltas. The connection is TCP, so deltas can never
+be lost or reordered. The server coalesces: each tick it encodes every
+other player's latest state against what that receiver last got, and skips
+receivers whose socket buffer is backed up, so downstream bandwidth is at
+most ``tick_rate * (players - 1) * MAX_GHOST_BYTES`` bytes per second.
+
+Example::
+
+    python -m purrfect_leap.main --serve 7777 --seed 42
+    python -m purrfect_leap.main --race localhost:7777
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+import threading
+import time
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass
+
+import pygame
+
+from .assets import get_registry
+from .player import COLLISION_SIZE
+from .replay import read_varint, write_varint
+
+WELCOME = 1
+STATE = 2
+GHOST = 3
+LEAVE = 4
+
+VELOCITY_SCALE = 8
+FIELDS = 5
+# Mask byte plus a worst-case 10-byte varint per field.
+MAX_STATE_BYTES = 1 + 10 * FIELDS
+# Length prefix, message type and a player id below 128.
+MAX_GHOST_BYTES = 2 + 1 + 1 + MAX_STATE_BYTES
+# Stop sending to a receiver while this much is still queued for it.
+HIGH_WATER = 16 * 1024
+GHOST_ALPHA = 110
+SAMPLES_KEPT = 32
+SIM_RATE = 60
+
+
+class ProtocolError(ValueError):
+    """Raised when a peer sends a malformed message."""
+
+
+@dataclass(frozen=True, slots=True)
+class CatState:
+    """A cat as seen by other players, already quantized."""
+
+    tick: int
+    x: int
+    y: int
+    vel: int
+    rocket: int
+
+    @classmethod
+    def of(cls, tick: int, cat: "Cat") -> "CatState":
+        return cls(tick, cat.rect.x, cat.rect.y, round(cat.vel_y * VELOCITY_SCALE), cat.rocket_time)
+
+    @property
+    def vel_y(self) -> float:
+        return self.vel / VELOCITY_SCALE
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+class StateEncoder:
+    """Delta-encodes successive states of one cat for one receiver."""
+
+    def __init__(self) -> None:
+        self.last = (0,) * FIELDS
+
+    def encode(self, state: CatState) -> bytes | None:
+        """The delta from the previous state, or ``None`` if nothing changed."""
+        values = (state.tick, state.x, state.y, state.vel, state.rocket)
+        out = bytearray(1)
+        mask = 0
+        for i, (value, last) in enumerate(zip(values, self.last)):
+            if value != last:
+                mask |= 1 << i
+                write_varint(out, _zigzag(value - last))
+        if not mask:
+            return None
+        out[0] = mask
+        self.last = values
+        return bytes(out)
+
+
+class StateDecoder:
+    """Applies the deltas produced by a :class:`StateEncoder`."""
+
+    def __init__(self) -> None:
+        self.last = (0,) * FIELDS
+
+    def decode(self, data: bytes, pos: int = 0) -> tuple[CatState, int]:
+        """Decode one state at ``data[pos:]``; return it and the position after it."""
+        if pos >= len(data):
+            raise ProtocolError("missing state")
+        mask = data[pos]
+        pos += 1
+        values = list(self.last)
+        try:
+            for i in range(FIELDS):
+                if mask & 1 << i:
+                    delta, pos = read_varint(data, pos)
+                    values[i] += _unzigzag(delta)
+        except ValueError as exc:
+            raise ProtocolError("truncated state") from exc
+        self.last = tuple(values)
+        return CatState(*values), pos
+
+
+def _frame(kind: int, body: bytes) -> bytes:
+    return struct.pack("<H", len(body) + 1) + bytes([kind]) + body
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    (length,) = struct.unpack("<H", await reader.readexactly(2))
+    if length == 0:
+        raise ProtocolError("empty message")
+    payload = await reader.readexactly(length)
+    return payload[0], payload[1:]
+
+
+def bandwidth_bound(tick_rate: int, players: int) -> int:
+    """Most bytes per second the server sends one client in a race of ``players``."""
+    return tick_rate * (players - 1) * MAX_GHOST_BYTES
+
+
+class _Peer:
+    def __init__(self, player: int, writer: asyncio.StreamWriter) -> None:
+        self.player = player
+        self.writer = writer
+        self.decoder = StateDecoder()
+        self.state: CatState | None = None
+        # One encoder per other player whose ghost this peer receives.
+        self.encoders: dict[int, StateEncoder] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+
+class RaceServer:
+    """Relays cat states between every connected player at ``tick_rate`` Hz."""
+
+    def __init__(self, seed: int, tick_rate: int = 20, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.host = host
+        self.port = port
+        self.peers: dict[int, _Peer] = {}
+        self._next_player = 1
+        self._server: asyncio.base_events.Server | None = None
+        self._broadcaster: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    async def start(self) -> int:
+        """Start listening and return the port."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._broadcaster = asyncio.create_task(self._broadcast())
+        return self.port
+
+    async def close(self) -> None:
+        self._broadcaster.cancel()
+        self._server.close()
+        for peer in list(self.peers.values()):
+            peer.writer.close()
+        await self._server.wait_closed()
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    def start_thread(self) -> int:
+        """Run the server on a daemon thread, e.g. for a localhost race; return the port."""
+        ready = threading.Event()
+
+        def main() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.start())
+            ready.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.close())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=main, name="race-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.port
+
+    def stop_thread(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer = _Peer(self._next_player, writer)
+        self._next_player += 1
+        self.peers[peer.player] = peer
+        welcome = bytearray()
+        write_varint(welcome, peer.player)
+        welcome += struct.pack("<Q", self.seed)
+        write_varint(welcome, self.tick_rate)
+        self._send(peer, _frame(WELCOME, bytes(welcome)))
+        try:
+            while True:
+                kind, body = await _read_frame(reader)
+                peer.bytes_in += len(body) + 3
+                if kind != STATE:
+                    raise ProtocolError(f"unexpected message type {kind}")
+                peer.state, _ = peer.decoder.decode(body)
+        except (asyncio.IncompleteReadError, ConnectionError, ProtocolError):
+            pass
+        finally:
+            del self.peers[peer.player]
+            writer.close()
+            leave = bytearray()
+            write_varint(leave, peer.player)
+            for other in self.peers.values():
+                other.encoders.pop(peer.player, None)
+                self._send(other, _frame(LEAVE, bytes(leave)))
+
+    def _send(self, peer: _Peer, data: bytes) -> None:
+        peer.writer.write(data)
+        peer.bytes_out += len(data)
+
+    async def _broadcast(self) -> None:
+        while True:
+            await asyncio.sleep(1 / self.tick_rate)
+            for peer in list(self.peers.values()):
+                if peer.writer.transport.get_write_buffer_size() > HIGH_WATER:
+                    # Deltas are against what was sent, so skipping a tick is safe.
+                    continue
+                out = bytearray()
+                for other in list(self.peers.values()):
+                    if other is peer or other.state is None:
+                        continue
+                    delta = peer.encoders.setdefault(other.player, StateEncoder()).encode(other.state)
+                    if delta is not None:
+                        body = bytearray()
+                        write_varint(body, other.player)
+                        out += _frame(GHOST, bytes(body) + delta)
+                if out:
+                    self._send(peer, bytes(out))
+
+
+class GhostTrack:
+    """Buffered states of one remote cat, replayed a little behind real time."""
+
+    def __init__(self) -> None:
+        self.samples: deque[CatState] = deque(maxlen=SAMPLES_KEPT)
+        self.received_at = 0.0
+
+    def add(self, state: CatState, now: float) -> None:
+        if self.samples and state.tick < self.samples[-1].tick:
+            # The other player started a new run.
+            self.samples.clear()
+        self.samples.append(state)
+        self.received_at = now
+
+
+def interpolate(
+    samples: list[CatState], received_at: float, now: float, delay_ticks: float
+) -> tuple[float, float, int] | None:
+    """Where a remote cat was ``delay_ticks`` behind its clock at ``now``, from a copy of its samples."""
+    if not samples:
+        return None
+    latest = samples[-1]
+    # Extrapolate the remote clock by at most the delay, so a stalled peer stops.
+    elapsed = min((now - received_at) * SIM_RATE, delay_ticks)
+    tick = latest.tick + elapsed - delay_ticks
+    i = bisect_right(samples, tick, key=lambda s: s.tick)
+    if i == 0:
+        first = samples[0]
+        return first.x, first.y, first.rocket
+    if i == len(samples):
+        return latest.x, latest.y, latest.rocket
+    a, b = samples[i - 1], samples[i]
+    t = (tick - a.tick) / (b.tick - a.tick)
+    return a.x + (b.x - a.x) * t, a.y + (b.y - a.y) * t, a.rocket
+
+
+class RaceClient:
+    """One player's connection, serviced on a background thread.
+
+    :meth:`connect` blocks until the server's welcome arrives (call it
+    before the game starts); afterwards :meth:`publish` and :meth:`draw`
+    only touch in-memory state and never wait on the network.
+    """
+
+    def __init__(self, host: str, port: int, delay_ticks: float | None = None) -> None:
+        self.host = host
+        self.port = port
+        self.player = 0
+        self.seed = 0
+        self.tick_rate = 0
+        self.delay_ticks = delay_ticks
+        self.tracks: dict[int, GhostTrack] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self._started_at = 0.0
+        self._latest: CatState | None = None
+        self._lock = threading.Lock()
+        self._welcome = threading.Event()
+        self._error: BaseException | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop: asyncio.Event | None = None
+        self._thread: threading.Thread | None = None
+        self._images: list[pygame.Surface] = []
+
+    def connect(self, timeout: float = 5.0) -> "RaceClient":
+        self._thread = threading.Thread(target=self._run, name="race-client", daemon=True)
+        self._thread.start()
+        if not self._welcome.wait(timeout) or self._error is not None:
+            raise ConnectionError(f"could not join the race at {self.host}:{self.port}") from self._error
+        if self.delay_ticks is None:
+            # Two network ticks behind keeps a sample on either side despite jitter.
+            self.delay_ticks = 2 * SIM_RATE / self.tick_rate
+        return self
+
+    def close(self) -> None:
+        if self._thread is None:
+            return
+        if self._loop is not None and self._thread.is_alive():
+            try:
+                self._loop.call_soon_threadsafe(self._stop.set)
+            except RuntimeError:
+                # The server hung up first and the loop has already closed.
+                pass
+        self._thread.join()
+        self._thread = None
+
+    def publish(self, tick: int, cat: "Cat") -> None:
+        """Offer the local cat's state; only the latest is sent at each network tick."""
+        self._latest = CatState.of(tick, cat)
+
+    def ghosts(self, now: float | None = None) -> dict[int, tuple[float, float, int]]:
+        """Interpolated ``(x, y, rocket ticks)`` of every remote cat, in world coordinates."""
+        now = time.perf_counter() if now is None else now
+        # Copy the samples under the lock; the network thread may clear a track at any time.
+        with self._lock:
+            tracks = [(player, list(track.samples), track.received_at) for player, track in self.tracks.items()]
+        out = {}
+        for player, samples, received_at in tracks:
+            position = interpolate(samples, received_at, now, self.delay_ticks)
+            if position is not None:
+                out[player] = position
+        return out
+
+    def bandwidth(self) -> tuple[float, float]:
+        """Bytes per second sent and received since connecting."""
+        elapsed = max(time.perf_counter() - self._started_at, 1e-9)
+        return self.bytes_sent / elapsed, self.bytes_received / elapsed
+
+    def draw(self, surface: pygame.Surface, camera: "Camera") -> None:
+        if not self._images:
+            registry = get_registry()
+            for name in ("cat_walk_0", "cat_rocket_0"):
+                image = registry.image(name).copy()
+                image.set_alpha(GHOST_ALPHA)
+                self._images.append(image)
+        for x, y, rocket in self.ghosts().values():
+            image = self._images[1 if rocket > 0 else 0]
+            # States carry the collision rect's corner; sprites are centred on it like Cat.draw.
+            half = COLLISION_SIZE // 2
+            rect = image.get_rect(center=(round(x) + half, round(camera.screen_y(y)) + half))
+            surface.blit(image, rect)
+
+    # Network thread
+    def _run(self) -> None:
+        try:
+            asyncio.run(self._main())
+        except BaseException as exc:  # surfaced to connect(); the game keeps running without ghosts
+            self._error = exc
+            self._welcome.set()
+
+    async def _main(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        kind, body = await _read_frame(reader)
+        if kind != WELCOME:
+            raise ProtocolError("expected a welcome message")
+        self.bytes_received += len(body) + 3
+        self.player, pos = read_varint(body, 0)
+        (self.seed,) = struct.unpack_from("<Q", body, pos)
+        self.tick_rate, _ = read_varint(body, pos + 8)
+        self._started_at = time.perf_counter()
+        self._welcome.set()
+        tasks = [asyncio.create_task(self._receive(reader)), asyncio.create_task(self._send(writer))]
+        await self._stop.wait()
+        for task in tasks:
+            task.cancel()
+        writer.close()
+
+    async def _receive(self, reader: asyncio.StreamReader) -> None:
+        decoders: dict[int, StateDecoder] = {}
+        try:
+            while True:
+                kind, body = await _read_frame(reader)
+                self.bytes_received += len(body) + 3
+                player, pos = read_varint(body, 0)
+                if kind == GHOST:
+                    state, _ = decoders.setdefault(player, StateDecoder()).decode(body, pos)
+                    with self._lock:
+                        self.tracks.setdefault(player, GhostTrack()).add(state, time.perf_counter())
+                elif kind == LEAVE:
+                    decoders.pop(player, None)
+                    with self._lock:
+                        self.tracks.pop(player, None)
+        except (asyncio.IncompleteReadError, ConnectionError, ProtocolError):
+            self._stop.set()
+
+    async def _send(self, writer: asyncio.StreamWriter) -> None:
+        encoder = StateEncoder()
+        while True:
+            await asyncio.sleep(1 / self.tick_rate)
+            state = self._latest
+            if state is None:
+                continue
+            delta = encoder.encode(state)
+            if delta is None:
+                continue
+            data = _frame(STATE, delta)
+            writer.write(data)
+            self.bytes_sent += len(data)
+            await writer.drain()
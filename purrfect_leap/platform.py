@@ -3,89 +3,118 @@
 from __future__ import annotations
 
 import math
-import random
 from dataclasses import dataclass
-from pathlib import Path
 
 import pygame
 
-ASSET_DIR = Path(__file__).resolve().parent / "assets"
+from .assets import get_registry
+from .pool import Pool
+
 PLATFORM_WIDTH = 72
 PLATFORM_HEIGHT = 18
 VERTICAL_GAP = 100
 AMPLITUDE = 50
+PLATFORM_KINDS = ("normal", "moving", "breakable", "boost")
+KIND_WEIGHTS = (70, 15, 10, 5)
 
 
-@dataclass
+@dataclass(slots=True)
 class Platform:
-    """Represents a platform in the game world."""
+    """Represents a platform in the game world.
+
+    Platforms are recycled through a :class:`~purrfect_leap.pool.Pool`;
+    :meth:`respawn` reinitializes one in place, reusing its rect.
+    """
 
-    image: pygame.Surface
+    image: pygame.Surface | None
     rect: pygame.Rect
     kind: str = "normal"
     broken: bool = False
     phase: float = 0.0
     start_x: int = 0
+    # Position before the latest update, for render interpolation.
+    prev_x: int = 0
+    prev_y: int = 0
 
     def __post_init__(self) -> None:
-        self.start_x = self.rect.x
+        self.start_x = self.prev_x = self.rect.x
+        self.prev_y = self.rect.y
+
+    @classmethod
+    def blank(cls) -> "Platform":
+        return cls(image=None, rect=pygame.Rect(0, 0, 0, 0))
+
+    def respawn(self, image: pygame.Surface | None, x: int, y: int, width: int, kind: str) -> None:
+        self.image = image
+        self.rect.update(x, y, width, PLATFORM_HEIGHT)
+        self.kind = kind
+        self.broken = False
+        self.phase = 0.0
+        self.start_x = self.prev_x = x
+        self.prev_y = y
+
+    def get_state(self) -> tuple:
+        """Plain values from which :func:`restore_platform` rebuilds this platform."""
+        r = self.rect
+        return (r.x, r.y, r.width, self.kind, self.broken, self.phase, self.start_x, self.prev_x, self.prev_y)
 
     def update(self) -> None:
         if self.kind == "moving":
+            self.prev_x = self.rect.x
             self.phase += 0.05
             self.rect.x = self.start_x + int(AMPLITUDE * math.sin(self.phase))
         if self.kind == "breakable" and self.broken:
+            self.prev_y = self.rect.y
             self.rect.y += 5
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.blit(self.image, self.rect)
-
-
-def load_platform_images() -> dict[str, pygame.Surface]:
-    return {
-        "normal": pygame.image.load(ASSET_DIR / "sprites" / "platform_normal.png").convert_alpha(),
-        "breakable": pygame.image.load(ASSET_DIR / "sprites" / "platform_break.png").convert_alpha(),
-        "boost": pygame.image.load(ASSET_DIR / "sprites" / "spring.png").convert_alpha(),
-    }
-
-
-IMAGES = None
-
-
-def get_images() -> dict[str, pygame.Surface]:
-    global IMAGES
-    if IMAGES is None:
-        IMAGES = load_platform_images()
-    return IMAGES
-
-
-def spawn_platform(y: int) -> Platform:
-    images = get_images()
-    kind = random.choices(
-        ["normal", "moving", "breakable", "boost"],
-        weights=[70, 15, 10, 5],
-        k=1,
-    )[0]
-    x = random.randint(0, 480 - PLATFORM_WIDTH)
-    rect = pygame.Rect(x, y, PLATFORM_WIDTH, PLATFORM_HEIGHT)
-    if kind == "boost":
-        image = images["boost"]
-    elif kind == "breakable":
-        image = images["breakable"]
-    else:
-        image = images["normal"]
-    return Platform(image=image, rect=rect, kind=kind)
-
-
-def generate_platforms(screen_height: int) -> list[Platform]:
-    """Generate an initial list of platforms including a base platform."""
-    images = get_images()
-    base_img = pygame.transform.scale(images["normal"], (480, PLATFORM_HEIGHT))
-    base_rect = pygame.Rect(0, screen_height - PLATFORM_HEIGHT, 480, PLATFORM_HEIGHT)
-    platforms = [Platform(image=base_img, rect=base_rect, kind="normal")]
-    y = base_rect.top - random.randint(60, 120)
-    while y > -screen_height:
-        platforms.append(spawn_platform(y))
-        y -= random.randint(60, 120)
-    return platforms
-
+    def draw(self, surface: pygame.Surface, camera: "Camera", alpha: float = 1.0) -> None:
+        rect = camera.to_screen(self.rect)
+        if alpha < 1:
+            lag = 1 - alpha
+            rect.move_ip(round((self.prev_x - self.rect.x) * lag), round((self.prev_y - self.rect.y) * lag))
+        surface.blit(self.image, rect)
+
+
+SPRITE_NAMES = {
+    "normal": "platform_normal",
+    "moving": "platform_normal",
+    "breakable": "platform_break",
+    "boost": "spring",
+}
+
+
+def _acquire(pool: Pool[Platform] | None) -> Platform:
+    return pool.acquire() if pool is not None else Platform.blank()
+
+
+def place_platform(
+    x: int,
+    y: int,
+    width: int,
+    kind: str,
+    headless: bool = False,
+    pool: Pool[Platform] | None = None,
+) -> Platform:
+    """Build a platform at a known position, e.g. from a streamed level chunk."""
+    image = None
+    if not headless:
+        registry = get_registry()
+        if width == PLATFORM_WIDTH:
+            image = registry.image(SPRITE_NAMES[kind])
+        else:
+            image = registry.scaled(SPRITE_NAMES[kind], (width, PLATFORM_HEIGHT))
+    platform = _acquire(pool)
+    platform.respawn(image, x, y, width, kind)
+    return platform
+
+
+def restore_platform(state: tuple, headless: bool = False, pool: Pool[Platform] | None = None) -> Platform:
+    """Rebuild a platform from :meth:`Platform.get_state`."""
+    x, y, width, kind, broken, phase, start_x, prev_x, prev_y = state
+    platform = place_platform(x, y, width, kind, headless, pool)
+    platform.broken = broken
+    platform.phase = phase
+    platform.start_x = start_x
+    platform.prev_x = prev_x
+    platform.prev_y = prev_y
+    return platform
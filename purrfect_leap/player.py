@@ -2,61 +2,90 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pygame
 
+from .assets import get_registry
+from .inputs import InputState
+
 GRAVITY = 0.45
 JUMP_VELOCITY = -12
 BOOST_VELOCITY = -20
+SPRING_VELOCITY = JUMP_VELOCITY - 6
+ROCKET_TICKS = 180  # 3 seconds at 60fps
 
 CAT_SIZE = 40
 COLLISION_SIZE = 32
 MOVE_SPEED = 5
-ASSET_DIR = Path(__file__).resolve().parent / "assets"
 
 
 class Cat:
     """Represents the cat controlled by the player."""
 
-    def __init__(self, x: int, y: int) -> None:
-        self.images = [
-            pygame.image.load(ASSET_DIR / "sprites" / f"cat_walk_{i}.png").convert_alpha()
-            for i in range(4)
-        ]
-        self.rocket_images = [
-            pygame.image.load(ASSET_DIR / "sprites" / f"cat_rocket_{i}.png").convert_alpha()
-            for i in range(2)
-        ]
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        headless: bool = False,
+        gravity: float = GRAVITY,
+        jump_velocity: float = JUMP_VELOCITY,
+    ) -> None:
+        self.images: list[pygame.Surface] = []
+        self.rocket_images: list[pygame.Surface] = []
+        if not headless:
+            registry = get_registry()
+            self.images = [registry.image(f"cat_walk_{i}") for i in range(4)]
+            self.rocket_images = [registry.image(f"cat_rocket_{i}") for i in range(2)]
         self.frame = 0
         self.rect = pygame.Rect(0, 0, COLLISION_SIZE, COLLISION_SIZE)
         self.rect.center = (x, y)
+        # Position before the latest update, for render interpolation.
+        self.prev_x, self.prev_y = self.rect.topleft
         self.vel_y = 0.0
         self.rocket_time = 0
         self.started = False
+        self.gravity = gravity
+        self.jump_velocity = jump_velocity
+
+    def get_state(self) -> tuple:
+        """Position, motion and animation as plain values, for snapshots."""
+        return (self.rect.x, self.rect.y, self.prev_x, self.prev_y, self.vel_y, self.rocket_time, self.frame)
+
+    def set_state(self, state: tuple) -> None:
+        self.rect.x, self.rect.y, self.prev_x, self.prev_y, self.vel_y, self.rocket_time, self.frame = state
+
+    def swept_from(self) -> tuple[int, int]:
+        """Where this tick's straight-line motion started, for swept collisions.
+
+        A wrap across the screen edge is not motion, so then only the
+        vertical part counts.
+        """
+        x = self.prev_x if abs(self.prev_x - self.rect.x) < CAT_SIZE else self.rect.x
+        return x, self.prev_y
 
-    def jump(self) -> None:
+    def jump(self) -> bool:
+        """Start a jump; return whether it happened so the caller can play audio."""
         if self.vel_y > 0:
-            return
-        self.vel_y = JUMP_VELOCITY
-        pygame.mixer.Sound(ASSET_DIR / "sounds" / "jump.wav").play()
+            return False
+        self.vel_y = self.jump_velocity
+        return True
 
     def apply_rocket(self) -> None:
-        self.rocket_time = 180  # 3 seconds at 60fps
+        self.rocket_time = ROCKET_TICKS
         self.vel_y = BOOST_VELOCITY
 
-    def update(self, keys: pygame.key.ScancodeWrapper, started: bool) -> None:
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+    def update(self, controls: InputState, started: bool) -> None:
+        self.prev_x, self.prev_y = self.rect.topleft
+        if controls.left:
             self.rect.x -= MOVE_SPEED
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if controls.right:
             self.rect.x += MOVE_SPEED
 
         if started:
             if self.rocket_time > 0:
                 self.rocket_time -= 1
-                self.vel_y += GRAVITY * 0.1
+                self.vel_y += self.gravity * 0.1
             else:
-                self.vel_y += GRAVITY
+                self.vel_y += self.gravity
             self.rect.y += int(self.vel_y)
         else:
             self.vel_y = 0
@@ -67,11 +96,16 @@ class Cat:
             self.rect.left = -CAT_SIZE
         self.frame = (self.frame + 1) % 60
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface, camera: "Camera", alpha: float = 1.0) -> None:
         if self.rocket_time > 0:
             img = self.rocket_images[(self.frame // 30) % 2]
         else:
             img = self.images[(self.frame // 15) % 4]
-        draw_rect = img.get_rect(center=self.rect.center)
+        rect = camera.to_screen(self.rect)
+        dx = self.prev_x - self.rect.x
+        # Never interpolate across the horizontal wrap-around.
+        if alpha < 1 and abs(dx) < CAT_SIZE:
+            rect.move_ip(round(dx * (1 - alpha)), round((self.prev_y - self.rect.y) * (1 - alpha)))
+        draw_rect = img.get_rect(center=rect.center)
         surface.blit(img, draw_rect)
 
@@ -2,21 +2,39 @@
 
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass
-from pathlib import Path
 
 import pygame
 
+from .assets import get_registry
+from .collision import sweep_overlaps
+from .lifecycle import Lifecycle
+from .pool import Pool
+from .spatial import SpatialIndex
 
-@dataclass
+# Collision sizes are fixed so headless and windowed runs behave identically.
+POWERUP_SIZES = {
+    "rocket": (20, 40),
+    "bubble": (30, 30),
+    "coin": (20, 20),
+}
+POWERUP_KINDS = ("rocket", "bubble", "coin")
+MAX_POWERUP_HEIGHT = max(h for _, h in POWERUP_SIZES.values())
+MAX_POWERUPS = 16
+
+
+@dataclass(slots=True)
 class PowerUp:
     """Base class for a power-up."""
 
-    image: pygame.Surface
+    image: pygame.Surface | None
     rect: pygame.Rect
     kind: str
 
+    @classmethod
+    def blank(cls) -> "PowerUp":
+        return cls(None, pygame.Rect(0, 0, 0, 0), "coin")
+
     def apply(self, cat: "Cat") -> None:
         pass
 
@@ -24,37 +42,49 @@ class PowerUp:
 class PowerUpManager:
     """Manages power-ups in the world."""
 
-    ASSET_DIR = Path(__file__).resolve().parent / "assets"
+    def __init__(self, headless: bool = False) -> None:
+        self.headless = headless
+        self.powerups: SpatialIndex[PowerUp] = SpatialIndex()
+        self.pool: Pool[PowerUp] = Pool(PowerUp.blank)
+        self.life = Lifecycle(self.powerups, self.pool, MAX_POWERUPS, MAX_POWERUP_HEIGHT)
 
-    def __init__(self) -> None:
-        self.images = {
-            "rocket": pygame.image.load(self.ASSET_DIR / "sprites" / "rocket.png").convert_alpha(),
-            "bubble": pygame.image.load(self.ASSET_DIR / "sprites" / "bubble.png").convert_alpha(),
-            "coin": pygame.image.load(self.ASSET_DIR / "sprites" / "coin.png").convert_alpha(),
-        }
-        self.powerups: list[PowerUp] = []
-        self.scroll_y = 0
+    def clear(self) -> None:
+        """Return every live power-up to the pool."""
+        self.life.clear()
 
-    def update(self, cat: "Cat", platforms: list["Platform"], game: "Game") -> None:
-        for p in list(self.powerups):
-            if p.rect.colliderect(cat.rect):
+    def spawn(self, x: int, y: int, kind: str) -> PowerUp:
+        p = self.pool.acquire()
+        # Sprites load on first spawn; the opening screens have no power-ups.
+        p.image = None if self.headless else get_registry().image(kind)
+        p.rect.update((x, y), POWERUP_SIZES[kind])
+        p.kind = kind
+        self.life.spawn(p, y)
+        return p
+
+    def recycle_below(self, y: int) -> None:
+        """Return power-ups whose top is at or below world y ``y`` to the pool."""
+        self.life.despawn_from(y)
+
+    def update(self, cat: "Cat", game: "Game") -> None:
+        """Collect every power-up the cat passed through this tick."""
+        rect = cat.rect
+        prev_y = cat.prev_y
+        top = min(prev_y, rect.top)
+        bottom = max(prev_y, rect.top) + rect.height
+        nearby = self.powerups.between(top - MAX_POWERUP_HEIGHT, bottom)
+        if not nearby:
+            return
+        prev_x, _ = cat.swept_from()
+        for p in nearby:
+            if sweep_overlaps(rect, rect.x - prev_x, rect.y - prev_y, p.rect):
                 if p.kind == "rocket":
                     cat.apply_rocket()
                 elif p.kind == "coin":
                     game.score += 100
-                self.powerups.remove(p)
-        if random.random() < 0.01:
-            y = min(platform.rect.top for platform in platforms) - random.randint(60, 120)
-            x = random.randint(0, 480 - 32)
-            kind = random.choice(["rocket", "bubble", "coin"])
-            rect = self.images[kind].get_rect(topleft=(x, y))
-            self.powerups.append(PowerUp(self.images[kind], rect, kind))
-
-    def draw(self, surface: pygame.Surface) -> None:
-        for p in self.powerups:
-            surface.blit(p.image, p.rect)
-
-    def scroll(self, dy: int) -> None:
-        for p in self.powerups:
-            p.rect.y += dy
+                game.play_sound("powerup")
+                self.life.despawn(p)
+
+    def draw(self, surface: pygame.Surface, camera: "Camera") -> None:
+        for p in self.life.active(camera):
+            surface.blit(p.image, camera.to_screen(p.rect))
 
@@ -0,0 +1,162 @@
+"""Per-phase frame timing with ring buffers, an on-screen overlay and export.
+
+The game loop calls :meth:`FrameProfiler.mark` after each phase; the time
+since the previous mark is charged to that phase. The last ``capacity``
+frames are kept, so the cost is constant however long a session runs.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+import pygame
+
+PHASES = ("events", "update", "collisions", "powerups", "scroll", "draw", "flip")
+FRAME_BUDGET_MS = 1000 / 60
+
+PANEL_SIZE = (240, 110)
+PANEL_COLOR = (20, 20, 20)
+GRAPH_COLOR = (80, 220, 80)
+SLOW_COLOR = (230, 70, 70)
+TEXT_COLOR = (255, 255, 255)
+
+
+class FrameProfiler:
+    """Ring buffers of per-phase frame times in milliseconds."""
+
+    def __init__(self, capacity: int = 600) -> None:
+        self.capacity = capacity
+        self.samples = np.zeros((capacity, len(PHASES)), dtype=np.float32)
+        self.frames = 0
+        self._index = {name: i for i, name in enumerate(PHASES)}
+        self._current = np.zeros(len(PHASES), dtype=np.float32)
+        self._last = time.perf_counter()
+        self._capture = None
+        self._capture_left = 0
+        self._capture_path: Path | None = None
+
+    def __len__(self) -> int:
+        return min(self.frames, self.capacity)
+
+    def begin_frame(self) -> None:
+        self._current[:] = 0
+        self._last = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """Charge the time since the previous mark to ``phase``."""
+        now = time.perf_counter()
+        self._current[self._index[phase]] += (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self) -> None:
+        self.samples[self.frames % self.capacity] = self._current
+        self.frames += 1
+        if self._capture is not None:
+            self._capture_left -= 1
+            if self._capture_left <= 0:
+                self.stop_capture()
+
+    def history(self) -> np.ndarray:
+        """The buffered frames, oldest first, one row per frame."""
+        if self.frames <= self.capacity:
+            return self.samples[: self.frames]
+        return np.roll(self.samples, -(self.frames % self.capacity), axis=0)
+
+    def frame_times(self) -> np.ndarray:
+        return self.history().sum(axis=1)
+
+    def percentiles(self) -> dict[str, float]:
+        """p50, p95 and p99 of the buffered frame times."""
+        times = self.frame_times()
+        if len(times) == 0:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        p50, p95, p99 = np.percentile(times, (50, 95, 99))
+        return {"p50": float(p50), "p95": float(p95), "p99": float(p99)}
+
+    def export(self, path: str | Path) -> None:
+        """Write the buffered frames as CSV for a ``.csv`` path, JSON otherwise."""
+        path = Path(path)
+        rows = self.history().tolist()
+        if path.suffix == ".csv":
+            import csv
+
+            with path.open("w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(PHASES)
+                writer.writerows(rows)
+            return
+        data = {"phases": PHASES, "percentiles": self.percentiles(), "frames": rows}
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    def capture(self, frames: int, path: str | Path) -> None:
+        """Run cProfile over the next ``frames`` frames and dump it to ``path``."""
+        if self._capture is not None:
+            return
+        import cProfile  # only needed for captures, so kept off the startup path
+
+        self._capture = cProfile.Profile()
+        self._capture_left = frames
+        self._capture_path = Path(path)
+        self._capture.enable()
+
+    def stop_capture(self) -> None:
+        """End a running capture early and write what it has so far."""
+        if self._capture is None:
+            return
+        self._capture.disable()
+        self._capture.dump_stats(self._capture_path)
+        self._capture = None
+
+    @property
+    def capturing(self) -> bool:
+        return self._capture is not None
+
+
+class ProfilerOverlay:
+    """An opaque panel with frame-time percentiles and a frame-time graph.
+
+    The panel is rebuilt every ``refresh`` frames rather than every frame,
+    so the numbers stay readable and its own cost stays negligible.
+    """
+
+    def __init__(self, profiler: FrameProfiler, refresh: int = 15) -> None:
+        self.profiler = profiler
+        self.refresh = refresh
+        self.font = pygame.font.Font(None, 20)
+        self.visible = False
+        self._panel: pygame.Surface | None = None
+        self._built_at = -refresh
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+
+    def _build(self) -> None:
+        # Built anew each time: texture renderers cache uploads per surface.
+        panel = self._panel = pygame.Surface(PANEL_SIZE).convert()
+        panel.fill(PANEL_COLOR)
+        width, height = PANEL_SIZE
+        graph_top = 40
+        times = self.profiler.frame_times()[-width:]
+        scale = (height - graph_top) / (2 * FRAME_BUDGET_MS)
+        for x, ms in enumerate(times.tolist()):
+            bar = min(height - graph_top, int(ms * scale))
+            color = SLOW_COLOR if ms > FRAME_BUDGET_MS else GRAPH_COLOR
+            pygame.draw.line(panel, color, (x, height - 1), (x, height - 1 - bar))
+        budget_y = height - 1 - int(FRAME_BUDGET_MS * scale)
+        pygame.draw.line(panel, TEXT_COLOR, (0, budget_y), (width, budget_y))
+        p = self.profiler.percentiles()
+        label = f"p50 {p['p50']:.1f}  p95 {p['p95']:.1f}  p99 {p['p99']:.1f} ms"
+        panel.blit(self.font.render(label, True, TEXT_COLOR), (6, 6))
+        if self.profiler.capturing:
+            panel.blit(self.font.render("cProfile capture...", True, SLOW_COLOR), (6, 22))
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if not self.visible:
+            return
+        if self.profiler.frames - self._built_at >= self.refresh:
+            self._build()
+            self._built_at = self.profiler.frames
+        surface.blit(self._panel, (surface.get_width() - PANEL_SIZE[0], 0))
@@ -0,0 +1,271 @@
+"""Renderer backends and dirty-rectangle rendering.
+
+Game code draws with ``blit``, ``blits`` and ``fill`` on whatever a
+renderer's :attr:`target` is, at the game's internal resolution, then calls
+:meth:`present`. Three backends share that contract:
+
+* ``"software"`` -- the display surface itself (optionally wrapped in a
+  :class:`DirtyRectSurface`), or an offscreen canvas scaled up to the window.
+* ``"texture"`` -- :class:`TextureRenderer`, which uploads each surface once
+  as an SDL texture and replays the frame's draws on the GPU.
+* ``"null"`` -- draws nothing; used for headless runs.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any, Iterable
+
+import pygame
+
+BACKENDS = ("software", "texture", "null")
+
+
+class DirtyRectSurface:
+    """Wraps the display surface and records every region drawn on it.
+
+    Drawing code keeps calling ``blit`` and ``fill`` as usual. A full-screen
+    fill with the background colour does not repaint the screen; it only
+    restores the cached background layer under whatever was drawn since the
+    previous clear. :meth:`end_frame` returns the regions that changed, ready
+    for ``pygame.display.update``.
+    """
+
+    def __init__(self, target: pygame.Surface, background_color: tuple[int, int, int]) -> None:
+        self.target = target
+        self.background_color = pygame.Color(background_color)
+        self.background = pygame.Surface(target.get_size()).convert()
+        self.background.fill(self.background_color)
+        # Whatever is on screen at start-up is unknown, so the first clear repaints it all.
+        self._drawn: list[pygame.Rect] = [target.get_rect()]
+        self._dirty: list[pygame.Rect] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.target, name)
+
+    def blit(self, source: pygame.Surface, dest: Any, area: Any = None, special_flags: int = 0) -> pygame.Rect:
+        rect = self.target.blit(source, dest, area, special_flags)
+        self._drawn.append(rect)
+        self._dirty.append(rect)
+        return rect
+
+    def blits(self, blit_sequence: Iterable[tuple], doreturn: bool = True) -> list[pygame.Rect]:
+        rects = self.target.blits(blit_sequence, doreturn=True)
+        self._drawn.extend(rects)
+        self._dirty.extend(rects)
+        return rects
+
+    def fill(self, color: Any, rect: Any = None, special_flags: int = 0) -> pygame.Rect:
+        if rect is None and special_flags == 0 and pygame.Color(color) == self.background_color:
+            for drawn in self._drawn:
+                self.target.blit(self.background, drawn, drawn)
+            self._dirty.extend(self._drawn)
+            self._drawn = []
+            return self.target.get_rect()
+        filled = self.target.fill(color, rect, special_flags)
+        self._drawn.append(filled)
+        self._dirty.append(filled)
+        return filled
+
+    def end_frame(self) -> list[pygame.Rect]:
+        """Return the regions changed since the last call and start a new frame."""
+        dirty, self._dirty = self._dirty, []
+        screen = self.target.get_rect()
+        area = sum(r.width * r.height for r in dirty)
+        if area >= screen.width * screen.height // 2:
+            return [screen]
+        return dirty
+
+
+class SoftwareRenderer:
+    """Blits on the CPU, straight to the display surface when no scaling is needed."""
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        window_size: tuple[int, int] | None = None,
+        dirty_rects: bool = False,
+        background_color: tuple[int, int, int] = (0, 0, 0),
+    ) -> None:
+        window_size = window_size or size
+        self.display = pygame.display.set_mode(window_size)
+        self.scaled = tuple(window_size) != tuple(size)
+        if dirty_rects and self.scaled:
+            raise ValueError("dirty rectangles need the window at the internal resolution")
+        self.target: Any = self.display
+        if self.scaled:
+            self.target = pygame.Surface(size).convert()
+        elif dirty_rects:
+            self.target = DirtyRectSurface(self.display, background_color)
+
+    def present(self) -> None:
+        if self.scaled:
+            pygame.transform.scale(self.target, self.display.get_size(), self.display)
+            pygame.display.flip()
+        elif isinstance(self.target, DirtyRectSurface):
+            pygame.display.update(self.target.end_frame())
+        else:
+            pygame.display.flip()
+
+    def close(self) -> None:
+        pass
+
+
+class TextureRenderer:
+    """Draws through ``pygame._sdl2.video`` textures instead of software blits.
+
+    A surface is uploaded the first time it is drawn and the texture is
+    kept for as long as the surface lives, so sprites cost one upload each;
+    subsurfaces (e.g. sprites cut from the asset atlas) share their parent's
+    texture. Surfaces must therefore not be redrawn in place once drawn
+    here: build a new one instead. Draws and fills are queued and submitted
+    in order by :meth:`present`, which lets SDL batch runs of draws from the
+    same texture. The window can be any size; SDL scales the internal
+    resolution to fit it.
+    """
+
+    def __init__(self, size: tuple[int, int], window_size: tuple[int, int] | None = None, title: str = "") -> None:
+        from pygame._sdl2.video import Renderer, Window
+
+        # Surfaces are converted against the display mode, so a hidden one has to exist.
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.size = tuple(size)
+        self.window = Window(title, window_size or size)
+        self.renderer = Renderer(self.window)
+        self.renderer.logical_size = self.size
+        self.target = self
+        self.uploads = 0
+        self._textures: weakref.WeakKeyDictionary[pygame.Surface, Any] = weakref.WeakKeyDictionary()
+        self._commands: list[tuple] = []
+
+    # The subset of the Surface API that drawing code uses.
+    def get_size(self) -> tuple[int, int]:
+        return self.size
+
+    def get_width(self) -> int:
+        return self.size[0]
+
+    def get_height(self) -> int:
+        return self.size[1]
+
+    def get_rect(self) -> pygame.Rect:
+        return pygame.Rect((0, 0), self.size)
+
+    def _texture(self, surface: pygame.Surface) -> Any:
+        texture = self._textures.get(surface)
+        if texture is None:
+            from pygame._sdl2.video import Texture
+
+            texture = self._textures[surface] = Texture.from_surface(self.renderer, surface)
+            self.uploads += 1
+        return texture
+
+    def blit(self, source: pygame.Surface, dest: Any, area: Any = None, special_flags: int = 0) -> pygame.Rect:
+        if special_flags:
+            raise ValueError("the texture renderer does not support blend flags")
+        root = source.get_abs_parent()
+        x, y = source.get_abs_offset()
+        src = pygame.Rect(x, y, *source.get_size())
+        if area is not None:
+            area = pygame.Rect(area)
+            src = pygame.Rect(x + area.x, y + area.y, area.width, area.height).clip(src)
+        dst = pygame.Rect(dest[0], dest[1], src.width, src.height)
+        self._commands.append((self._texture(root), src, dst))
+        return dst
+
+    def blits(self, blit_sequence: Iterable[tuple], doreturn: bool = True) -> list[pygame.Rect] | None:
+        rects = [self.blit(*item) for item in blit_sequence]
+        return rects if doreturn else None
+
+    def fill(self, color: Any, rect: Any = None, special_flags: int = 0) -> pygame.Rect:
+        if special_flags:
+            raise ValueError("the texture renderer does not support blend flags")
+        self._commands.append((None, pygame.Color(color), None if rect is None else pygame.Rect(rect)))
+        return pygame.Rect((0, 0), self.size) if rect is None else pygame.Rect(rect)
+
+    def screenshot(self) -> pygame.Surface:
+        """Submit the queued draws and return a copy of the frame so far."""
+        self._submit()
+        return self.renderer.to_surface()
+
+    def present(self) -> None:
+        self._submit()
+        self.renderer.present()
+
+    def _submit(self) -> None:
+        renderer = self.renderer
+        for texture, src, dst in self._commands:
+            if texture is not None:
+                texture.draw(src, dst)
+                continue
+            renderer.draw_color = src
+            if dst is None:
+                renderer.clear()
+            else:
+                renderer.fill_rect(dst)
+        self._commands.clear()
+
+    def close(self) -> None:
+        self._commands.clear()
+        self._textures.clear()
+
+
+class NullRenderer:
+    """Accepts every draw and shows nothing."""
+
+    def __init__(self, size: tuple[int, int]) -> None:
+        self.size = tuple(size)
+        self.target = self
+
+    def get_size(self) -> tuple[int, int]:
+        return self.size
+
+    def get_width(self) -> int:
+        return self.size[0]
+
+    def get_height(self) -> int:
+        return self.size[1]
+
+    def get_rect(self) -> pygame.Rect:
+        return pygame.Rect((0, 0), self.size)
+
+    def blit(self, source: Any, dest: Any, area: Any = None, special_flags: int = 0) -> pygame.Rect:
+        return pygame.Rect(0, 0, 0, 0)
+
+    def blits(self, blit_sequence: Iterable[tuple], doreturn: bool = True) -> list[pygame.Rect] | None:
+        return [] if doreturn else None
+
+    def fill(self, color: Any, rect: Any = None, special_flags: int = 0) -> pygame.Rect:
+        return self.get_rect()
+
+    def present(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def open_renderer(
+    backend: str,
+    size: tuple[int, int],
+    window_size: tuple[int, int] | None = None,
+    dirty_rects: bool = False,
+    background_color: tuple[int, int, int] = (0, 0, 0),
+    title: str = "",
+) -> SoftwareRenderer | TextureRenderer | NullRenderer:
+    """Create the ``backend`` renderer drawing at ``size`` into a ``window_size`` window.
+
+    Needs an initialized display. Dirty rectangles only apply to the
+    software backend.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown renderer backend {backend!r}")
+    if dirty_rects and backend != "software":
+        raise ValueError("dirty rectangles are only supported by the software renderer")
+    if backend == "texture":
+        return TextureRenderer(size, window_size, title)
+    if backend == "null":
+        # Sprites still get converted, which needs a display mode.
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        return NullRenderer(size)
+    return SoftwareRenderer(size, window_size, dirty_rects, background_color)
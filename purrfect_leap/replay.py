@@ -0,0 +1,226 @@
+"""Compact input recordings and headless re-simulation.
+
+A replay holds everything needed to reproduce a run exactly: the level
+seed, the tuning, the world size and the input bitmask of every tick. The
+masks are stored run-length encoded, so a minute of held keys takes a
+handful of bytes.
+
+Binary layout (little endian)::
+
+    magic "PLRP" | version u8 | seed u64 | width u16 | height u16
+    gravity f64 | jump_velocity f64 | vertical_gap i32 | kind weights f64 x N
+    run count u32 | runs: (tick count as LEB128 varint, mask u8) ...
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from .inputs import InputState
+from .platform import KIND_WEIGHTS
+from .tuning import Tuning
+
+MAGIC = b"PLRP"
+# Bumped whenever the simulation changes so that old replays would play out
+# differently. Version 1 replays predate chunked level streaming and swept
+# collisions, and are rejected rather than silently desyncing.
+VERSION = 2
+_HEADER = struct.Struct(f"<4sBQHHddi{len(KIND_WEIGHTS)}dI")
+
+
+class ReplayError(ValueError):
+    """Raised when replay data is malformed or from an unknown version."""
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    """Append non-negative ``value`` to ``out`` as an LEB128 varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Decode the varint at ``data[pos:]``; return it and the position after it."""
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ReplayError("truncated replay")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+# Runs per frozen block of history; see Replay.history().
+HISTORY_BLOCK = 256
+
+Run = tuple[int, int]
+History = tuple[tuple[Run, ...], ...]
+
+
+@dataclass
+class Replay:
+    """Seed, settings and run-length encoded per-tick input masks."""
+
+    seed: int
+    tuning: Tuning = field(default_factory=Tuning)
+    width: int = 480
+    height: int = 800
+    # (tick count, mask) pairs. Runs are replaced rather than changed in
+    # place, so history() can share them.
+    runs: list[Run] = field(default_factory=list)
+    # Kept up to date by record(), since the game reads it every tick.
+    ticks: int = field(default=0, init=False, compare=False, repr=False)
+    _blocks: list[tuple[Run, ...]] = field(default_factory=list, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.runs = [(count, mask) for count, mask in self.runs]
+        self.ticks = sum(count for count, _ in self.runs)
+
+    def record(self, mask: int) -> None:
+        self.ticks += 1
+        runs = self.runs
+        if runs and runs[-1][1] == mask:
+            runs[-1] = (runs[-1][0] + 1, mask)
+        else:
+            runs.append((1, mask))
+
+    def history(self) -> History:
+        """The runs so far as immutable blocks, for snapshots.
+
+        Every block but the last holds ``HISTORY_BLOCK`` runs that can no
+        longer change and is shared with earlier calls, so taking a history
+        costs the same however long the run is.
+        """
+        runs = self.runs
+        # The last run may still grow, so it always stays in the tail.
+        full = max(len(runs) - 1, 0) // HISTORY_BLOCK
+        blocks = self._blocks
+        while len(blocks) < full:
+            start = len(blocks) * HISTORY_BLOCK
+            blocks.append(tuple(runs[start : start + HISTORY_BLOCK]))
+        return (*blocks[:full], tuple(runs[full * HISTORY_BLOCK :]))
+
+    def rewind(self, history: History) -> None:
+        """Go back to ``history``, as returned by :meth:`history`.
+
+        When this replay still holds the runs ``history`` was taken from,
+        only the runs recorded since are dropped. Otherwise, e.g. in a
+        different game, the runs are copied from ``history``.
+        """
+        *blocks, tail = history
+        n = len(blocks) * HISTORY_BLOCK + len(tail)
+        runs = self.runs
+        # Runs are never changed in place, so if the last finished run is
+        # the same object, everything before it is the same too.
+        last_closed = tail[-2] if len(tail) > 1 else blocks[-1][-1] if blocks else None
+        if len(runs) >= n and (last_closed is None or runs[n - 2] is last_closed):
+            self.ticks -= sum(count for count, _ in runs[n:])
+            del runs[n:]
+            if tail:
+                self.ticks += tail[-1][0] - runs[-1][0]
+                runs[-1] = tail[-1]
+        else:
+            self.runs = [run for block in blocks for run in block]
+            self.runs += tail
+            self.ticks = sum(count for count, _ in self.runs)
+        self._blocks = blocks
+
+    def masks(self) -> Iterator[int]:
+        for count, mask in self.runs:
+            for _ in range(count):
+                yield mask
+
+    def to_bytes(self) -> bytes:
+        t = self.tuning
+        out = bytearray(
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                self.seed,
+                self.width,
+                self.height,
+                t.gravity,
+                t.jump_velocity,
+                t.vertical_gap,
+                *t.kind_weights,
+                len(self.runs),
+            )
+        )
+        for count, mask in self.runs:
+            write_varint(out, count)
+            out.append(mask)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        if len(data) < _HEADER.size or data[:4] != MAGIC:
+            raise ReplayError("not a Purr-fect Leap replay")
+        magic, version, seed, width, height, gravity, jump, gap, *rest = _HEADER.unpack_from(data)
+        if version != VERSION:
+            raise ReplayError(f"unsupported replay version {version}")
+        *weights, n_runs = rest
+        tuning = Tuning(gravity=gravity, jump_velocity=jump, vertical_gap=gap, kind_weights=tuple(weights))
+        pos = _HEADER.size
+        runs = []
+        for _ in range(n_runs):
+            count, pos = read_varint(data, pos)
+            if pos >= len(data):
+                raise ReplayError("truncated replay")
+            runs.append((count, data[pos]))
+            pos += 1
+        return cls(seed, tuning, width, height, runs)
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Replay":
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class ReplayPlayer:
+    """Re-simulates a replay headlessly, as fast as possible or to any tick."""
+
+    def __init__(self, replay: Replay) -> None:
+        # Imported here because the game itself records into a Replay.
+        from .gamestate import Game
+
+        self.replay = replay
+        self.game = Game(
+            width=replay.width,
+            height=replay.height,
+            headless=True,
+            tuning=replay.tuning,
+            seed=replay.seed,
+        )
+        self.tick = 0
+        self._masks = replay.masks()
+
+    def rewind(self) -> None:
+        self.game.reset(self.replay.seed)
+        self.tick = 0
+        self._masks = self.replay.masks()
+
+    def seek(self, tick: int) -> "Game":
+        """Advance (or rewind and re-simulate) until ``tick`` ticks have run."""
+        if not 0 <= tick <= self.replay.ticks:
+            raise IndexError(tick)
+        if tick < self.tick:
+            self.rewind()
+        game = self.game
+        masks = self._masks
+        while self.tick < tick:
+            game.update_world(InputState.from_mask(next(masks)))
+            self.tick += 1
+        return game
+
+    def play(self) -> "Game":
+        """Run the whole replay and return the final game."""
+        return self.seek(self.replay.ticks)
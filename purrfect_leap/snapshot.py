@@ -0,0 +1,35 @@
+"""Plain-value copies of a run for rollback and lookahead search."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .level import Chunk, PlatformSpec
+from .replay import History
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """Everything that decides how a run continues, as immutable values.
+
+    Entities are stored as tuples (see ``Cat.get_state`` and
+    ``Platform.get_state``), so a snapshot holds no surfaces or live objects
+    and can be kept, copied or pickled freely. The level generator's random
+    state travels inside ``chunk``; particles are cosmetic and not included.
+    """
+
+    seed: int
+    cat: tuple
+    platforms: tuple[tuple, ...]
+    powerups: tuple[tuple[int, int, str], ...]
+    camera_top: int
+    prev_camera_top: int
+    score: int
+    started: bool
+    game_over: bool
+    start_pending: bool
+    # The last chunk taken from the level stream and the specs not yet placed.
+    chunk: Chunk
+    upcoming: tuple[PlatformSpec, ...]
+    # The replay's run-length encoded inputs, as shared blocks (see Replay.history).
+    inputs: History
@@ -0,0 +1,93 @@
+"""Vertical spatial index for platforms and power-ups."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Generic, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class SpatialIndex(Generic[T]):
+    """Entities kept sorted by a vertical key, normally their world-space top.
+
+    Lookups are binary searches over the sorted keys; inserts and removals
+    shift one small list. Entities with equal keys keep insertion order.
+    Iteration runs top to bottom.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[float] = []
+        self._items: list[T] = []
+        self._key_of: dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __contains__(self, item: object) -> bool:
+        return id(item) in self._key_of
+
+    def add(self, item: T, key: float) -> None:
+        i = bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._items.insert(i, item)
+        self._key_of[id(item)] = key
+
+    def remove(self, item: T) -> None:
+        key = self._key_of.pop(id(item))
+        i = bisect_left(self._keys, key)
+        while self._items[i] is not item:
+            i += 1
+        del self._keys[i]
+        del self._items[i]
+
+    def move(self, item: T, key: float) -> None:
+        """Re-key ``item`` after it moved vertically."""
+        if self._key_of.get(id(item)) != key:
+            self.remove(item)
+            self.add(item, key)
+
+    def first(self) -> T | None:
+        """The entity with the smallest key (the topmost one)."""
+        return self._items[0] if self._items else None
+
+    def last(self) -> T | None:
+        """The entity with the largest key (the bottommost one)."""
+        return self._items[-1] if self._items else None
+
+    def between(self, lo: float, hi: float) -> list[T]:
+        """Entities with ``lo <= key <= hi``, top to bottom."""
+        return self._items[bisect_left(self._keys, lo) : bisect_right(self._keys, hi)]
+
+    def nearest(self, key: float, k: int) -> list[T]:
+        """Up to ``k`` entities whose keys are closest to ``key``, closest first."""
+        keys = self._keys
+        hi = bisect_left(keys, key)
+        lo = hi - 1
+        out = []
+        while len(out) < k and (lo >= 0 or hi < len(keys)):
+            if hi >= len(keys) or (lo >= 0 and key - keys[lo] <= keys[hi] - key):
+                out.append(self._items[lo])
+                lo -= 1
+            else:
+                out.append(self._items[hi])
+                hi += 1
+        return out
+
+    def pop_from(self, lo: float) -> list[T]:
+        """Remove and return every entity with ``key >= lo``."""
+        i = bisect_left(self._keys, lo)
+        removed = self._items[i:]
+        del self._keys[i:]
+        del self._items[i:]
+        for item in removed:
+            del self._key_of[id(item)]
+        return removed
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._items.clear()
+        self._key_of.clear()
@@ -0,0 +1,91 @@
+"""Cold-start measurement: import time and time to the first menu frame.
+
+Each measurement runs in a fresh interpreter so nothing is already imported
+or initialized. ``import_ms`` is the cost of importing the game once pygame
+itself is loaded (pygame's own import is reported separately as
+``pygame_ms``, since it is outside our control); ``first_frame_ms`` runs
+from the first import to the start menu being on screen.
+
+Example::
+
+    python -m purrfect_leap.startup --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+IMPORT_BUDGET_MS = 150.0
+FIRST_FRAME_BUDGET_MS = 1500.0
+
+_CHILD = """
+import json, time
+start = time.perf_counter()
+import pygame
+after_pygame = time.perf_counter()
+from purrfect_leap.gamestate import Game, StartMenuState
+imported = time.perf_counter()
+game = Game(save_dir={save_dir!r})
+game.change_state(StartMenuState(game))
+game.state.draw(game.screen)
+pygame.display.flip()
+shown = time.perf_counter()
+print(json.dumps({{
+    "pygame_ms": (after_pygame - start) * 1000,
+    "import_ms": (imported - after_pygame) * 1000,
+    "first_frame_ms": (shown - start) * 1000,
+}}))
+"""
+
+
+def measure(save_dir: str | None = None) -> dict[str, float]:
+    """Start the game in a fresh interpreter and return its startup timings in ms."""
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(save_dir=save_dir)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def over_budget(timings: dict[str, float]) -> list[str]:
+    """Return one message per timing that exceeds its budget."""
+    messages = []
+    if timings["import_ms"] > IMPORT_BUDGET_MS:
+        messages.append(f"import {timings['import_ms']:.0f} ms > {IMPORT_BUDGET_MS:.0f} ms")
+    if timings["first_frame_ms"] > FIRST_FRAME_BUDGET_MS:
+        messages.append(f"first frame {timings['first_frame_ms']:.0f} ms > {FIRST_FRAME_BUDGET_MS:.0f} ms")
+    return messages
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure Purr-fect Leap startup time")
+    parser.add_argument("--runs", type=int, default=3, help="cold starts to measure; the median is reported")
+    parser.add_argument("--save-dir", help="data directory for the measured runs")
+    args = parser.parse_args(argv)
+
+    samples = [measure(args.save_dir) for _ in range(args.runs)]
+    timings = {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+    print(json.dumps(timings, indent=2))
+    problems = over_budget(timings)
+    for line in problems:
+        print(f"OVER BUDGET {line}", file=sys.stderr)
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""Persistent best score and run history, written off the render thread.
+
+Everything lives in a per-user data directory (see :func:`data_dir`):
+
+* ``profile.json`` -- ``{"version": 1, "best_score": ...}``, rewritten
+  atomically (temporary file, fsync, ``os.replace``) so a crash leaves
+  either the old or the new file, never a torn one.
+* ``runs.jsonl`` -- one JSON object per finished run, only ever appended.
+  A line cut short by a crash is skipped when loading.
+
+Writes go through a queue to a single daemon thread; the in-memory state
+(:attr:`Storage.best_score`, the top-N and recent indexes) is updated
+immediately, so callers never wait for the disk. Only the small profile is
+read at startup; the run history grows without bound, so the same thread
+reads it first and history queries wait for that.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import pickle
+import queue
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable
+
+FORMAT_VERSION = 1
+PROFILE_FILE = "profile.json"
+RUNS_FILE = "runs.jsonl"
+LEGACY_SAVE_FILE = "save.dat"
+
+
+def data_dir() -> Path:
+    """Where saves live: ``$PURRFECT_LEAP_DATA`` or the platform's user data directory."""
+    override = os.environ.get("PURRFECT_LEAP_DATA")
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        base = Path(os.environ.get("APPDATA") or Path.home() / "AppData" / "Roaming")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share")
+    return base / "purrfect_leap"
+
+
+@dataclass(frozen=True)
+class RunRecord:
+    """One finished run; ``height`` is in pixels and ``duration`` in seconds."""
+
+    score: int
+    height: int
+    duration: float
+    seed: int
+    finished_at: float = field(default_factory=time.time)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class _NoGlobals(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> None:
+        raise pickle.UnpicklingError("legacy saves only hold plain numbers")
+
+
+def _legacy_best_score(path: Path) -> int:
+    """Read the old pickled ``save.dat`` without ever importing anything."""
+    try:
+        with open(path, "rb") as f:
+            value = _NoGlobals(f).load()
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return 0
+    return value if isinstance(value, int) else 0
+
+
+class Storage:
+    """Best score plus an append-only run history with top-N and recent indexes."""
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        self.directory = Path(directory) if directory is not None else data_dir()
+        self.best_score = 0
+        self._runs: list[RunRecord] = []
+        # (-score, position in self._runs), kept sorted for top-N queries.
+        self._by_score: list[tuple[int, int]] = []
+        self._history_loaded = threading.Event()
+        self._load_profile()
+        self._queue: queue.Queue[Callable[[], None] | None] = queue.Queue()
+        self._submit(self._load_history)
+        self._writer = threading.Thread(target=self._drain, name="storage", daemon=True)
+        self._writer.start()
+
+    # Loading
+    def _load_profile(self) -> None:
+        profile = self.directory / PROFILE_FILE
+        if profile.exists():
+            try:
+                data = json.loads(profile.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == FORMAT_VERSION:
+                self.best_score = int(data.get("best_score", 0))
+        elif Path(LEGACY_SAVE_FILE).exists():
+            self.best_score = _legacy_best_score(Path(LEGACY_SAVE_FILE))
+
+    def _load_history(self) -> None:
+        try:
+            runs = self.directory / RUNS_FILE
+            if runs.exists():
+                with open(runs, encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            data = json.loads(line)
+                            if data.pop("version", None) == FORMAT_VERSION:
+                                self._index(RunRecord(**data))
+                        except (ValueError, TypeError, AttributeError):
+                            # A torn or foreign line must not stop the writer thread.
+                            continue
+        finally:
+            self._history_loaded.set()
+
+    def _index(self, run: RunRecord) -> None:
+        bisect.insort(self._by_score, (-run.score, len(self._runs)))
+        self._runs.append(run)
+
+    # Writing
+    def _drain(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                job()
+            except OSError as exc:
+                print(f"could not save game data: {exc}", file=sys.stderr)
+            finally:
+                self._queue.task_done()
+
+    def _submit(self, job: Callable[[], None]) -> None:
+        self._queue.put(job)
+
+    def _ensure_dir(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def save_best_score(self, score: int) -> None:
+        """Raise the best score if ``score`` beats it; the write happens in the background."""
+        if score <= self.best_score:
+            return
+        self.best_score = score
+        text = json.dumps({"version": FORMAT_VERSION, "best_score": score})
+
+        def write() -> None:
+            self._ensure_dir()
+            _write_atomic(self.directory / PROFILE_FILE, text)
+
+        self._submit(write)
+
+    def record_run(self, run: RunRecord) -> None:
+        """Index ``run`` now and append it to the history in the background."""
+        self._history_loaded.wait()
+        self._index(run)
+        line = json.dumps({"version": FORMAT_VERSION, **asdict(run)}) + "\n"
+
+        def append() -> None:
+            self._ensure_dir()
+            with open(self.directory / RUNS_FILE, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+        self._submit(append)
+
+    def flush(self) -> None:
+        """Block until every queued write has reached the disk."""
+        self._queue.join()
+
+    def close(self) -> None:
+        self.flush()
+        self._queue.put(None)
+        self._writer.join()
+
+    # Queries
+    @property
+    def runs(self) -> list[RunRecord]:
+        """Every finished run, oldest first."""
+        self._history_loaded.wait()
+        return self._runs
+
+    def top(self, n: int = 10) -> list[RunRecord]:
+        """The ``n`` best runs, highest score first (earlier runs win ties)."""
+        runs = self.runs
+        return [runs[i] for _, i in self._by_score[:n]]
+
+    def recent(self, n: int = 10) -> list[RunRecord]:
+        """The ``n`` latest runs, newest first."""
+        return self.runs[: -n - 1 : -1]
@@ -0,0 +1,76 @@
+"""Cached text rendering for the HUD and menus."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+Color = tuple[int, int, int]
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed on font, string and colour."""
+
+    def __init__(self, capacity: int = 128) -> None:
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def render(self, font: pygame.font.Font, text: str, color: Color, antialias: bool = True) -> pygame.Surface:
+        key = (font, text, color, antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+
+class DigitAtlas:
+    """Pre-rendered digit glyphs composed into numbers without rasterizing.
+
+    The glyphs are subsurfaces of one sheet, so a texture renderer uploads
+    the sheet once and every number after that is drawn from it.
+    """
+
+    CHARS = "0123456789-"
+
+    def __init__(self, font: pygame.font.Font, color: Color) -> None:
+        rendered = [font.render(c, True, color) for c in self.CHARS]
+        self.height = max(g.get_height() for g in rendered)
+        self.sheet = pygame.Surface((sum(g.get_width() for g in rendered), self.height), pygame.SRCALPHA)
+        self.glyphs: dict[str, pygame.Surface] = {}
+        x = 0
+        for c, glyph in zip(self.CHARS, rendered):
+            # RGBA_MAX onto the transparent sheet copies the glyph's pixels exactly.
+            self.sheet.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.glyphs[c] = self.sheet.subsurface((x, 0, glyph.get_width(), glyph.get_height()))
+            x += glyph.get_width()
+
+    def draw(self, surface: pygame.Surface, value: int, pos: tuple[int, int]) -> None:
+        """Blit ``value`` glyph by glyph with its top-left corner at ``pos``."""
+        x, y = pos
+        for c in str(value):
+            glyph = self.glyphs[c]
+            surface.blit(glyph, (x, y))
+            x += glyph.get_width()
+
+    def render(self, value: int) -> pygame.Surface:
+        """``value`` composed onto a new surface."""
+        glyphs = [self.glyphs[c] for c in str(value)]
+        surface = pygame.Surface((sum(g.get_width() for g in glyphs), self.height), pygame.SRCALPHA)
+        self.draw(surface, value, (0, 0))
+        return surface
@@ -0,0 +1,25 @@
+"""Gameplay constants that can be varied per run."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .platform import KIND_WEIGHTS, VERTICAL_GAP
+from .player import GRAVITY, JUMP_VELOCITY, SPRING_VELOCITY
+
+
+@dataclass(frozen=True)
+class Tuning:
+    """Physics and level-generation knobs; the defaults are the shipped game."""
+
+    gravity: float = GRAVITY
+    jump_velocity: float = JUMP_VELOCITY
+    vertical_gap: int = VERTICAL_GAP
+    kind_weights: tuple[float, ...] = KIND_WEIGHTS
+
+    @property
+    def spring_velocity(self) -> float:
+        return self.jump_velocity + (SPRING_VELOCITY - JUMP_VELOCITY)
+
+
+DEFAULT_TUNING = Tuning()
@@ -1,48 +1,36 @@
-"""UI elements like score display and sounds."""
+"""UI elements like the score display."""
 
 from __future__ import annotations
 
-import os
-import pickle
-from pathlib import Path
-
 import pygame
 
-ASSET_DIR = Path(__file__).resolve().parent / "assets"
-SAVE_FILE = "save.dat"
+from .textcache import DigitAtlas, TextCache
+
+HUD_COLOR = (0, 0, 0)
 
 
 class UI:
-    """Handles UI rendering and score persistence."""
+    """Handles UI rendering."""
 
     def __init__(self) -> None:
         self.font = pygame.font.Font(None, 36)
-        self.sounds = {
-            "jump": pygame.mixer.Sound(ASSET_DIR / "sounds" / "jump.wav"),
-            "powerup": pygame.mixer.Sound(ASSET_DIR / "sounds" / "powerup.wav"),
-            "gameover": pygame.mixer.Sound(ASSET_DIR / "sounds" / "gameover.wav"),
-        }
         self.score = 0
+        self.text_cache = TextCache()
+        self.digits = DigitAtlas(self.font, HUD_COLOR)
 
     def update_score(self, score: int) -> None:
         self.score = score
 
+    def text(self, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """Render ``text`` in the UI font, reusing a cached surface when possible."""
+        return self.text_cache.render(self.font, text, color)
+
     def draw(self, surface: pygame.Surface, score: int, best: int) -> None:
-        text = self.font.render(f"Score: {score}", True, (0, 0, 0))
-        surface.blit(text, (10, 10))
-        best_text = self.font.render(f"Best: {best}", True, (0, 0, 0))
-        surface.blit(best_text, (10, 40))
-
-    def save_best_score(self, score: int) -> None:
-        with open(SAVE_FILE, "wb") as f:
-            pickle.dump(score, f)
-
-    def load_best_score(self) -> int:
-        if not os.path.exists(SAVE_FILE):
-            return 0
-        with open(SAVE_FILE, "rb") as f:
-            return pickle.load(f)
-
-    def play_sound(self, name: str) -> None:
-        self.sounds[name].play()
+        self._draw_counter(surface, "Score: ", score, (10, 10))
+        self._draw_counter(surface, "Best: ", best, (10, 40))
+
+    def _draw_counter(self, surface: pygame.Surface, label: str, value: int, pos: tuple[int, int]) -> None:
+        label_surface = self.text(label, HUD_COLOR)
+        surface.blit(label_surface, pos)
+        self.digits.draw(surface, value, (pos[0] + label_surface.get_width(), pos[1]))
 
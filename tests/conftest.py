@@ -0,0 +1,5 @@
+import os
+
+# Dummy SDL drivers, so the suite runs without a display or an audio device.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
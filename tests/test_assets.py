@@ -0,0 +1,18 @@
+import pygame
+
+from purrfect_leap.assets import get_registry
+from purrfect_leap.gamestate import Game
+
+
+def test_reset_reuses_cached_assets():
+    game = Game(seed=3)
+    game.audio.wait_loaded()
+    registry = get_registry()
+    loaded = dict(registry.timings)
+    cat_images = game.player.images
+    game.reset(3)
+    game.reset(3)
+    assert registry.timings == loaded
+    assert game.player.images[0] is cat_images[0]
+    assert registry.scaled("platform_normal", (480, 18)) is game.platforms.between(782, 782)[0].image
+    pygame.quit()
@@ -0,0 +1,37 @@
+import pygame
+import pytest
+
+from purrfect_leap.audio import MixerSettings, NullAudio, open_audio
+from purrfect_leap.gamestate import Game
+
+
+def _audio(overflow):
+    pygame.mixer.quit()
+    return open_audio(MixerSettings(buffer=512, voices={"jump": 2, "pickup": 1, "ui": 1}, overflow=overflow))
+
+
+def test_voices_are_capped_per_category():
+    audio = _audio("steal")
+    if isinstance(audio, NullAudio):
+        pytest.skip("no audio device")
+    assert audio.buffer_ms == 1000 * 512 / pygame.mixer.get_init()[0]
+    for _ in range(5):
+        audio.play("jump")
+    audio.play("gameover")
+    assert audio.stolen == 3 and audio.played == 6
+    busy = [pygame.mixer.Channel(i).get_busy() for i in range(4)]
+    assert busy == [True, True, False, True]
+
+    audio = _audio("drop")
+    for _ in range(3):
+        audio.play("powerup")
+    assert audio.dropped == 2 and audio.played == 1
+    audio.stop()
+    pygame.mixer.quit()
+
+
+def test_headless_games_are_silent():
+    game = Game(headless=True)
+    assert isinstance(game.audio, NullAudio)
+    game.play_sound("jump")
+    assert game.audio.played == 0
@@ -0,0 +1,49 @@
+import numpy as np
+import pygame
+
+from purrfect_leap.gamestate import Game, PlayingState
+from purrfect_leap.inputs import InputState
+
+
+def _frame(**kwargs):
+    game = Game(**kwargs)
+    game.change_state(PlayingState(game))
+    game.reset(8)
+    game.start()
+    for tick in range(120):
+        game.update_world(InputState(left=tick % 50 < 20))
+        game.effects.spawn_dust(200, game.camera.top + 400)
+    game.state.draw(game.screen)
+    return game
+
+
+def test_texture_backend_matches_software():
+    software = pygame.surfarray.array3d(_frame().screen).astype(int)
+    game = _frame(backend="texture")
+    renderer = game.renderer
+    texture = pygame.surfarray.array3d(renderer.screenshot()).astype(int)
+    assert texture.shape == software.shape
+    # SDL's blender may round alpha differently from pygame's by a step or two.
+    assert np.abs(texture - software).max() <= 3
+    uploads = renderer.uploads
+    renderer.present()
+    game.state.draw(game.screen)
+    renderer.present()
+    assert renderer.uploads == uploads
+    # A changing score is drawn from the digit sheet, not uploaded anew.
+    for score in (1, 23, 456, 7890):
+        game.score = score
+        game.state.draw(game.screen)
+        renderer.present()
+    assert renderer.uploads == uploads
+    pygame.quit()
+
+
+def test_internal_resolution_is_independent_of_the_window():
+    game = _frame(window_size=(240, 400))
+    assert game.screen.get_size() == (480, 800)
+    game.renderer.present()
+    assert pygame.display.get_surface().get_size() == (240, 400)
+    null = _frame(backend="null")
+    assert null.screen.blit(null.player.images[0], (0, 0)).width == 0
+    pygame.quit()
@@ -0,0 +1,148 @@
+import numpy as np
+
+from purrfect_leap.batch import COIN, BatchEngine
+from purrfect_leap.gamestate import Game
+from purrfect_leap.inputs import InputState
+from purrfect_leap.platform import PLATFORM_KINDS
+from purrfect_leap.powerups import POWERUP_KINDS
+from purrfect_leap.tuning import Tuning
+
+
+def test_batch_matches_scalar_rules():
+    game = Game(headless=True, seed=3)
+    game.start()
+    engine = BatchEngine(2, seed=3)
+    engine.load_game(0, game)
+    engine.load_game(1, game)
+    for tick in range(400):
+        left, right = tick % 90 < 30, 45 <= tick % 90 < 70
+        game.step(InputState(left=left, right=right))
+        engine.step(np.array([left, left]), np.array([right, right]))
+        if game.game_over:
+            break
+        assert (engine.cat_x[0], engine.cat_y[0]) == game.camera.to_screen(game.player.rect).topleft
+        assert engine.vel_y[0] == game.player.vel_y
+        assert engine.scroll_y[0] == game.scroll_y
+    assert engine.done[0] == game.game_over
+    assert engine.cat_y[1] == engine.cat_y[0]
+
+
+def test_batch_reset_and_done():
+    engine = BatchEngine(64, seed=1)
+    for _ in range(2000):
+        done = engine.step()
+        engine.reset(done)
+    assert engine.plat_active.sum(axis=1).min() >= 1
+    assert np.all(engine.cat_y <= engine.height)
+
+
+def test_batch_sweeps_powerups_along_the_path():
+    engine = BatchEngine(1, seed=2)
+    engine.plat_active[:] = False
+    engine.cat_x[0], engine.cat_y[0] = 100, 500
+    engine.vel_y[0] = -120
+    engine.pu_x[0, 0], engine.pu_y[0, 0], engine.pu_kind[0, 0] = 106, 440, COIN
+    engine.pu_active[0, 0] = True
+    engine.step()
+    # The cat rose from 500 to 381, clean past the coin at 440-460.
+    assert not engine.pu_active[0, 0]
+    assert engine.score[0] >= 100
+
+
+def _next_platform_policy():
+    # Steer for the lowest platform above the one the cat last bounced off.
+    floor = None
+
+    def policy(game):
+        nonlocal floor
+        cat = game.player.rect
+        if floor is None or game.player.vel_y in (game.tuning.jump_velocity, game.tuning.spring_velocity):
+            floor = cat.bottom
+        above = [p for p in game.platforms if p.rect.top < floor]
+        if not above:
+            return InputState()
+        target = max(above, key=lambda p: p.rect.top).rect.centerx
+        return InputState(left=target < cat.centerx - 4, right=target > cat.centerx + 4)
+
+    return policy
+
+
+def _climb_side_by_side(game, engine, ticks=600):
+    """Step ``game`` and ``engine`` env 0 together, asserting they agree every tick.
+
+    The batch draws its own x and kind for new platforms and its own spots
+    for new power-ups, so those are overwritten with the scalar game's.
+    Returns how far the game climbed and how many power-ups it evicted.
+    """
+    game.start()
+    policy = _next_platform_policy()
+    # The batch spaces new platforms evenly, so start once the irregular opening chunk is placed.
+    while game._chunk.index == 0:
+        assert game.step(policy(game)) and game.replay.ticks < 2000
+    engine.load_game(0, game)
+    spawned = []
+    spawn = game.powerups.spawn
+    game.powerups.spawn = lambda x, y, kind: spawned.append((x, y, kind)) or spawn(x, y, kind)
+    start = game.scroll_y
+    evicted = 0
+    for _ in range(ticks):
+        seq, pu_seq = engine._next_seq[0], engine._next_pu_seq[0]
+        spawned.clear()
+        controls = policy(game)
+        game.step(controls)
+        engine.step(np.array([controls.left]), np.array([controls.right]))
+        evicted += game.powerups.life.evicted
+        top = game.camera.top
+        by_y = {p.rect.y - top: p for p in game.platforms}
+        for slot in np.flatnonzero(engine.plat_active[0] & (engine.plat_seq[0] >= seq)):
+            p = by_y[engine.plat_y[0, slot]]
+            engine.plat_x[0, slot] = engine.plat_start_x[0, slot] = p.rect.x
+            engine.plat_kind[0, slot] = PLATFORM_KINDS.index(p.kind)
+        new = np.flatnonzero(engine.pu_active[0] & (engine.pu_seq[0] >= pu_seq))
+        new = new[np.argsort(engine.pu_seq[0, new])]
+        assert len(new) == len(spawned)
+        for slot, (x, y, kind) in zip(new, spawned):
+            engine.pu_x[0, slot], engine.pu_y[0, slot] = x, y - top
+            engine.pu_kind[0, slot] = POWERUP_KINDS.index(kind)
+        if game.game_over:
+            break
+        assert (engine.cat_x[0], engine.cat_y[0]) == game.camera.to_screen(game.player.rect).topleft
+        assert engine.vel_y[0] == game.player.vel_y
+        assert (engine.scroll_y[0], engine.score[0]) == (game.scroll_y, game.score)
+        active = np.flatnonzero(engine.plat_active[0])
+        assert sorted(zip(engine.plat_x[0, active], engine.plat_y[0, active])) == sorted(
+            game.camera.to_screen(p.rect).topleft for p in game.platforms
+        )
+        active = np.flatnonzero(engine.pu_active[0])
+        assert sorted(
+            zip(engine.pu_x[0, active], engine.pu_y[0, active], (POWERUP_KINDS[k] for k in engine.pu_kind[0, active]))
+        ) == sorted((p.rect.x, p.rect.y - top, p.kind) for p in game.powerups.powerups)
+    assert engine.done[0] == game.game_over
+    return game.scroll_y - start, evicted
+
+
+def test_batch_matches_scalar_while_climbing(monkeypatch):
+    # Without power-ups, the level differs only in the x and kind of each new platform.
+    monkeypatch.setattr("purrfect_leap.level.POWERUP_CHANCE", 0)
+    monkeypatch.setattr("purrfect_leap.batch.POWERUP_CHANCE", 0)
+    climbed, _ = _climb_side_by_side(Game(headless=True, seed=8), BatchEngine(1, seed=8))
+    assert climbed > 1000
+
+
+def test_batch_matches_scalar_with_custom_tuning(monkeypatch):
+    monkeypatch.setattr("purrfect_leap.level.POWERUP_CHANCE", 0)
+    monkeypatch.setattr("purrfect_leap.batch.POWERUP_CHANCE", 0)
+    tuning = Tuning(gravity=0.5, jump_velocity=-13, vertical_gap=85, kind_weights=(50, 25, 15, 10))
+    game = Game(headless=True, seed=9, tuning=tuning)
+    climbed, _ = _climb_side_by_side(game, BatchEngine(1, seed=9, tuning=tuning))
+    assert climbed > 1000
+
+
+def test_batch_evicts_powerups_like_scalar_at_the_cap(monkeypatch):
+    # A power-up above every platform and room for only four keeps both at the cap.
+    monkeypatch.setattr("purrfect_leap.level.POWERUP_CHANCE", 1)
+    monkeypatch.setattr("purrfect_leap.batch.POWERUP_CHANCE", 1)
+    monkeypatch.setattr("purrfect_leap.powerups.MAX_POWERUPS", 4)
+    climbed, evicted = _climb_side_by_side(Game(headless=True, seed=8), BatchEngine(1, seed=8, powerup_capacity=4))
+    assert climbed > 1000
+    assert evicted > 0
@@ -0,0 +1,18 @@
+from purrfect_leap.bench import PHASES, SCENARIOS, compare, run_scenario
+
+
+def test_scenarios_time_every_phase():
+    for name in SCENARIOS:
+        results = run_scenario(name, frames=10, warmup=2)
+        assert results["frame"]["calls"] == 10
+        if name != "pause_idle":
+            assert set(results) == set(PHASES)
+            assert results["update_world"]["p50_ms"] >= results["_scroll_world"]["p50_ms"]
+
+
+def test_compare_flags_slowdowns_only():
+    baseline = {"climb": {"draw_world": {"p50_ms": 1.0}, "_scroll_world": {"p50_ms": 0.001}}}
+    results = {"climb": {"draw_world": {"p50_ms": 1.2}, "_scroll_world": {"p50_ms": 0.1}}}
+    assert compare(results, baseline, 1.25) == []
+    results["climb"]["draw_world"]["p50_ms"] = 1.5
+    assert compare(results, baseline, 1.25) == ["climb.draw_world: 1.500 ms vs 1.000 ms (1.50x)"]
@@ -0,0 +1,71 @@
+import io
+import wave
+
+import pygame
+import pytest
+
+from purrfect_leap.bundle import BUNDLE_FILE, AssetBundle, bake, pack_atlas, read_header
+
+
+def _make_sources(root):
+    (root / "sprites").mkdir()
+    (root / "sounds").mkdir()
+    for name, size, color in (("a", (40, 40), (255, 0, 0)), ("b", (72, 18), (0, 255, 0))):
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(color)
+        pygame.image.save(surf, str(root / "sprites" / f"{name}.png"))
+    _write_tone(root / "sounds" / "beep.wav", 100)
+
+
+def _write_tone(path, frames):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(44100)
+        f.writeframes(bytes(range(256)) * (frames // 128))
+    path.write_bytes(buffer.getvalue())
+
+
+def test_pack_atlas_keeps_sprites_apart():
+    rects, height = pack_atlas({"a": (200, 10), "b": (100, 20), "c": (50, 5)}, width=256)
+    boxes = [pygame.Rect(r) for r in rects.values()]
+    assert all(box.right <= 256 and box.bottom <= height for box in boxes)
+    assert not any(a.colliderect(b) for i, a in enumerate(boxes) for b in boxes[i + 1 :])
+
+
+def test_bake_is_incremental_and_loads_through_mmap(tmp_path):
+    pygame.display.init()
+    pygame.display.set_mode((10, 10))
+    _make_sources(tmp_path)
+    assert bake(tmp_path)
+    assert not bake(tmp_path)
+
+    atlas = read_header(tmp_path / BUNDLE_FILE)["atlas"]
+    _write_tone(tmp_path / "sounds" / "beep.wav", 200)
+    assert bake(tmp_path)
+    # Only a sound changed, so the atlas bytes were carried over unchanged.
+    assert read_header(tmp_path / BUNDLE_FILE)["atlas"] == atlas
+
+    bundle = AssetBundle(tmp_path / BUNDLE_FILE)
+    sprite = bundle.image("b")
+    assert sprite.get_size() == (72, 18)
+    assert sprite.get_at((5, 5)) == (0, 255, 0, 255)
+    bundle.close()
+    pygame.quit()
+
+
+def test_bundle_sounds_decode(tmp_path):
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        pytest.skip("no audio device")
+    pygame.display.init()
+    pygame.display.set_mode((10, 10))
+    _make_sources(tmp_path)
+    _write_tone(tmp_path / "sounds" / "beep.wav", 200)
+    assert bake(tmp_path)
+    bundle = AssetBundle(tmp_path / BUNDLE_FILE)
+    assert bundle.sound("beep").get_length() > 0
+    bundle.close()
+    pygame.quit()
@@ -0,0 +1,61 @@
+import pygame
+
+from purrfect_leap.collision import landing_time, sweep_overlaps
+from purrfect_leap.gamestate import Game
+from purrfect_leap.platform import place_platform
+
+
+def test_landing_uses_positions_at_the_moment_of_impact():
+    # Feet cross the top halfway through the tick; the platform slides under the cat meanwhile.
+    assert landing_time(400, 480, 100, 100, 100, 0, 440, 440, 72) == 0.5
+    # Over the platform at the end of the tick, but not when the feet got there.
+    assert landing_time(400, 480, 100, 100, 0, 40, 440, 440, 72) is None
+    # One-way: rising through a platform never lands.
+    assert landing_time(480, 400, 100, 100, 80, 80, 440, 440, 72) is None
+
+
+def test_landing_time_does_not_depend_on_step_size():
+    path = (400, 480, 100, 180, 90, 130, 450, 450, 72)
+    whole = landing_time(*path)
+    for steps in (2, 4, 8):
+        points = [
+            [a + (b - a) * i // steps for i in range(steps + 1)]
+            for a, b in zip(path[:-1:2], path[1:-1:2])
+        ]
+        for i in range(steps):
+            t = landing_time(
+                points[0][i], points[0][i + 1], points[1][i], points[1][i + 1],
+                points[2][i], points[2][i + 1], points[3][i], points[3][i + 1], 72,
+            )
+            if t is not None:
+                assert (i + t) / steps == whole
+                break
+        else:
+            raise AssertionError(f"no landing with {steps} steps")
+
+
+def test_sweep_catches_what_the_end_position_misses():
+    coin = pygame.Rect(100, 300, 20, 20)
+    cat = pygame.Rect(96, 240, 32, 32)
+    assert not cat.colliderect(coin)
+    assert sweep_overlaps(cat, 0, -100, coin)
+    assert not sweep_overlaps(cat, 0, -20, coin)
+    # Touching edges only, as with colliderect.
+    assert not sweep_overlaps(pygame.Rect(120, 320, 32, 32), 0, 0, coin)
+
+
+def test_fast_cat_lands_and_collects_without_tunnelling():
+    game = Game(headless=True, seed=1)
+    game.start()
+    game.platform_life.clear()
+    game.powerups.clear()
+    platform = place_platform(100, 500, 72, "normal", headless=True)
+    game.platform_life.spawn(platform, 500)
+    game.powerups.spawn(124, 450, "coin")
+    cat = game.player
+    cat.rect.topleft = (120, 380)
+    cat.vel_y = 100
+    game.step()
+    assert cat.rect.bottom == platform.rect.top
+    assert cat.vel_y == game.tuning.jump_velocity
+    assert len(game.powerups.powerups) == 0
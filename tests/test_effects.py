@@ -0,0 +1,33 @@
+import numpy as np
+import pygame
+
+from purrfect_leap.camera import Camera
+from purrfect_leap.effects import DUST, ParticleSystem
+
+
+def test_particles_expire_and_overflow_gracefully():
+    system = ParticleSystem(capacity=12, seed=0)
+    system.spawn_dust(10, 10)
+    system.update()
+    system.spawn_flame(10, 10)
+    system.spawn_flame(10, 10)
+    assert len(system) == 12 and system.dropped == 3
+    # The oldest dust was recycled first.
+    assert np.all(system.lifetime[: len(system)] >= DUST.lifetime - 1)
+    for _ in range(DUST.lifetime):
+        system.update()
+    assert len(system) == 0
+
+    dropping = ParticleSystem(capacity=7, overflow="drop", seed=0)
+    dropping.spawn_dust(0, 0)
+    dropping.spawn_dust(0, 0)
+    assert len(dropping) == 7 and dropping.dropped == 3
+
+
+def test_particles_draw_in_one_batch():
+    system = ParticleSystem(seed=0)
+    for i in range(200):
+        system.spawn_dust(i * 2, 400)
+    surface = pygame.Surface((480, 800))
+    system.draw(surface, Camera(480, 800))
+    assert surface.get_at((0, 400)) != (0, 0, 0, 255)
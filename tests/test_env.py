@@ -0,0 +1,37 @@
+import numpy as np
+import pygame
+
+from purrfect_leap.audio import NullAudio
+from purrfect_leap.env import ACTIONS, PLATFORM_FEATURES, PLAYER_FEATURES, LeapEnv
+
+
+def test_feature_env_runs_an_episode():
+    env = LeapEnv(k_platforms=4, max_ticks=2000, frame_skip=2)
+    obs = env.reset(seed=5)
+    assert obs.shape == (PLAYER_FEATURES + 4 * PLATFORM_FEATURES,) and obs.dtype == np.float32
+    # The cat starts on the base platform, which is the nearest one and directly below its feet.
+    assert obs[PLAYER_FEATURES] == 1 and obs[PLAYER_FEATURES + 2] == 0
+    total, done = 0.0, False
+    while not done:
+        obs, reward, done, info = env.step(len(ACTIONS) - 1)
+        total += reward
+    assert total == info["score"]
+    assert info["ticks"] <= 2000
+    first = env.reset(seed=5).copy()
+    assert np.array_equal(first, LeapEnv(k_platforms=4).reset(seed=5))
+    env.close()
+
+
+def test_pixel_env_downscales_the_rendered_frame():
+    pygame.mixer.quit()
+    env = LeapEnv(observation="pixels", downscale=4, copy=True)
+    # Pixel episodes are silent and never open the mixer.
+    assert isinstance(env.game.audio, NullAudio) and not pygame.mixer.get_init()
+    obs = env.reset(seed=2)
+    assert obs.shape == (200, 120, 3) and obs.dtype == np.uint8
+    full = pygame.surfarray.array3d(env.game.screen).transpose(1, 0, 2)
+    assert np.array_equal(obs, full[::4, ::4])
+    second, *_ = env.step(0)
+    assert second is not obs
+    env.close()
+    pygame.quit()
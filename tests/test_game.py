@@ -1,27 +1,25 @@
-import os
-import pickle
-
 import pygame
 
 from purrfect_leap import platform
-from purrfect_leap.ui import SAVE_FILE, UI
+from purrfect_leap.level import generate_chunks
+from purrfect_leap.storage import PROFILE_FILE, Storage
+from purrfect_leap.tuning import Tuning
 
 
-def test_generate_platforms():
+def test_opening_chunk_builds_platforms():
     pygame.init()
     pygame.display.set_mode((1, 1))
-    platforms = platform.generate_platforms(800)
+    opening = next(generate_chunks(1, Tuning(), 800))
+    platforms = [platform.place_platform(s.x, s.y, s.width, s.kind) for s in opening.platforms]
     assert len(platforms) > 0
     assert all(isinstance(p, platform.Platform) for p in platforms)
     pygame.quit()
 
 
 def test_score_persistence(tmp_path):
-    os.chdir(tmp_path)
-    pygame.init()
-    pygame.display.set_mode((1, 1))
-    ui = UI()
-    ui.save_best_score(42)
-    assert os.path.exists(SAVE_FILE)
-    assert ui.load_best_score() == 42
+    storage = Storage(tmp_path)
+    storage.save_best_score(42)
+    storage.close()
+    assert (tmp_path / PROFILE_FILE).exists()
+    assert Storage(tmp_path).best_score == 42
 
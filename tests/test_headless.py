@@ -0,0 +1,26 @@
+import pygame
+
+from purrfect_leap.gamestate import Game
+from purrfect_leap.inputs import InputState
+
+
+def test_headless_game_needs_no_display():
+    pygame.quit()
+    game = Game(headless=True)
+    ticks = game.run_headless(5000, policy=lambda g: InputState(left=True))
+    assert ticks > 0
+    assert game.game_over or ticks == 5000
+    assert not pygame.display.get_init()
+    assert game.screen is None and game.ui is None
+
+
+def test_headless_step_stops_after_game_over():
+    game = Game(headless=True)
+    game.start()
+    assert game.step()
+    game.player.rect.top = game.height + 100
+    assert not game.step()
+    assert game.game_over
+    assert not game.step()
+    game.reset()
+    assert not game.game_over and not game.started
@@ -0,0 +1,39 @@
+from itertools import islice
+
+from purrfect_leap.gamestate import Game
+from purrfect_leap.level import CHUNK_PLATFORMS, LOOKAHEAD, LevelStream, generate_chunks
+from purrfect_leap.tuning import Tuning
+
+
+def test_chunks_stack_evenly_above_the_opening():
+    tuning = Tuning(vertical_gap=90)
+    opening, first, second = islice(generate_chunks(7, tuning, 800), 3)
+    assert opening.platforms[0].width == 480 and opening.top > -800
+    ys = [p.y for p in first.platforms + second.platforms]
+    assert len(ys) == 2 * CHUNK_PLATFORMS
+    assert ys[0] == opening.top - 90
+    assert all(a - b == 90 for a, b in zip(ys, ys[1:]))
+    assert all(p.powerup is None or p.powerup.y < p.y for p in first.platforms)
+
+
+def test_worker_stream_matches_plain_generator():
+    plain = list(islice(generate_chunks(3, Tuning(), 800), 6))
+    stream = LevelStream(generate_chunks(3, Tuning(), 800), worker=True, queue_size=2)
+    try:
+        assert [stream.next_chunk() for _ in range(6)] == plain
+    finally:
+        stream.close()
+
+
+def test_game_places_streamed_content_ahead_of_camera():
+    game = Game(headless=True, seed=5, level_worker=True)
+    game.start()
+    for _ in range(600):
+        if game.player.rocket_time == 0:
+            game.player.apply_rocket()
+        game.step()
+    assert game.scroll_y > 3000
+    assert game.platforms.first().rect.top >= game.camera.top - LOOKAHEAD
+    assert len(game.powerups.powerups) > 0
+    assert game._upcoming[0].y < game.camera.top - LOOKAHEAD
+    game.level.close()
@@ -0,0 +1,51 @@
+import pygame
+
+from purrfect_leap.camera import Camera
+from purrfect_leap.gamestate import Game
+from purrfect_leap.inputs import InputState
+from purrfect_leap.lifecycle import Lifecycle
+from purrfect_leap.platform import Platform, place_platform
+from purrfect_leap.pool import Pool
+from purrfect_leap.spatial import SpatialIndex
+from purrfect_leap.tuning import Tuning
+
+
+def test_lifecycle_culls_caps_and_despawns():
+    pool = Pool(Platform.blank)
+    life = Lifecycle(SpatialIndex(), pool, cap=3, height=18)
+    for y in (-300, -10, 400, 900):
+        life.spawn(place_platform(0, y, 72, "normal", headless=True, pool=pool), y)
+    counts = life.counts(Camera(480, 800))
+    # 400 was evicted to make room for 900, the new bottommost.
+    assert (counts.live, counts.active, counts.spawned, counts.evicted) == (3, 1, 4, 1)
+    life.begin_tick()
+    life.despawn_from(300)
+    assert life.counts(Camera(480, 800)) == type(counts)(2, 1, 0, 1, 0)
+    assert len(pool) == 2
+
+
+def test_platforms_above_the_camera_are_frozen():
+    game = Game(headless=True, seed=1, tuning=Tuning(kind_weights=(0, 100, 0, 0)))
+    above = [p for p in game.platforms if p.rect.bottom <= game.camera.top]
+    assert above
+    game.step()
+    assert all(p.phase == 0 for p in above)
+    assert all(p.phase > 0 for p in game.platform_life.active(game.camera) if p.kind == "moving")
+
+
+def test_long_session_stays_bounded():
+    game = Game(seed=6)
+    game.start()
+    peaks = {}
+    for tick in range(6000):
+        if game.player.rocket_time == 0:
+            game.player.apply_rocket()
+        game.update_world(InputState(left=tick % 120 < 60, right=tick % 120 >= 60))
+        for name, counts in game.entity_counts().items():
+            peaks[name] = max(peaks.get(name, 0), counts.live)
+        if tick == 1000:
+            created = game.allocation_stats()
+    assert game.scroll_y > 50_000 and not game.game_over
+    assert peaks["platforms"] < 30 and peaks["powerups"] < 10 and peaks["particles"] < 200
+    assert game.allocation_stats()["platforms"]["created"] == created["platforms"]["created"]
+    pygame.quit()
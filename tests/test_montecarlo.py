@@ -0,0 +1,15 @@
+from purrfect_leap import montecarlo
+from purrfect_leap.tuning import Tuning
+
+
+def test_pool_runs_are_seeded_and_streamed():
+    configs = [Tuning(), Tuning(gravity=0.6, vertical_gap=80)]
+    specs = list(montecarlo.iter_specs(configs, 3, 7, "random", 3000))
+    results = []
+    montecarlo.run_all(specs, workers=2, chunksize=2, on_result=results.append)
+    assert len(results) == 6
+    assert {r.config for r in results} == {0, 1}
+    assert all(r.cause in ("fell", "timeout") for r in results)
+    again = montecarlo.play(specs[0])
+    first = next(r for r in results if (r.config, r.seed) == (0, 7))
+    assert (again.score, again.ticks) == (first.score, first.ticks)
@@ -0,0 +1,91 @@
+import time
+
+import pytest
+
+from purrfect_leap.gamestate import Game
+from purrfect_leap.net import (
+    MAX_STATE_BYTES,
+    CatState,
+    GhostTrack,
+    ProtocolError,
+    RaceClient,
+    RaceServer,
+    StateDecoder,
+    StateEncoder,
+    bandwidth_bound,
+    interpolate,
+)
+
+
+def test_deltas_round_trip_and_stay_small():
+    game = Game(headless=True, seed=5)
+    game.start()
+    encoder, decoder = StateEncoder(), StateDecoder()
+    sizes = []
+    for _ in range(300):
+        game.step()
+        state = CatState.of(game.replay.ticks, game.player)
+        data = encoder.encode(state)
+        assert len(data) <= MAX_STATE_BYTES
+        sizes.append(len(data))
+        assert decoder.decode(data) == (state, len(data))
+        assert abs(state.vel_y - game.player.vel_y) <= 1 / 16
+    # After the first full state, a bouncing cat costs a handful of bytes a tick.
+    assert max(sizes[1:]) <= 6
+    assert encoder.encode(state) is None
+
+
+def test_truncated_state_is_rejected():
+    data = StateEncoder().encode(CatState(1000, -300, 900, -96, 180))
+    with pytest.raises(ProtocolError):
+        StateDecoder().decode(data[:-1])
+
+
+def test_ghost_track_interpolates_and_resets_on_a_new_run():
+    track = GhostTrack()
+    track.add(CatState(0, 0, 100, 0, 0), now=0.0)
+    track.add(CatState(6, 30, 40, 0, 0), now=0.1)
+    assert interpolate(list(track.samples), track.received_at, 0.1, delay_ticks=3) == (15, 70, 0)
+    track.add(CatState(1, 200, 700, 0, 0), now=0.2)
+    assert list(track.samples) == [CatState(1, 200, 700, 0, 0)]
+
+
+def test_localhost_race(tmp_path):
+    server = RaceServer(seed=99, tick_rate=30)
+    port = server.start_thread()
+    clients = [RaceClient("127.0.0.1", port).connect() for _ in range(2)]
+    try:
+        games = [Game(headless=True, race=client) for client in clients]
+        assert [game.seed for game in games] == [99, 99]
+        for game in games:
+            game.start()
+        for _ in range(30):
+            for game in games:
+                start = time.perf_counter()
+                game.step()
+                assert time.perf_counter() - start < 0.05
+            time.sleep(1 / 60)
+        time.sleep(0.3)
+
+        ghosts = clients[0].ghosts()
+        assert list(ghosts) == [clients[1].player]
+        x, y, _ = ghosts[clients[1].player]
+        assert x == games[1].player.rect.x
+        assert abs(y - games[1].player.rect.y) < 200
+        for client in clients:
+            sent, received = client.bandwidth()
+            assert received <= bandwidth_bound(30, 2)
+            assert sent <= bandwidth_bound(30, 2)
+    finally:
+        for client in clients:
+            client.close()
+        server.stop_thread()
+
+
+def test_client_closes_after_the_server_goes_away():
+    server = RaceServer(seed=3, tick_rate=30)
+    client = RaceClient("127.0.0.1", server.start_thread()).connect()
+    server.stop_thread()
+    client._thread.join(timeout=5)
+    client.close()
+    client.close()
@@ -0,0 +1,21 @@
+from purrfect_leap.gamestate import Game
+from purrfect_leap.inputs import InputState
+from purrfect_leap.platform import Platform
+
+
+def test_long_session_recycles_entities():
+    def rocket(game):
+        # Power-ups are streamed with the level, so keep climbing to meet them.
+        if game.player.rocket_time == 0:
+            game.player.apply_rocket()
+        return InputState(right=game.player.rect.x < 200)
+
+    game = Game(headless=True, seed=4)
+    for seed in range(20):
+        game.run_headless(1500, policy=rocket)
+        game.reset(seed)
+    stats = game.allocation_stats()
+    assert stats["platforms"]["reused"] > 10 * stats["platforms"]["created"]
+    assert stats["powerups"]["created"] < stats["powerups"]["reused"]
+    assert not hasattr(next(iter(game.platforms)), "__dict__")
+    assert Platform.__slots__
@@ -0,0 +1,51 @@
+import csv
+import json
+
+import pygame
+
+from purrfect_leap.gamestate import Game
+from purrfect_leap.profiler import PHASES, FrameProfiler
+
+
+def test_ring_buffer_keeps_latest_frames_in_order():
+    profiler = FrameProfiler(capacity=4)
+    for frame in range(6):
+        profiler.begin_frame()
+        profiler._current[0] = frame
+        profiler.end_frame()
+    assert len(profiler) == 4
+    assert profiler.frame_times().tolist() == [2, 3, 4, 5]
+    assert profiler.percentiles()["p50"] == 3.5
+
+
+def test_game_phases_are_timed_and_exported(tmp_path):
+    game = Game(headless=True, seed=2, profile=True)
+    game.start()
+    for _ in range(50):
+        game.profiler.begin_frame()
+        game.step()
+        game.profiler.end_frame()
+    history = game.profiler.history()
+    assert history.shape == (50, len(PHASES))
+    for phase in ("update", "collisions", "powerups", "scroll"):
+        assert history[:, PHASES.index(phase)].sum() > 0
+
+    game.profiler.export(tmp_path / "frames.json")
+    data = json.loads((tmp_path / "frames.json").read_text())
+    assert len(data["frames"]) == 50 and set(data["percentiles"]) == {"p50", "p95", "p99"}
+    game.profiler.export(tmp_path / "frames.csv")
+    with open(tmp_path / "frames.csv", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == list(PHASES) and len(rows) == 51
+
+
+def test_overlay_draws_only_when_visible():
+    game = Game(profile=True)
+    surface = pygame.Surface((game.width, game.height))
+    surface.fill((0, 0, 255))
+    game.profiler_overlay.draw(surface)
+    assert surface.get_at((game.width - 1, 0)) == (0, 0, 255)
+    game.profiler_overlay.toggle()
+    game.profiler_overlay.draw(surface)
+    assert surface.get_at((game.width - 1, 0)) != (0, 0, 255)
+    pygame.quit()
@@ -0,0 +1,33 @@
+import pygame
+
+from purrfect_leap.gamestate import Game, PausedState, PlayingState
+from purrfect_leap.inputs import InputState
+
+
+def _play(dirty_rects):
+    game = Game(dirty_rects=dirty_rects)
+    game.change_state(PlayingState(game))
+    game.reset(11)
+    game.start()
+    rects = []
+    for tick in range(300):
+        game.update_world(InputState(right=tick % 60 < 20))
+        game.state.draw(game.screen)
+        if dirty_rects:
+            rects = game.screen.end_frame()
+    return game, pygame.display.get_surface().copy(), rects
+
+
+def test_dirty_rects_match_full_redraw():
+    _, full, _ = _play(False)
+    game, dirty, rects = _play(True)
+    assert pygame.image.tobytes(full, "RGB") == pygame.image.tobytes(dirty, "RGB")
+    assert sum(r.width * r.height for r in rects) < game.width * game.height // 2
+
+    game.previous_state = game.state
+    game.change_state(PausedState(game))
+    game.state.draw(game.screen)
+    assert game.screen.end_frame() == [game.screen.get_rect()]
+    game.state.draw(game.screen)
+    assert game.screen.end_frame() == []
+    pygame.quit()
@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from purrfect_leap.gamestate import Game
+from purrfect_leap.inputs import InputState
+from purrfect_leap.replay import Replay, ReplayError, ReplayPlayer
+
+
+def zigzag(game):
+    tick = game.replay.ticks
+    return InputState(left=tick % 90 < 30, right=45 <= tick % 90 < 70)
+
+
+def play_recorded(seed):
+    game = Game(headless=True, seed=seed)
+    game.start()
+    game.run_headless(3000, policy=zigzag)
+    return game
+
+
+def test_same_seed_same_level():
+    random.seed(0)
+    a = Game(headless=True, seed=11)
+    random.seed(1)
+    b = Game(headless=True, seed=11)
+    assert [p.rect.topleft for p in a.platforms] == [p.rect.topleft for p in b.platforms]
+    a.reset(12)
+    assert [p.rect.topleft for p in a.platforms] != [p.rect.topleft for p in b.platforms]
+
+
+def test_replay_round_trip_and_reproduction():
+    game = play_recorded(5)
+    replay = Replay.from_bytes(game.replay.to_bytes())
+    assert replay == game.replay
+    assert len(replay.to_bytes()) < replay.ticks
+    replayed = ReplayPlayer(replay).play()
+    assert replayed.score == game.score
+    assert replayed.player.rect == game.player.rect
+    assert replayed.game_over == game.game_over
+
+
+def test_seek_backwards_matches_forward_run():
+    replay = play_recorded(8).replay
+    player = ReplayPlayer(replay)
+    halfway = replay.ticks // 2
+    rect = player.seek(halfway).player.rect.copy()
+    player.seek(replay.ticks)
+    assert player.seek(halfway).player.rect == rect
+
+
+def test_rejects_bad_data():
+    with pytest.raises(ReplayError):
+        Replay.from_bytes(b"nope")
+    data = Replay(1, runs=[[300, 1]]).to_bytes()
+    with pytest.raises(ReplayError):
+        Replay.from_bytes(data[:-1])
+
+
+def test_rejects_replays_from_an_older_simulation():
+    data = bytearray(Replay(1, runs=[[300, 1]]).to_bytes())
+    # Version 1 replays were recorded before chunked level generation.
+    data[4] = 1
+    with pytest.raises(ReplayError, match="version"):
+        Replay.from_bytes(bytes(data))
+
+
+def test_history_is_shared_and_rewinds_across_timelines():
+    rng = random.Random(4)
+    replay = Replay(1)
+    for _ in range(3000):
+        replay.record(rng.randrange(3))
+    early = replay.history()
+    at_early = (list(replay.runs), replay.ticks)
+    for _ in range(2000):
+        replay.record(rng.randrange(3))
+    late = replay.history()
+    at_late = (list(replay.runs), replay.ticks)
+    # Finished blocks are shared rather than copied again.
+    assert all(a is b for a, b in zip(early[:-1], late))
+
+    runs = replay.runs
+    replay.rewind(early)
+    assert replay.runs is runs
+    assert (replay.runs, replay.ticks) == at_early
+    for _ in range(500):
+        replay.record(rng.randrange(3))
+    # The later snapshot's timeline was overwritten, but its history still holds.
+    replay.rewind(late)
+    assert (replay.runs, replay.ticks) == at_late
+    other = Replay(1)
+    other.rewind(early)
+    assert (other.runs, other.ticks) == at_early
@@ -0,0 +1,64 @@
+import copy
+import pickle
+
+import pygame
+
+from purrfect_leap.gamestate import Game
+from purrfect_leap.inputs import InputState
+
+
+def rocket_then_zigzag(game):
+    tick = game.replay.ticks
+    # Boost for a while so the level streams in new chunks after the snapshot.
+    if tick < 900 and game.player.rocket_time == 0:
+        game.player.apply_rocket()
+    return InputState(left=tick % 90 < 30, right=45 <= tick % 90 < 70)
+
+
+def fingerprint(game):
+    return (
+        game.player.get_state(),
+        [p.get_state() for p in game.platforms],
+        [(p.rect.topleft, p.kind) for p in game.powerups.powerups],
+        game.camera.top,
+        game.score,
+        game.game_over,
+        game.replay,
+    )
+
+
+def test_restore_replays_the_same_future():
+    game = Game(headless=True, seed=21)
+    game.start()
+    game.run_headless(400, policy=rocket_then_zigzag)
+    snap = game.snapshot()
+    game.run_headless(1500, policy=rocket_then_zigzag)
+    expected = fingerprint(game)
+    assert game.snapshot().chunk.index > snap.chunk.index
+
+    game.restore(snap)
+    game.run_headless(1500, policy=rocket_then_zigzag)
+    assert fingerprint(game) == expected
+
+    # A fresh game, e.g. a search worker, continues identically from a copy.
+    other = Game(headless=True, seed=99)
+    other.restore(pickle.loads(pickle.dumps(copy.deepcopy(snap))))
+    other.run_headless(1500, policy=rocket_then_zigzag)
+    assert fingerprint(other) == expected
+
+
+def test_snapshot_holds_no_surfaces():
+    game = Game(seed=4)
+    snap = game.snapshot()
+
+    def walk(value):
+        assert not isinstance(value, pygame.Surface)
+        if isinstance(value, tuple):
+            for item in value:
+                walk(item)
+
+    for name in snap.__slots__:
+        walk(getattr(snap, name))
+    game.restore(snap)
+    assert all(p.image is not None for p in game.platforms)
+    pygame.quit()
@@ -0,0 +1,25 @@
+from purrfect_leap.spatial import SpatialIndex
+
+
+def test_spatial_index_queries_stay_sorted():
+    index = SpatialIndex()
+    items = [object() for _ in range(6)]
+    for item, key in zip(items, [50, -20, 300, 120, 120, 700]):
+        index.add(item, key)
+    assert index.first() is items[1]
+    assert index.between(100, 300) == [items[3], items[4], items[2]]
+    index.move(items[3], -50)
+    assert index.first() is items[3]
+    index.remove(items[4])
+    assert items[4] not in index
+    assert index.pop_from(300) == [items[2], items[5]]
+    assert list(index) == [items[3], items[1], items[0]]
+
+
+def test_nearest_walks_outwards_from_the_key():
+    index = SpatialIndex()
+    items = [object() for _ in range(4)]
+    for item, key in zip(items, [0, 100, 180, 400]):
+        index.add(item, key)
+    assert index.nearest(150, 3) == [items[2], items[1], items[0]]
+    assert index.nearest(1000, 10) == [items[3], items[2], items[1], items[0]]
@@ -0,0 +1,11 @@
+from purrfect_leap.startup import measure, over_budget
+
+
+def test_startup_within_budget(tmp_path):
+    timings = measure(str(tmp_path))
+    assert timings["first_frame_ms"] >= timings["import_ms"] > 0
+    assert over_budget(timings) == []
+
+
+def test_over_budget_reports_each_timing():
+    assert len(over_budget({"import_ms": 1e6, "first_frame_ms": 1e6})) == 2
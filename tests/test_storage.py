@@ -0,0 +1,55 @@
+import os
+import pickle
+import threading
+
+from purrfect_leap.storage import LEGACY_SAVE_FILE, PROFILE_FILE, RUNS_FILE, RunRecord, Storage
+
+
+def test_run_history_indexes_and_survives_torn_writes(tmp_path):
+    storage = Storage(tmp_path)
+    for i, score in enumerate([300, 900, 100, 900, 500]):
+        storage.record_run(RunRecord(score, height=score, duration=i, seed=i))
+    assert [r.seed for r in storage.top(3)] == [1, 3, 4]
+    assert [r.seed for r in storage.recent(2)] == [4, 3]
+    storage.close()
+
+    with open(tmp_path / RUNS_FILE, "a") as f:
+        f.write('{"version": 1, "score": 7')
+    reloaded = Storage(tmp_path)
+    assert len(reloaded.runs) == 5
+    assert reloaded.top(1)[0].score == 900
+
+
+def test_best_score_only_rises_and_writes_atomically(tmp_path):
+    storage = Storage(tmp_path / "nested")
+    storage.save_best_score(50)
+    storage.save_best_score(20)
+    storage.flush()
+    assert storage.best_score == 50
+    assert sorted(os.listdir(tmp_path / "nested")) == [PROFILE_FILE]
+    storage.close()
+
+
+def test_legacy_save_is_read_without_unpickling_objects(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / LEGACY_SAVE_FILE).write_bytes(pickle.dumps(77))
+    assert Storage(tmp_path / "a").best_score == 77
+    (tmp_path / LEGACY_SAVE_FILE).write_bytes(pickle.dumps(RunRecord(1, 1, 1.0, 1)))
+    assert Storage(tmp_path / "b").best_score == 0
+
+
+def test_history_is_read_off_the_startup_path(tmp_path, monkeypatch):
+    storage = Storage(tmp_path)
+    storage.save_best_score(40)
+    storage.record_run(RunRecord(40, height=40, duration=1.0, seed=2))
+    storage.close()
+
+    release = threading.Event()
+    load = Storage._load_history
+    monkeypatch.setattr(Storage, "_load_history", lambda self: (release.wait(), load(self)))
+    # Construction returns while the history is still unread.
+    reloaded = Storage(tmp_path)
+    assert reloaded.best_score == 40
+    release.set()
+    assert reloaded.top(1)[0].seed == 2
+    reloaded.close()
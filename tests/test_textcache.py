@@ -0,0 +1,26 @@
+import pygame
+
+from purrfect_leap.textcache import DigitAtlas, TextCache
+
+
+def test_text_cache_hits_and_evicts_least_recent():
+    pygame.init()
+    font = pygame.font.Font(None, 24)
+    cache = TextCache(capacity=2)
+    first = cache.render(font, "a", (0, 0, 0))
+    cache.render(font, "b", (0, 0, 0))
+    assert cache.render(font, "a", (0, 0, 0)) is first
+    cache.render(font, "c", (0, 0, 0))
+    assert len(cache) == 2
+    assert cache.render(font, "a", (0, 0, 0)) is first
+    assert (cache.hits, cache.misses) == (2, 3)
+    cache.render(font, "b", (0, 0, 0))
+    assert cache.misses == 4
+
+
+def test_digit_atlas_matches_font_width():
+    pygame.init()
+    font = pygame.font.Font(None, 36)
+    atlas = DigitAtlas(font, (0, 0, 0))
+    assert atlas.render(1234).get_width() == sum(font.size(c)[0] for c in "1234")
+    assert atlas.render(-5).get_height() == atlas.height
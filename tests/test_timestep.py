@@ -0,0 +1,50 @@
+import pytest
+
+from purrfect_leap.camera import Camera
+from purrfect_leap.gamestate import MAX_CATCH_UP_STEPS, SIM_STEP, Game, GameState
+from purrfect_leap.inputs import InputState
+
+
+class Scripted(GameState):
+    def __init__(self, game):
+        super().__init__(game)
+        self.tick = 0
+
+    def update(self):
+        self.game.update_world(InputState(left=self.tick % 80 < 40, right=self.tick % 80 >= 40))
+        self.tick += 1
+
+
+def _world(game):
+    return game.player.rect.topleft, game.player.vel_y, game.score, [p.rect.topleft for p in game.platforms]
+
+
+@pytest.mark.parametrize("hz", [30, 60, 144])
+def test_render_rate_does_not_change_gameplay(hz):
+    game = Game(headless=True, seed=6)
+    game.state = Scripted(game)
+    game.start()
+    steps = sum(game.advance(1 / hz) for _ in range(3 * hz))
+    assert abs(steps - 180) <= 1
+
+    reference = Game(headless=True, seed=6)
+    reference.state = Scripted(reference)
+    reference.start()
+    for _ in range(steps):
+        reference.state.update()
+    assert _world(game) == _world(reference)
+
+
+def test_catch_up_is_capped_and_alpha_tracks_remainder():
+    game = Game(headless=True, seed=1)
+    game.state = Scripted(game)
+    assert game.advance(1.0) == MAX_CATCH_UP_STEPS
+    assert game.advance(0) == 0 and game.render_alpha < 1
+    game.advance(SIM_STEP - game._accumulator + SIM_STEP / 4)
+    assert game.render_alpha == pytest.approx(0.25)
+
+
+def test_camera_lerp():
+    camera = Camera(480, 800, top=-100)
+    assert camera.lerp(-80, 1.0) is camera
+    assert camera.lerp(-80, 0.5).top == -90